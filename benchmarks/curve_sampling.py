@@ -0,0 +1,87 @@
+"""Cost and accuracy of the F_e vs r graph: axes.plot against plot_adaptive.
+
+Builds the axes of create_graph_for_distance and reports, for each way of
+plotting 1/r**2, the creation time, the number of anchor points and the largest
+on-screen distance from a densely sampled reference curve.
+
+    python benchmarks/curve_sampling.py
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def distance_graph_axes():
+    from manim import Axes, LIGHT_GRAY, PI, UR
+
+    x_min, x_max = 0.55, 4.0
+    y_max = 1.2 * np.tan(PI * 0.48) * 1.2
+    return Axes(
+        x_range=[x_min, x_max, (x_max - x_min) / 5], y_range=[0, y_max, y_max / 4],
+        x_length=4.0, y_length=2.5, axis_config={"color": LIGHT_GRAY}, tips=False,
+    ).to_corner(UR, buff=0.3).scale(0.7)
+
+
+def max_deviation(graph, reference):
+    # Largest distance from a reference point to the graph's sampled curve (on screen)
+    samples = np.array([graph.point_from_proportion(a) for a in np.linspace(0, 1, 2000)])
+    return np.sqrt(((reference[:, None, :2] - samples[None, :, :2]) ** 2).sum(-1).min(axis=1)).max()
+
+
+def timed(func, repeats):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def bench_curve_sampling(repeats=5, k_base=1.2 * np.tan(np.pi / 6) * 4.0):
+    import curve_sampling
+    from curve_sampling import inverse_square, plot_adaptive
+
+    axes = distance_graph_axes()
+    x_range = axes.x_range[:2]
+    reference_x = np.linspace(*x_range, 4000)
+    reference = np.array([axes.c2p(x, inverse_square(x, k_base)) for x in reference_x])
+
+    def uniform():
+        return axes.plot(lambda x: k_base / max(0.01, x ** 2), x_range=list(x_range), use_smoothing=True)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def adaptive_cold():
+            curve_sampling._memory_cache.clear()
+            for stale in Path(cache_dir).glob("*.npy"): stale.unlink()
+            return plot_adaptive(axes, inverse_square, x_range, params=(k_base,), cache_dir=cache_dir)
+
+        def adaptive_warm():
+            return plot_adaptive(axes, inverse_square, x_range, params=(k_base,), cache_dir=cache_dir)
+
+        results = {}
+        for name, func in (("axes.plot", uniform), ("adaptive (cold)", adaptive_cold), ("adaptive (warm)", adaptive_warm)):
+            seconds, graph = timed(func, repeats)
+            results[name] = {"seconds": seconds, "anchors": len(graph.get_anchors()) // 2 + 1,
+                             "max_deviation": max_deviation(graph, reference)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for name, result in bench_curve_sampling(args.repeats).items():
+        print(f"{name:<16} {result['seconds'] * 1e3:8.2f} ms  {result['anchors']:4d} anchors  "
+              f"max deviation {result['max_deviation']:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
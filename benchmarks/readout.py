@@ -0,0 +1,59 @@
+"""Per-frame cost of GlyphReadout against DecimalNumber.
+
+Replays the values the r readout shows while q2 sweeps in the distance demo.
+
+    python benchmarks/readout.py --frames 600
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def readout_values(n_frames):
+    # Smooth sweep out and back, as the distance demo drives r
+    t = np.linspace(0, 1, n_frames)
+    return 1.35 + 2.2 * np.sin(np.pi * t) ** 2
+
+
+def time_set_value(readout, values, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for value in values: readout.set_value(value)
+        best = min(best, time.perf_counter() - started)
+    return best / len(values)
+
+
+def bench_readouts(n_frames=600, repeats=3):
+    from manim import DecimalNumber
+    from fast_readout import GlyphReadout
+
+    values = readout_values(n_frames)
+    glyph_readout = GlyphReadout(values[0], num_decimal_places=2, font_size=28)
+    glyph_readout.prebuild()
+    return {
+        "DecimalNumber": time_set_value(DecimalNumber(values[0], num_decimal_places=2, font_size=28), values, repeats),
+        "GlyphReadout": time_set_value(glyph_readout, values, repeats),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = bench_readouts(args.frames, args.repeats)
+    for name, per_frame in results.items():
+        print(f"{name:<14} {per_frame * 1e6:9.1f} us/frame")
+    print(f"speedup        {results['DecimalNumber'] / results['GlyphReadout']:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+"""Benchmark suite for the CoulombPendulum hot paths, with regression thresholds.
+
+Each case is timed (best of ``--repeats``) and compared against a stored
+baseline; the run fails when a case is slower than its baseline by more than
+the threshold percentage. Baselines are machine specific, so none are
+committed: record them on the machine that runs the comparison. A case
+without a baseline fails the run, so a comparison can never pass by default.
+
+    python benchmarks/suite.py --save                  # record benchmarks/baselines.json
+    python benchmarks/suite.py --threshold 10          # compare, exit 1 on regressions
+    python benchmarks/suite.py --cases physics_quasi_static tex_warm --case-threshold tex_warm=25
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+FRAME_RATE = 15 # low quality
+TEX_ENTRIES = 8
+
+
+def distance_demo_physics():
+    # The distance demo's inputs as setup_demo_environment derives them from the default parameters
+    from headless_timeline import demo_geometry
+    from scene_parameters import resolve_parameters
+
+    params = resolve_parameters()
+    geometry = demo_geometry(params)
+    return {
+        "params": params, "geometry": geometry, "q2": geometry["q2"], "r_eq": geometry["r_eq"], "steps": geometry["distance_steps"],
+        "physics": dict(q2_y=geometry["q2"][1], pivot=geometry["pivot"], length=params["pendulum_length"],
+                        force_scale=params["force_scale"], k_base=geometry["k_base"], theta_start=params["theta_equilibrium"]),
+    }
+
+
+def case_physics_quasi_static():
+    # setup_bob_and_Fe_physics_updater (quasi-static) plus one physics_updater_func_local lookup per frame
+    from pendulum_physics import PendulumTrajectory, tracker_schedule
+
+    demo = distance_demo_physics()
+    _, tracker_values = tracker_schedule(demo["q2"][0], demo["steps"], FRAME_RATE)
+
+    def run():
+        trajectory = PendulumTrajectory.from_schedule(demo["q2"][0], demo["steps"], FRAME_RATE, **demo["physics"])
+        for value in tracker_values: trajectory.state_at(value)
+    return run
+
+
+def case_physics_dynamic():
+    from pendulum_physics import DynamicPendulumTrajectory
+
+    demo = distance_demo_physics()
+    params = demo["params"]
+
+    def run():
+        trajectory = DynamicPendulumTrajectory.from_schedule(demo["q2"][0], demo["steps"], FRAME_RATE,
+                                                             gravity=params["gravity"], damping=params["damping"], **demo["physics"])
+        for t in trajectory.time: trajectory.state_at_time(t)
+    return run
+
+
+def case_charge_product_updater():
+    # CoulombPendulum.setup_charge_product_physics (plus-sign bindings and the F_e driver), driven
+    # through charge_product_steps; the method runs on a stand-in with just the attributes it reads
+    from types import SimpleNamespace
+
+    from manim import Circle, MathTex, ValueTracker
+    from coulomb import CoulombPendulum
+    from pendulum_physics import tracker_schedule
+    from scene_state import PendulumSceneState
+
+    demo = distance_demo_physics()
+    params, physics = demo["params"], demo["physics"]
+    _, factors = tracker_schedule(1.0, params["charge_product_steps"], FRAME_RATE)
+    bob, q2 = Circle(radius=params["bob_radius"]), Circle(radius=params["fixed_charge_radius"]).move_to(demo["q2"])
+    plus_q1, plus_q2 = MathTex("+", font_size=20), MathTex("+", font_size=20)
+    tracker = ValueTracker(1.0)
+    state = PendulumSceneState(bob, q2)
+    state.charge_factor_tracker = tracker
+    CoulombPendulum.setup_charge_product_physics(SimpleNamespace(
+        pendulum_state=state, plus_sign_q1=plus_q1, plus_sign_q2=plus_q2,
+        original_plus_q1_height=plus_q1.height, original_plus_q2_height=plus_q2.height,
+        demo_geometry=demo["geometry"], K_COULOMB_SCALED_BASE=physics["k_base"], r_at_theta_eq=demo["r_eq"],
+    ))
+
+    def run():
+        for factor in factors:
+            tracker.set_value(factor)
+            state.refresh()
+    return run
+
+
+def readout_case(kind):
+    def make():
+        from benchmarks.readout import readout_values
+
+        from manim import DecimalNumber
+        from fast_readout import GlyphReadout
+
+        values = readout_values(FRAME_RATE * 13)
+        if kind == "DecimalNumber":
+            readout = DecimalNumber(values[0], num_decimal_places=2, font_size=28)
+        else:
+            readout = GlyphReadout(values[0], num_decimal_places=2, font_size=28)
+            readout.prebuild()
+
+        def run():
+            for value in values: readout.set_value(value)
+        return run
+    return make
+
+
+def case_distance_graph():
+    # The plot of create_graph_for_distance, geometry cache cold
+    import curve_sampling
+    from benchmarks.curve_sampling import distance_graph_axes
+    from curve_sampling import inverse_square, plot_adaptive
+
+    axes = distance_graph_axes()
+    k_base = distance_demo_physics()["physics"]["k_base"]
+    cache_dir = tempfile.mkdtemp(prefix="curve-bench-")
+
+    def run():
+        curve_sampling._memory_cache.clear()
+        for stale in Path(cache_dir).glob("*.npy"): stale.unlink()
+        plot_adaptive(axes, inverse_square, axes.x_range[:2], params=(k_base,), cache_dir=cache_dir)
+    return run
+
+
+def tex_case(warm):
+    def make():
+        import coulomb
+        from tex_cache import collect_tex_strings, precompile
+
+        entries = collect_tex_strings(coulomb.__file__, include_number_glyphs=False)[:TEX_ENTRIES]
+        warm_dir = tempfile.mkdtemp(prefix="tex-bench-")
+        if warm: precompile(entries, warm_dir, workers=1)
+
+        def run():
+            if warm: precompile(entries, warm_dir, workers=1)
+            else:
+                with tempfile.TemporaryDirectory(prefix="tex-bench-") as cold_dir: precompile(entries, cold_dir, workers=1)
+        return run
+    return make
+
+
+def case_render_low():
+    from parallel_render import render_scene
+
+    def run():
+        with tempfile.TemporaryDirectory(prefix="render-bench-") as media_dir:
+            render_scene({"use_stage_cache": False, "precompile_tex": False}, {"quality": "low_quality", "media_dir": media_dir})
+    return run
+
+
+CASES = {
+    "physics_quasi_static": case_physics_quasi_static,
+    "physics_dynamic": case_physics_dynamic,
+    "charge_product_updater": case_charge_product_updater,
+    "readout_DecimalNumber": readout_case("DecimalNumber"),
+    "readout_GlyphReadout": readout_case("GlyphReadout"),
+    "distance_graph": case_distance_graph,
+    "tex_cold": tex_case(warm=False),
+    "tex_warm": tex_case(warm=True),
+    "render_low": case_render_low,
+}
+# Cases that take seconds each; run once unless --repeats says otherwise
+SLOW_CASES = {"tex_cold", "render_low"}
+
+
+def time_case(name, repeats):
+    run = CASES[name]()
+    run() # warm-up: imports, glyph atlases, first allocations
+    best = float("inf")
+    for _ in range(1 if name in SLOW_CASES and repeats is None else (repeats or 5)):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def compare(results, baselines, threshold, case_thresholds):
+    """Rows of ``(case, seconds, baseline, change_percent, failed)``; a case without a baseline fails."""
+    rows = []
+    for name, seconds in results.items():
+        baseline = baselines.get(name)
+        change = None if baseline is None else 100 * (seconds - baseline) / baseline
+        limit = case_thresholds.get(name, threshold)
+        rows.append((name, seconds, baseline, change, change is None or change > limit))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="*", choices=CASES, default=None)
+    parser.add_argument("--skip", nargs="*", choices=CASES, default=(), help="e.g. --skip render_low tex_cold")
+    parser.add_argument("--repeats", type=int, default=None)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument("--case-threshold", action="append", default=[], metavar="CASE=PERCENT")
+    parser.add_argument("--save", action="store_true", help="store these timings as the new baseline")
+    args = parser.parse_args(argv)
+
+    case_thresholds = {}
+    for item in args.case_threshold:
+        name, _, percent = item.partition("=")
+        if name not in CASES: parser.error(f"unknown case {name!r}")
+        case_thresholds[name] = float(percent)
+
+    names = [name for name in (args.cases or CASES) if name not in args.skip]
+    results = {}
+    for name in names:
+        results[name] = time_case(name, args.repeats)
+        print(f"  {name:<24} {results[name] * 1e3:10.2f} ms")
+
+    if args.save:
+        stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        stored.update({"cases": {**stored.get("cases", {}), **results},
+                       "machine": {"python": platform.python_version(), "platform": platform.platform()}})
+        args.baseline.write_text(json.dumps(stored, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baselines = json.loads(args.baseline.read_text()).get("cases", {}) if args.baseline.exists() else {}
+    failures = 0
+    print(f"\n{'case':<24} {'ms':>10} {'baseline':>10} {'change':>8}")
+    for name, seconds, baseline, change, failed in compare(results, baselines, args.threshold, case_thresholds):
+        baseline_text = "-" if baseline is None else f"{baseline * 1e3:.2f}"
+        change_text = "-" if change is None else f"{change:+.1f}%"
+        verdict = ("  NO BASELINE" if baseline is None else "  REGRESSION") if failed else ""
+        print(f"{name:<24} {seconds * 1e3:10.2f} {baseline_text:>10} {change_text:>8}{verdict}")
+        failures += failed
+    if len(baselines) < len(results): print(f"Cases without a baseline in {args.baseline} fail; record them with --save")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
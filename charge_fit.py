@@ -0,0 +1,254 @@
+"""Estimate the charge product from measured pendulum deflections, with Monte Carlo uncertainties.
+
+The model is the quasi-static equilibrium of ``setup_bob_and_Fe_physics_updater``:
+``tan(theta) = F_e / W`` with ``F_e = k * q1q2 / r**2`` and ``W`` the bob's
+weight (``force_scale`` in the scene, whose ``K_COULOMB_SCALED_BASE`` is ``k``
+for ``q1q2 = 1``). ``r`` is either the measured bob-q2 separation or, with
+``r_kind="rest"``, the horizontal distance from q2 to the bob's rest position
+(what a ruler on the bench gives); the separation then follows from the
+pendulum length and the deflection, and the length can be fitted too.
+``q1q2`` and the mass enter the equilibrium only as ``q1q2 / m``, so one of them
+is fitted with the other held at its given value.
+
+Every group of a dataset (one pendulum per lab group) is fitted at once:
+Levenberg-Marquardt on the angle residuals, with the per-group normal equations summed
+by ``np.bincount``. Monte Carlo experiments are more groups of the same batch.
+
+    python charge_fit.py class.csv --mass 0.002 --length 0.4 --r-kind rest --fit q length --experiments 2000
+    python charge_fit.py scene_measurements.csv --scene   # scene units, q1q2 as a multiple of the scene's
+"""
+import argparse
+import csv
+import time
+
+import numpy as np
+
+K_COULOMB = 8.99e9 # N m^2 / C^2
+GRAVITY = 9.81
+FITTED = {"q", "mass", "length"}
+
+
+def separation(r, theta, length, r_kind="separation"):
+    """Bob-q2 distance and its derivative with respect to the pendulum length."""
+    if r_kind == "separation": return r, np.zeros_like(r)
+    return _rest_separation(r, np.sin(theta), 1 - np.cos(theta), length)
+
+
+def _rest_separation(r, sin, versin, length):
+    # q2 level with the bob's rest position, the bob pushed away from it by the deflection
+    dx, dy = r + length * sin, length * versin
+    distance = np.hypot(dx, dy)
+    return distance, (dx * sin + dy * versin) / distance
+
+
+def simulate_angles(r, strength, length=0.0, r_kind="separation", iterations=60):
+    """Equilibrium deflections for ``tan(theta) = strength / separation**2``, ``strength = k q1q2 / W``.
+
+    With ``r_kind="rest"`` the deflection moves the bob away from q2, so
+    ``theta - arctan(strength / separation**2)`` increases with ``theta`` and its
+    root lies in ``[0, arctan(strength / r**2)]``: bisected there (repulsion, as in the scene).
+    """
+    r = np.asarray(r, dtype=float)
+    strength, length = np.broadcast_arrays(np.asarray(strength, dtype=float), np.asarray(length, dtype=float))
+    if r_kind == "separation": return np.arctan(strength / r**2)
+    low, high = np.zeros(np.broadcast(r, strength).shape), np.arctan(np.abs(strength) / r**2)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        above = middle - np.arctan(np.abs(strength) / separation(r, middle, length, r_kind)[0]**2) > 0
+        low, high = np.where(above, low, middle), np.where(above, middle, high)
+    return np.sign(strength) * (low + high) / 2
+
+
+def fit_strength(r, theta, group, n_groups, length, fit_length=False, r_kind="separation", iterations=100, tol=1e-9):
+    """Per-group ``strength`` (and length) minimizing the squared angle residuals.
+
+    Levenberg-Marquardt, every group at once: the 2x2 normal equations of all
+    groups are summed with ``np.bincount`` and a step is kept only by the groups
+    whose residual it lowers; the others raise their damping and retry. Converged
+    groups drop out, so the few slow ones do not keep the whole batch busy.
+    """
+    length = np.broadcast_to(np.asarray(length, dtype=float), (n_groups,)).copy()
+    sin, versin = np.sin(theta), 1 - np.cos(theta)
+    fixed = None if fit_length else separation(r, theta, length[group], r_kind)
+
+    def residuals(points, strength, length):
+        g = group[points]
+        if fixed is not None: distance, d_distance = fixed[0][points], fixed[1][points]
+        elif r_kind == "separation": distance, d_distance = r[points], np.zeros(len(points))
+        else: distance, d_distance = _rest_separation(r[points], sin[points], versin[points], length[g])
+        u = strength[g] / distance**2
+        residual = theta[points] - np.arctan(u)
+        return g, distance, d_distance, u, residual, np.bincount(g, residual**2, n_groups)
+
+    # Start from the tan(theta) separation**2 average, exact for noise-free data and a known length
+    counts = np.maximum(np.bincount(group, minlength=n_groups), 1)
+    start = np.tan(theta) * separation(r, theta, length[group], r_kind)[0]**2
+    strength = np.bincount(group, start, n_groups) / counts
+    damping, done = np.full(n_groups, 1e-3), np.zeros(n_groups, dtype=bool)
+    points = np.arange(len(r))
+    for _ in range(iterations):
+        g, distance, d_distance, u, residual, cost = residuals(points, strength, length)
+        slope = 1 / (1 + u**2)
+        j_s = slope / distance**2
+        a_ss, b_s = np.bincount(g, j_s * j_s, n_groups), np.bincount(g, j_s * residual, n_groups)
+        a_ss_damped = a_ss * (1 + damping)
+        if fit_length:
+            j_l = -2 * slope * u / distance * d_distance
+            a_sl, a_ll = np.bincount(g, j_s * j_l, n_groups), np.bincount(g, j_l * j_l, n_groups)
+            b_l = np.bincount(g, j_l * residual, n_groups)
+            a_ll_damped = a_ll * (1 + damping)
+            det = a_ss_damped * a_ll_damped - a_sl**2
+            det = np.where(det > 0, det, np.inf)
+            step_s = (a_ll_damped * b_s - a_sl * b_l) / det
+            step_l = (a_ss_damped * b_l - a_sl * b_s) / det
+        else:
+            step_s, step_l = b_s / np.where(a_ss > 0, a_ss_damped, np.inf), np.zeros(n_groups)
+        # A length step past zero stops at it
+        trial_strength, trial_length = strength + step_s, np.maximum(length + step_l, 0.0)
+        step_l = trial_length - length
+        better = residuals(points, trial_strength, trial_length)[5] <= cost
+        strength, length = np.where(better, trial_strength, strength), np.where(better, trial_length, length)
+        damping = np.where(better, damping / 3, damping * 4)
+        # Converged: the step is down to rounding, or no step lowers the residual any more
+        done |= (np.abs(step_s) <= tol * np.abs(strength)) & (np.abs(step_l) <= tol * np.maximum(length, 1)) | (damping > 1e12)
+        points = points[~done[g]]
+        if not len(points): break
+    cost = residuals(np.arange(len(r)), strength, length)[5]
+    return strength, length, np.sqrt(cost / counts)
+
+
+def fit_charge(r, theta, k, weight=None, length=0.0, group=None, fit=("q",), r_kind="separation", q=None, gravity=GRAVITY):
+    """Fit ``q`` (q1q2) or ``mass``, optionally with ``length``, for every group of measurements.
+
+    ``weight`` is the bob's weight (``force_scale`` in scene units); when the mass
+    is fitted, ``q`` is held fixed and ``weight = mass * gravity``. Returns per-group
+    arrays ``q``, ``mass``, ``length``, ``strength``, ``rms_theta`` and ``n``.
+    """
+    fit = set(fit)
+    if not fit <= FITTED: raise ValueError(f"Can only fit {sorted(FITTED)}, got {sorted(fit)}")
+    if {"q", "mass"} <= fit: raise ValueError("q1q2 and the mass only enter the equilibrium as q1q2 / m; fix one of them")
+    if "length" in fit and r_kind != "rest": raise ValueError('Fitting the length needs r_kind="rest" (r measured from the rest position)')
+    if "mass" not in fit and weight is None: raise ValueError("weight is needed to fit q1q2")
+    if "mass" in fit and q is None: raise ValueError("q1q2 is needed to fit the mass")
+    r, theta = np.asarray(r, dtype=float), np.asarray(theta, dtype=float)
+    group = np.zeros(len(r), dtype=int) if group is None else np.asarray(group, dtype=int)
+    n_groups = int(group.max()) + 1 if len(group) else 0
+
+    strength, fitted_length, rms = fit_strength(r, theta, group, n_groups, length, "length" in fit, r_kind)
+    if "mass" in fit:
+        q = np.full(n_groups, float(q))
+        weight = k * q / strength
+    else:
+        weight = np.full(n_groups, float(weight))
+        q = strength * weight / k
+    return {"q": q, "mass": weight / gravity, "length": fitted_length, "strength": strength,
+            "rms_theta": rms, "n": np.bincount(group, minlength=n_groups)}
+
+
+def monte_carlo(r, theta, k, weight=None, length=0.0, group=None, fit=("q",), r_kind="separation",
+                sigma_theta=np.radians(0.5), sigma_r=0.0, experiments=2000, seed=None, **fit_kwargs):
+    """Spread of the estimates over ``experiments`` synthetic noisy repeats of each group's measurements.
+
+    The repeats re-measure the fitted model at the same ``r`` with Gaussian noise
+    ``sigma_theta`` (radians) and ``sigma_r``; all of them are fitted in one batch.
+    Returns ``{quantity: {"estimate", "std", "low", "high"}}`` (2.5 and 97.5 percentiles), per group.
+    """
+    r, theta = np.asarray(r, dtype=float), np.asarray(theta, dtype=float)
+    group = np.zeros(len(r), dtype=int) if group is None else np.asarray(group, dtype=int)
+    best = fit_charge(r, theta, k, weight, length, group, fit, r_kind, **fit_kwargs)
+    n_groups = len(best["q"])
+    true_theta = simulate_angles(r, best["strength"][group], best["length"][group], r_kind)
+
+    rng = np.random.default_rng(seed)
+    noisy_r = r + rng.normal(0.0, sigma_r, (experiments, len(r))) if sigma_r else np.broadcast_to(r, (experiments, len(r)))
+    noisy_theta = true_theta + rng.normal(0.0, sigma_theta, (experiments, len(r)))
+    batch_group = (group + n_groups * np.arange(experiments)[:, None]).ravel()
+    # Each repeat starts from (or, when it is not fitted, keeps) its group's length
+    repeats = fit_charge(noisy_r.ravel(), noisy_theta.ravel(), k, weight, np.tile(best["length"], experiments),
+                         batch_group, fit, r_kind, **fit_kwargs)
+
+    summary = {}
+    for name in sorted(fit):
+        values = repeats[name].reshape(experiments, n_groups)
+        low, high = np.percentile(values, [2.5, 97.5], axis=0)
+        summary[name] = {"estimate": best[name], "std": values.std(axis=0, ddof=1), "low": low, "high": high}
+    return summary
+
+
+def load_measurements(path):
+    """``r``, ``theta`` (radians) and ``group`` from a CSV with columns r, theta or theta_deg, and optionally group."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    if not rows: raise ValueError(f"No measurements in {path}")
+    r = np.array([float(row["r"]) for row in rows])
+    if "theta_deg" in rows[0]: theta = np.radians([float(row["theta_deg"]) for row in rows])
+    else: theta = np.array([float(row["theta"]) for row in rows])
+    labels = [row.get("group") or "" for row in rows]
+    names = sorted(set(labels))
+    group = np.array([names.index(label) for label in labels])
+    return r, theta, group, names
+
+
+def scene_model(overrides=None):
+    """``k``, ``weight``, ``length`` and ``gravity`` of CoulombPendulum, for measurements in scene units."""
+    from headless_timeline import demo_geometry
+    from scene_parameters import resolve_parameters
+
+    params = resolve_parameters(overrides)
+    return {"k": demo_geometry(params)["k_base"], "weight": params["force_scale"],
+            "length": params["pendulum_length"], "gravity": params["gravity"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("measurements", help="CSV with r (m), theta or theta_deg and optionally group")
+    parser.add_argument("--mass", type=float, default=None, help="bob mass in kg (starting value when fitted)")
+    parser.add_argument("--length", type=float, default=0.0, help="pendulum length in m (starting value when fitted)")
+    parser.add_argument("--q", type=float, default=None,
+                        help="q1q2 in C^2, held fixed when the mass is fitted (with --scene, the charge product factor, default 1)")
+    parser.add_argument("--r-kind", choices=("separation", "rest"), default="separation")
+    parser.add_argument("--fit", nargs="+", choices=sorted(FITTED), default=["q"])
+    parser.add_argument("--experiments", type=int, default=0, help="Monte Carlo repeats for uncertainties")
+    parser.add_argument("--sigma-theta-deg", type=float, default=0.5)
+    parser.add_argument("--sigma-r", type=float, default=0.0, help="m")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--scene", action="store_true",
+                        help="r in scene units against CoulombPendulum's model (k = K_COULOMB_SCALED_BASE, weight = force_scale)")
+    args = parser.parse_args(argv)
+    if not args.scene:
+        # The fit only sees q1q2 / m, so the other one has to be given
+        if "mass" in args.fit and args.q is None: parser.error("--fit mass needs --q (q1q2 in C^2)")
+        if "mass" not in args.fit and args.mass is None: parser.error("fitting q1q2 needs --mass")
+
+    r, theta, group, names = load_measurements(args.measurements)
+    if args.scene:
+        model = scene_model()
+        k, weight, gravity = model["k"], model["weight"], model["gravity"]
+        length = args.length or model["length"]
+    else:
+        k, weight, gravity, length = K_COULOMB, args.mass * GRAVITY if args.mass is not None else None, GRAVITY, args.length
+    options = dict(k=k, weight=weight, length=length, group=group, fit=args.fit, r_kind=args.r_kind, gravity=gravity)
+    if "mass" in args.fit: options["q"] = 1.0 if args.q is None else args.q
+    started = time.perf_counter()
+    if args.experiments:
+        summary = monte_carlo(r, theta, sigma_theta=np.radians(args.sigma_theta_deg), sigma_r=args.sigma_r,
+                              experiments=args.experiments, seed=args.seed, **options)
+    else:
+        best = fit_charge(r, theta, **options)
+        summary = {name: {"estimate": best[name]} for name in sorted(args.fit)}
+    elapsed = time.perf_counter() - started
+
+    for index, name in enumerate(names):
+        print(f"{name or 'all'} ({np.sum(group == index)} measurements)")
+        for quantity, stats in summary.items():
+            line = f"  {quantity:<7} {stats['estimate'][index]:.4g}"
+            if "std" in stats:
+                line += f" ± {stats['std'][index]:.2g}  [{stats['low'][index]:.4g}, {stats['high'][index]:.4g}]"
+            print(line)
+    print(f"{len(names)} groups, {len(r)} measurements{f', {args.experiments} experiments' if args.experiments else ''} "
+          f"in {elapsed * 1e3:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
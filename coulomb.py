@@ -1,36 +1,166 @@
 from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.file_ops import open_media_file
 import numpy as np
 
+from charge_fit import fit_charge
+from charge_system import ChargeSystem
+from curve_sampling import inverse_square, plot_adaptive
+from demo_scope import DemoScope
+from fast_readout import GlyphReadout
+from field_layer import FieldLayer, trace_field_lines
+from frame_pipeline import FramePipeline
+from headless_timeline import demo_geometry, q2_rest_position
+from narration import narration_text
+from pendulum_physics import DynamicPendulumTrajectory, PendulumTrajectory, bob_position
+from profiler import NULL_PROFILER, RenderProfiler, profile_dir_for
+from render_layers import RenderLayer, layer_members
+from scene_state import PendulumSceneState
+from scene_parameters import DEFAULT_PARAMETERS, resolve_parameters
+from stage_cache import StageCache
+from static_frames import StaticFrameReuse
+from tex_cache import precompile_scene_tex, use_shared_tex_cache
+from timeline import narration_layout
+
 
 class CoulombPendulum(Scene):
+    STAGES = (
+        "show_title",
+        "setup_pendulum",
+        "introduce_fixed_charge",
+        "show_repulsion_effect",
+        "show_complete_force_diagram_then_simplify",
+        "demonstrate_distance_effect",
+        "demonstrate_charge_product_effect",
+        "explain_coulomb_law",
+    )
+    use_stage_cache = True
+    stage_cache_dir = None
+    render_stages = None # None renders every stage; otherwise the rest are only fast-forwarded
+    precompile_tex = True
+    parameter_overrides = {}
+    profile_dir = None # or COULOMB_PROFILE; writes <ClassName>.json and .folded there
+    profile_memory = False
+    frame_pipeline_depth = 8 # frames queued between rasterization and ffmpeg; 0 writes them synchronously
+    reuse_static_frames = True # frames whose mobjects did not change repeat the last buffer
+    debug_scopes = False # log leaked mobjects/updaters, mobject counts and memory growth per stage and demo
+    render_layer = None # "geometry" or "text" draws only that layer (layered_render.py)
+
+    def setup(self):
+        self.frame_pipeline = self.static_frames = self.layer_filter = None
+        if self.frame_pipeline_depth and config.write_to_movie and isinstance(self.renderer, CairoRenderer):
+            self.frame_pipeline = FramePipeline(self.renderer.file_writer, self.frame_pipeline_depth).install()
+        if self.render_layer and isinstance(self.renderer, CairoRenderer):
+            self.layer_filter = RenderLayer(self.renderer.camera, self.render_layer).install()
+        if self.reuse_static_frames and isinstance(self.renderer, CairoRenderer):
+            self.static_frames = StaticFrameReuse(self.renderer, lambda mobjects: layer_members(mobjects, self.render_layer)).install()
+        self.profiler = NULL_PROFILER
+        if profile_dir_for(self): self.profiler = RenderProfiler(trace_memory=self.profile_memory).attach(self)
+        use_shared_tex_cache()
+        if self.precompile_tex:
+            with self.profiler.span("precompile_tex"): precompile_scene_tex(__file__)
+        self.stage_cache = None
+        if self.use_stage_cache and config.write_to_movie:
+            config.save_sections = True # each stage becomes its own section video
+            self.stage_cache = StageCache(self, self.stage_cache_dir)
+
+    def render(self, preview=False):
+        # Hold back the preview until cached stage segments have been spliced in
+        wants_preview, wants_browser = config.preview, config.show_in_file_browser
+        config.preview = config.show_in_file_browser = False
+        try:
+            super().render(preview)
+        finally:
+            config.preview, config.show_in_file_browser = wants_preview, wants_browser
+            if self.frame_pipeline:
+                self.frame_pipeline.close()
+                logger.info("Frame pipeline throughput:\n%s", self.frame_pipeline.format_report())
+            if self.static_frames:
+                self.static_frames.uninstall()
+                logger.info("Static frames: %s", self.static_frames.summary())
+            if self.layer_filter: self.layer_filter.uninstall()
+            if self.profiler:
+                self.profiler.detach()
+                self.profiler.write(profile_dir_for(self), type(self).__name__)
+        if self.stage_cache and self.stage_cache.stages:
+            if self.render_stages is None: self.stage_cache.splice()
+            else: self.stage_cache.store_rendered_sections()
+        if wants_preview or wants_browser:
+            open_media_file(self.renderer.file_writer)
+
     def construct(self):
         self.setup_scene_parameters()
-        self.show_title()
-        self.setup_pendulum()
-        self.introduce_fixed_charge()
-        self.show_repulsion_effect() 
-        self.show_complete_force_diagram_then_simplify()
-        self.demonstrate_distance_effect()
-        self.demonstrate_charge_product_effect() 
-        self.explain_coulomb_law()
+        stages = self.STAGES if self.stages is None else self.stages
+        unknown = [stage for stage in stages if stage not in self.STAGES]
+        if unknown: raise ValueError(f"{type(self).__name__} has no stages {unknown}")
+        pending = set(stages if self.render_stages is None else self.render_stages)
+        for stage in stages:
+            if not pending: break
+            self.run_stage(stage)
+            pending.discard(stage)
+
+    def run_stage(self, stage):
+        fast_forward = self.render_stages is not None and stage not in self.render_stages
+        if self.frame_pipeline: self.frame_pipeline.stage = stage
+        if self.stage_cache:
+            cached = self.stage_cache.begin(stage)
+            self.next_section(stage, skip_animations=cached or fast_forward)
+        elif fast_forward:
+            self.next_section(stage, skip_animations=True)
+        self.current_stage = stage
+        with DemoScope(self, stage, teardown=False, debug=self.debug_scopes), self.profiler.stage(stage):
+            getattr(self, stage)()
 
     def setup_scene_parameters(self):
-        self.pivot_point = UP * 2.5
-        self.pendulum_length = 2.5
-        self.bob_radius = 0.2
-        self.fixed_charge_radius = 0.25
-        self.force_scale = 1.2 
-        self.theta_equilibrium = PI / 6 
+        # Defaults live in scene_parameters.py; sweeps and variants pass parameter_overrides
+        for name, value in resolve_parameters(self.parameter_overrides).items():
+            setattr(self, name, value)
+        self.pivot_point = np.array(self.pivot_point, dtype=float)
+        # Narration sizes, placements and Write times, resolved from the reference locale before any stage runs
+        self.narration_layout = narration_layout(self.layout, self.narration_keys, self.pivot_point,
+                                                 (config.frame_width, config.frame_height))
+
+    def scene_parameters(self):
+        return {name: getattr(self, name) for name in DEFAULT_PARAMETERS}
+
+    def narrate(self, slot, **tex_kwargs):
+        # Narration of a layout slot in the scene's locale, flagged for the text layer and placed
+        # where the reference locale's text would be, so that every locale shares one geometry layer
+        entry = self.narration_layout[slot]
+        text = Tex(narration_text(entry["key"], self.locale), font_size=entry["font_size"], **tex_kwargs)
+        text.narration, text.slot, text.reference_size = True, slot, entry["size"]
+        if entry["center"] is not None: text.move_to([*entry["center"], 0])
+        return text
+
+    def placement(self, slot):
+        return np.array([*self.narration_layout[slot]["center"], 0])
+
+    def beat(self, name):
+        # Seconds of a play or wait of the current stage (scene_parameters.DEFAULT_BEATS); narration
+        # beats left at None take the reference locale's Write time, shared by every locale
+        seconds = self.beats[self.current_stage][name]
+        return self.narration_layout[name]["write_time"] if seconds is None else seconds
+
+    def hold(self, name):
+        if self.beat(name): self.wait(self.beat(name))
+
+    def write_narration(self, text):
+        return Write(text, run_time=self.beat(text.slot))
+
+    def transform_title(self, slot):
+        new_title = self.narrate(slot).set_weight(BOLD)
+        self.play(Transform(self.title, new_title), run_time=self.beat("title"))
+        self.title.reference_size = new_title.reference_size
 
     def show_title(self):
-        self.title = Tex("Pêndulo Eletrostático e a Lei de Coulomb", font_size=36)
+        self.title = self.narrate("title").move_to(ORIGIN)
         self.title.set_color(WHITE).set_weight(BOLD)
-        self.play(Write(self.title)); self.wait(1)
-        self.play(self.title.animate.to_edge(UP))
+        self.play(self.write_narration(self.title)); self.hold("title_hold")
+        self.play(self.title.animate.move_to(self.placement("title")), run_time=self.beat("title_to_top"))
 
     def setup_pendulum(self):
-        self.pivot_dot = Dot(self.pivot_point, color=GRAY, radius=0.08)
-        pivot_label = Tex("Pivô", font_size=24).next_to(self.pivot_dot, UP, buff=0.1).set_color(WHITE) 
+        self.pivot_dot = Dot(self.pivot_point, color=GRAY, radius=self.layout["pivot_radius"])
+        pivot_label = self.narrate("pivot_label").set_color(WHITE)
 
         self.bob_initial_pos = self.pivot_point + DOWN * self.pendulum_length
 
@@ -40,40 +170,42 @@ class CoulombPendulum(Scene):
 
         self.string = Line(self.pivot_point, self.bob.get_center(), stroke_width=2, color=WHITE)
 
-        self.play(Create(self.pivot_dot), Write(pivot_label))
-        self.play(Create(self.string), Create(self.bob), Create(self.bob_center))
-        self.play(Write(self.bob_label)); self.wait(1)
+        self.play(Create(self.pivot_dot), Write(pivot_label), run_time=self.beat("pivot"))
+        self.play(Create(self.string), Create(self.bob), Create(self.bob_center), run_time=self.beat("pendulum"))
+        self.play(Write(self.bob_label), run_time=self.beat("bob_label")); self.hold("pendulum_hold")
 
     def introduce_fixed_charge(self):
-        initial_pos_q2 = self.bob_initial_pos + LEFT * 3.5
-        self.fixed_charge_final_pos_value = self.bob_initial_pos + LEFT * 1.8
+        initial_pos_q2 = self.bob_initial_pos + LEFT * self.layout["q2_start_offset"]
+        self.fixed_charge_final_pos_value = q2_rest_position(self.pivot_point, self.pendulum_length, self.layout["q2_rest_offset"])
 
         self.fixed_charge = Circle(radius=self.fixed_charge_radius, fill_opacity=0.8, color=RED_C, stroke_width=2).move_to(initial_pos_q2)
         self.fixed_charge_center = Dot(initial_pos_q2, color=WHITE, radius=0.01)
         self.fixed_charge_label = MathTex("q_2", font_size=30).next_to(self.fixed_charge, DOWN, buff=0.15)
         self.plus_sign_q2 = MathTex("+", font_size=20, color=WHITE).move_to(self.fixed_charge.get_center())
 
-        intro_text = Tex("Aproximamos uma carga fixa $q_2$ positiva...", font_size=30).to_edge(DOWN).shift(UP * 0.5)
-        self.play(Write(intro_text))
+        intro_text = self.narrate("intro_text")
+        self.play(self.write_narration(intro_text))
 
-        self.play(Create(self.fixed_charge), Create(self.fixed_charge_center), Write(self.plus_sign_q2), Write(self.fixed_charge_label))
+        self.play(Create(self.fixed_charge), Create(self.fixed_charge_center), Write(self.plus_sign_q2), Write(self.fixed_charge_label),
+                  run_time=self.beat("q2_appear"))
 
         self.play(
             self.fixed_charge.animate.move_to(self.fixed_charge_final_pos_value),
             self.fixed_charge_center.animate.move_to(self.fixed_charge_final_pos_value),
             self.plus_sign_q2.animate.move_to(self.fixed_charge_final_pos_value),
-            self.fixed_charge_label.animate.next_to(self.fixed_charge_final_pos_value + DOWN * self.fixed_charge_radius, DOWN, buff=0.15)
+            self.fixed_charge_label.animate.next_to(self.fixed_charge_final_pos_value + DOWN * self.fixed_charge_radius, DOWN, buff=0.15),
+            run_time=self.beat("q2_approach")
         )
-        self.play(FadeOut(intro_text)); self.wait(0.5)
+        self.play(FadeOut(intro_text), run_time=self.beat("intro_fade")); self.hold("q2_hold")
 
     def show_repulsion_effect(self):
-        scene_narrative_text = Tex("O p\\^endulo ($q_1$) est\\'a inicialmente neutro.", font_size=30).to_edge(DOWN).shift(UP * 0.5)
-        self.play(Write(scene_narrative_text))
-        self.wait(1.5)
+        scene_narrative_text = self.narrate("neutral_text")
+        self.play(self.write_narration(scene_narrative_text))
+        self.hold("neutral_hold")
 
-        contact_intro_text = Tex("Fazemos a carga $q_2$ (positiva) tocar o p\\^endulo...", font_size=30).move_to(scene_narrative_text)
-        self.play(Transform(scene_narrative_text, contact_intro_text))
-        self.wait(1)
+        contact_intro_text = self.narrate("contact_intro_text")
+        self.play(Transform(scene_narrative_text, contact_intro_text), run_time=self.beat("contact_intro"))
+        self.hold("contact_intro_hold")
 
         q2_resting_pos = self.fixed_charge.get_center().copy()
         q1_pos = self.bob.get_center().copy()
@@ -85,58 +217,63 @@ class CoulombPendulum(Scene):
             self.fixed_charge.animate.move_to(contact_pos_for_q2),
             self.fixed_charge_center.animate.move_to(contact_pos_for_q2),
             self.plus_sign_q2.animate.move_to(contact_pos_for_q2),
-            self.fixed_charge_label.animate.next_to(contact_pos_for_q2 + DOWN*self.fixed_charge_radius, DOWN, buff=0.15)
+            self.fixed_charge_label.animate.next_to(contact_pos_for_q2 + DOWN*self.fixed_charge_radius, DOWN, buff=0.15),
+            run_time=self.beat("contact")
         )
-        self.wait(0.5)
+        self.hold("contact_hold")
 
-        electrization_text = Tex("...ocorre eletriza\\c{c}\\~ao por contato!", font_size=30).move_to(scene_narrative_text)
-        self.play(Transform(scene_narrative_text, electrization_text))
+        electrization_text = self.narrate("electrization_text")
+        self.play(Transform(scene_narrative_text, electrization_text), run_time=self.beat("electrization"))
 
-        self.play(self.bob.animate.set_color(RED_E))
+        self.play(self.bob.animate.set_color(RED_E), run_time=self.beat("bob_charge"))
         self.plus_sign_q1 = MathTex("+", font_size=16, color=WHITE).move_to(self.bob.get_center())
-        self.play(Write(self.plus_sign_q1))
-        self.wait(0.5)
+        self.play(Write(self.plus_sign_q1), run_time=self.beat("plus_q1"))
+        self.hold("plus_q1_hold")
 
         self.play(
             self.fixed_charge.animate.move_to(q2_resting_pos),
             self.fixed_charge_center.animate.move_to(q2_resting_pos),
             self.plus_sign_q2.animate.move_to(q2_resting_pos),
-            self.fixed_charge_label.animate.next_to(q2_resting_pos + DOWN*self.fixed_charge_radius, DOWN, buff=0.15)
+            self.fixed_charge_label.animate.next_to(q2_resting_pos + DOWN*self.fixed_charge_radius, DOWN, buff=0.15),
+            run_time=self.beat("q2_return")
         )
-        self.wait(0.5)
+        self.hold("q2_return_hold")
 
         self.setup_pendulum_updaters()
 
-        both_charged_text = Tex("Agora $q_1$ e $q_2$ s\\~ao ambas positivas.", font_size=30).move_to(scene_narrative_text)
-        self.play(Transform(scene_narrative_text, both_charged_text))
+        both_charged_text = self.narrate("both_charged_text")
+        self.play(Transform(scene_narrative_text, both_charged_text), run_time=self.beat("both_charged"))
 
-        repulsion_text_popup = Tex("Repuls\\~ao eletrost\\'atica!", font_size=24, color=YELLOW).next_to(both_charged_text, UP, buff=0.2)
-        self.play(Write(repulsion_text_popup))
+        repulsion_text_popup = self.narrate("repulsion_text_popup", color=YELLOW)
+        self.play(self.write_narration(repulsion_text_popup))
 
-        self.deflected_pos_bob = self.pivot_point + self.pendulum_length * (DOWN * np.cos(self.theta_equilibrium) + RIGHT * np.sin(self.theta_equilibrium))
-        self.play(self.bob.animate.move_to(self.deflected_pos_bob), run_time=2)
-        self.wait(1)
+        self.deflected_pos_bob = bob_position(self.pivot_point, self.pendulum_length, self.theta_equilibrium)
+        self.play(self.bob.animate.move_to(self.deflected_pos_bob), run_time=self.beat("deflect"))
+        self.hold("deflect_hold")
 
-        self.play(FadeOut(scene_narrative_text), FadeOut(repulsion_text_popup))
-        self.wait(0.5)
+        self.play(FadeOut(scene_narrative_text), FadeOut(repulsion_text_popup), run_time=self.beat("narration_fade"))
+        self.hold("repulsion_hold")
 
     def setup_pendulum_updaters(self):
-        if self.string.updaters: self.string.clear_updaters()
-        self.string.add_updater(lambda s: s.put_start_and_end_on(self.pivot_point, self.bob.get_center()))
-        
-        if self.bob_center.updaters: self.bob_center.clear_updaters()
-        self.bob_center.add_updater(lambda d: d.move_to(self.bob.get_center()))
-        
-        if self.bob_label.updaters: self.bob_label.clear_updaters()
-        self.bob_label.add_updater(lambda m: m.next_to(self.bob, DOWN, buff=0.15))
-        
+        if not hasattr(self, 'pendulum_state'):
+            self.pendulum_state = PendulumSceneState(self.bob, self.fixed_charge)
+            self.pendulum_state.profiler = self.profiler or None
+            # Sits just before the string so it and everything drawn after it are treated as moving
+            self.mobjects.insert(self.mobjects.index(self.string) if self.string in self.mobjects else 0, self.pendulum_state)
+        state = self.pendulum_state
+
+        state.bind("string", self.string, ("bob",), lambda s, st: s.put_start_and_end_on(self.pivot_point, st.bob_pos))
+        state.bind("bob_center", self.bob_center, ("bob",), lambda d, st: d.move_to(st.bob_pos))
+        state.bind("bob_label", self.bob_label, ("bob",), lambda m, st: m.next_to(self.bob, DOWN, buff=0.15))
         if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1:
-            if self.plus_sign_q1.updaters: self.plus_sign_q1.clear_updaters()
-            self.plus_sign_q1.add_updater(lambda p: p.move_to(self.bob.get_center()))
+            state.bind("plus_sign_q1", self.plus_sign_q1, ("bob",), lambda p, st: p.move_to(st.bob_pos))
+
+        state.bind("fixed_charge_center", self.fixed_charge_center, ("q2",), lambda m, st: m.move_to(st.q2_pos))
+        state.bind("fixed_charge_label", self.fixed_charge_label, ("q2",), lambda m, st: m.next_to(self.fixed_charge, DOWN, buff=0.15))
+        state.bind("plus_sign_q2", self.plus_sign_q2, ("q2",), lambda p, st: p.move_to(st.q2_pos))
 
     def show_complete_force_diagram_then_simplify(self):
-        dcl_title = Tex("For\\c{c}as no P\\^endulo", font_size=40).set_weight(BOLD).to_edge(UP, buff=0.5)
-        self.play(Transform(self.title, dcl_title))
+        self.transform_title("forces_title")
 
         self.Fg_vec = Arrow(self.bob.get_center(), self.bob.get_center() + DOWN * self.force_scale, buff=0, color=GREEN, stroke_width=6)
         self.Fg_label = MathTex(r"\vec{F}_g", font_size=26, color=GREEN).next_to(self.Fg_vec, DOWN, buff=0.1)
@@ -148,79 +285,51 @@ class CoulombPendulum(Scene):
         self.T_vec = Arrow(self.bob.get_center(), self.pivot_point, buff=self.bob_radius, color=BLUE, stroke_width=6)
         self.T_label = MathTex(r"\vec{T}", font_size=26, color=BLUE).next_to(self.T_vec.get_center(), LEFT, buff=0.1)
 
-        forces_text = Tex("Tr\\^es for\\c{c}as atuam no p\\^endulo:", font_size=30).to_edge(DOWN).shift(UP*0.5)
-        self.play(Write(forces_text))
-        self.play(GrowArrow(self.Fg_vec), Write(self.Fg_label)); self.wait(0.5)
-        self.play(GrowArrow(self.Fe_vec_diag), Write(self.Fe_label_diag)); self.wait(0.5)
-        self.play(GrowArrow(self.T_vec), Write(self.T_label)); self.wait(1.5)
+        forces_text = self.narrate("forces_text")
+        self.play(self.write_narration(forces_text))
+        self.play(GrowArrow(self.Fg_vec), Write(self.Fg_label), run_time=self.beat("Fg")); self.hold("Fg_hold")
+        self.play(GrowArrow(self.Fe_vec_diag), Write(self.Fe_label_diag), run_time=self.beat("Fe")); self.hold("Fe_hold")
+        self.play(GrowArrow(self.T_vec), Write(self.T_label), run_time=self.beat("T")); self.hold("T_hold")
 
-        simplify_text = Tex("Focaremos na for\\c{c}a el\\'etrica ($F_e$)", font_size=30).move_to(forces_text)
-        self.play(Transform(forces_text, simplify_text))
+        simplify_text = self.narrate("simplify_text")
+        self.play(Transform(forces_text, simplify_text), run_time=self.beat("simplify"))
         self.play(FadeOut(self.Fg_vec), FadeOut(self.Fg_label),
-                  FadeOut(self.T_vec), FadeOut(self.T_label), run_time=1)
-        self.wait(0.5)
-        self.play(FadeOut(self.Fe_vec_diag), FadeOut(self.Fe_label_diag), FadeOut(forces_text))
+                  FadeOut(self.T_vec), FadeOut(self.T_label), run_time=self.beat("fade_Fg_T"))
+        self.hold("simplify_hold")
+        self.play(FadeOut(self.Fe_vec_diag), FadeOut(self.Fe_label_diag), FadeOut(forces_text), run_time=self.beat("fade_Fe"))
 
     def setup_demo_environment(self, demo_type):
-        if "distance" in demo_type: demo_title_text = r"$F_e \text{ vs. Dist\^ancia } (r)$"
-        elif "charge_product" in demo_type: demo_title_text = r"$F_e \text{ vs. Produto das Cargas } (q_1q_2)$"
+        if "distance" in demo_type: demo_title_key = "distance_title"
+        elif "charge_product" in demo_type: demo_title_key = "charge_product_title"
         else: return
 
-        new_title = Tex(demo_title_text, font_size=40).set_weight(BOLD).to_edge(UP, buff=0.5)
-        self.play(Transform(self.title, new_title))
+        self.transform_title(demo_title_key)
 
-        self.bob_pos_at_theta_eq = getattr(self, 'deflected_pos_bob', # Use final pos from repulsion
-                                           self.pivot_point + self.pendulum_length * (
-                                           DOWN * np.cos(self.theta_equilibrium) + RIGHT * np.sin(self.theta_equilibrium)))
-        
-        self.r_at_theta_eq = np.linalg.norm(self.bob_pos_at_theta_eq - self.fixed_charge_final_pos_value)
-        Fe_viz_at_theta_eq = self.force_scale * np.tan(self.theta_equilibrium)
-        self.K_COULOMB_SCALED_BASE = Fe_viz_at_theta_eq * (self.r_at_theta_eq**2)
+        # One manim-free derivation, shared with headless_timeline, charge_fit and timeline
+        self.demo_geometry = demo_geometry(dict(
+            pivot_point=self.pivot_point, pendulum_length=self.pendulum_length, theta_equilibrium=self.theta_equilibrium,
+            force_scale=self.force_scale, pendulum_dynamics=self.pendulum_dynamics, layout=self.layout,
+            distance_steps=self.distance_steps, bob_radius=self.bob_radius, fixed_charge_radius=self.fixed_charge_radius,
+        ))
+        self.bob_pos_at_theta_eq, self.r_at_theta_eq = self.demo_geometry["bob_eq"], self.demo_geometry["r_eq"]
+        self.K_COULOMB_SCALED_BASE = self.demo_geometry["k_base"]
+        Fe_viz_at_theta_eq = self.K_COULOMB_SCALED_BASE / (self.r_at_theta_eq**2)
 
-        self.current_r_tracker = ValueTracker(self.r_at_theta_eq)
-        self.current_Fe_tracker = ValueTracker(Fe_viz_at_theta_eq)
         self.charge_product_factor_tracker = ValueTracker(1.0)
 
+        # Reset the shared state: no demo drivers or dependents, base pendulum bindings only
+        self.setup_pendulum_updaters()
+        state = self.pendulum_state
+        state.clear_drivers(); state.clear_group("demo")
+        state.charge_factor_tracker = self.charge_product_factor_tracker
+        state.r, state.Fe = self.r_at_theta_eq, Fe_viz_at_theta_eq
+
         # Ensure bob and fixed_charge are at their equilibrium/demo positions
         if np.linalg.norm(self.bob.get_center() - self.bob_pos_at_theta_eq) > 0.01:
-            self.bob.move_to(self.bob_pos_at_theta_eq)
-            if self.string.updaters: self.string.update(0)
-            if self.bob_center.updaters: self.bob_center.update(0)
-            if self.bob_label.updaters: self.bob_label.update(0)
-            if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1 and self.plus_sign_q1.updaters: self.plus_sign_q1.update(0)
-        
+            state.move_bob(self.bob_pos_at_theta_eq)
         if np.linalg.norm(self.fixed_charge.get_center() - self.fixed_charge_final_pos_value) > 0.01:
-            self.fixed_charge.move_to(self.fixed_charge_final_pos_value)
-            if self.fixed_charge_center.updaters: self.fixed_charge_center.update(0)
-            if self.plus_sign_q2.updaters: self.plus_sign_q2.update(0)
-            if self.fixed_charge_label.updaters: self.fixed_charge_label.update(0)
-
-        # Clear ALL potentially conflicting updaters
-        elements_to_clear_all_updaters = [
-            self.bob, self.string, self.bob_center, self.bob_label, 
-            self.fixed_charge, self.fixed_charge_center, self.fixed_charge_label, self.plus_sign_q2,
-            self.current_r_tracker # if it had updaters from distance demo
-        ]
-        if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1:
-            elements_to_clear_all_updaters.append(self.plus_sign_q1)
-        
-        for mobj in elements_to_clear_all_updaters:
-            if mobj and hasattr(mobj, 'clear_updaters'): mobj.clear_updaters()
-        
-        if hasattr(self, 'bob_physics_updater_obj'):
-            self.bob_physics_updater_obj.clear_updaters()
-            if self.bob_physics_updater_obj in self.mobjects: self.remove(self.bob_physics_updater_obj)
-            delattr(self, 'bob_physics_updater_obj')
-        if hasattr(self, 'charge_product_specific_physics_updater'): # from previous charge demo run
-            self.charge_product_specific_physics_updater.clear_updaters()
-            if self.charge_product_specific_physics_updater in self.mobjects: self.remove(self.charge_product_specific_physics_updater)
-            delattr(self, 'charge_product_specific_physics_updater')
-
-
-        self.setup_pendulum_updaters() # For string, bob_center, bob_label relative to bob's (now static) position
-        
-        self.fixed_charge_center.add_updater(lambda m: m.move_to(self.fixed_charge.get_center()))
-        self.fixed_charge_label.add_updater(lambda m: m.next_to(self.fixed_charge, DOWN, buff=0.15))
+            state.move_q2(self.fixed_charge_final_pos_value)
+        state.refresh()
 
         self.original_plus_q1_height = self.plus_sign_q1.height if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1 else 0.2
         self.original_plus_q2_height = self.plus_sign_q2.height if self.plus_sign_q2 else 0.2
@@ -230,46 +339,38 @@ class CoulombPendulum(Scene):
             self.charge_product_factor_tracker.set_value(1.0) 
 
             initial_y_q2 = self.fixed_charge_final_pos_value[1]
-            self.fixed_charge.add_updater(lambda m: m.move_to([self.parameter_tracker.get_value(), initial_y_q2, 0]))
-            
-            # plus_sign_q1 already handled by setup_pendulum_updaters
-            self.plus_sign_q2.add_updater(lambda p: p.move_to(self.fixed_charge.get_center()))
-            
-            self.setup_bob_and_Fe_physics_updater() # This updater MOVES THE BOB
+            state.add_driver("q2_follows_tracker", lambda st: st.move_q2([self.parameter_tracker.get_value(), initial_y_q2, 0]))
+            self.setup_bob_and_Fe_physics_updater() # This driver MOVES THE BOB
 
         elif "charge_product" in demo_type:
             self.parameter_tracker = self.charge_product_factor_tracker
-            self.current_r_tracker.set_value(self.r_at_theta_eq) # r is fixed
-
-            min_scale_factor = 0.25 
-            if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1:
-                # setup_pendulum_updaters already set pos, now add height scaling
-                self.plus_sign_q1.add_updater(lambda p: p.set_height(
-                    self.original_plus_q1_height * np.sqrt(max(min_scale_factor, self.charge_product_factor_tracker.get_value()))
-                ))
-            self.plus_sign_q2.add_updater(lambda p: p.move_to(self.fixed_charge.get_center()).set_height(
-                self.original_plus_q2_height * np.sqrt(max(min_scale_factor, self.charge_product_factor_tracker.get_value()))
-            ))
-            
-            self.charge_product_specific_physics_updater = Mobject()
-            def charge_product_physics_func_local(mobj_updater):
-                q1q2_f = self.charge_product_factor_tracker.get_value()
-                Fe_calc = (self.K_COULOMB_SCALED_BASE * q1q2_f) / (self.r_at_theta_eq**2)
-                max_Fe_viz = self.force_scale * np.tan(PI * 0.48) 
-                self.current_Fe_tracker.set_value(min(Fe_calc, max_Fe_viz))
-                # self.current_r_tracker is already set to fixed r_at_theta_eq and has no updater
-
-            self.charge_product_specific_physics_updater.add_updater(charge_product_physics_func_local)
-            self.add(self.charge_product_specific_physics_updater)
-            # Bob does NOT move, so no bob_physics_updater_obj needed here
+            self.setup_charge_product_physics()
+
+    def setup_charge_product_physics(self):
+        # The charge signs grow with q1q2 while r stays fixed; timed by benchmarks/suite.py
+        state = self.pendulum_state
+        min_scale_factor = 0.25 
+        charge_scale = lambda st: np.sqrt(max(min_scale_factor, st.charge_factor))
+        if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1:
+            state.bind("plus_sign_q1", self.plus_sign_q1, ("bob", "charge_factor"), lambda p, st: p.move_to(st.bob_pos).set_height(
+                self.original_plus_q1_height * charge_scale(st)), group="demo")
+        state.bind("plus_sign_q2", self.plus_sign_q2, ("q2", "charge_factor"), lambda p, st: p.move_to(st.q2_pos).set_height(
+            self.original_plus_q2_height * charge_scale(st)), group="demo")
+
+        max_Fe_viz = self.demo_geometry["max_Fe"]
+        def charge_product_physics_func_local(st):
+            st.r = self.r_at_theta_eq # r is fixed, bob does NOT move
+            st.Fe = min((self.K_COULOMB_SCALED_BASE * st.charge_factor) / (self.r_at_theta_eq**2), max_Fe_viz)
+
+        state.add_driver("charge_product_physics", charge_product_physics_func_local)
 
     def create_dynamic_visuals(self, demo_type):
+        state = self.pendulum_state
         self.dist_line_dyn = DashedLine(self.bob.get_center(), self.fixed_charge.get_center(), color=YELLOW_D, stroke_width=3)
         self.dist_label_r_on_line = MathTex("r", font_size=28, color=ORANGE)
-        if self.dist_line_dyn.updaters: self.dist_line_dyn.clear_updaters()
-        self.dist_line_dyn.add_updater(lambda l: l.put_start_and_end_on(self.bob.get_center(), self.fixed_charge.get_center()))
-        if self.dist_label_r_on_line.updaters: self.dist_label_r_on_line.clear_updaters()
-        self.dist_label_r_on_line.add_updater(lambda m: m.next_to(self.dist_line_dyn.get_center(), UP, buff=0.1))
+        state.bind("dist_line_dyn", self.dist_line_dyn, ("bob", "q2"), lambda l, st: l.put_start_and_end_on(st.bob_pos, st.q2_pos), group="demo")
+        state.bind("dist_label_r_on_line", self.dist_label_r_on_line, ("bob", "q2"),
+                   lambda m, st: m.next_to(self.dist_line_dyn.get_center(), UP, buff=0.1), group="demo")
 
         if not (self.dist_line_dyn in self.mobjects): self.add(self.dist_line_dyn)
         if not (self.dist_label_r_on_line in self.mobjects): self.add(self.dist_label_r_on_line)
@@ -281,87 +382,78 @@ class CoulombPendulum(Scene):
             prop_text_str = r"F_e \propto q_1 q_2"; prop_color_map = {"q_1 q_2": BLUE_D}
 
         prop_text = MathTex(prop_text_str, font_size=36).set_color_by_tex_to_color_map({**prop_color_map_base, **prop_color_map})
-        prop_text.to_corner(UL, buff=0.5).shift(DOWN * (self.title.height + 0.4))
-        self.play(Write(prop_text)); self.active_proportionality_text = prop_text
+        prop_text.to_corner(UL, buff=0.5).shift(DOWN * (self.title.reference_size[1] + 0.4))
+        self.play(Write(prop_text), run_time=self.beat("prop_text")); self.active_proportionality_text = prop_text
 
         r_label_text = MathTex("r =", font_size=28, color=YELLOW_D)
-        self.r_value_display = DecimalNumber(self.current_r_tracker.get_value(), num_decimal_places=2, font_size=28, color=YELLOW_D)
-        if self.r_value_display.updaters: self.r_value_display.clear_updaters()
-        self.r_value_display.add_updater(lambda d: d.set_value(self.current_r_tracker.get_value()))
+        self.r_value_display = GlyphReadout(state.r, num_decimal_places=2, font_size=28, color=YELLOW_D)
+        state.bind("r_value_display", self.r_value_display, ("r",), lambda d, st: d.set_value(st.r), group="demo")
 
         Fe_label_text = MathTex("F_e =", font_size=28, color=ORANGE)
-        self.Fe_value_display = DecimalNumber(self.current_Fe_tracker.get_value(), num_decimal_places=2, font_size=28, color=ORANGE)
-        if self.Fe_value_display.updaters: self.Fe_value_display.clear_updaters()
-        self.Fe_value_display.add_updater(lambda d: d.set_value(self.current_Fe_tracker.get_value()))
+        self.Fe_value_display = GlyphReadout(state.Fe, num_decimal_places=2, font_size=28, color=ORANGE)
+        state.bind("Fe_value_display", self.Fe_value_display, ("Fe",), lambda d, st: d.set_value(st.Fe), group="demo")
 
         data_vgroup_list = [VGroup(r_label_text, self.r_value_display).arrange(RIGHT, buff=SMALL_BUFF)]
 
         if "distance" in demo_type:
             r_sq_label = MathTex("r^2 =", font_size=28, color=YELLOW_D)
-            self.r_sq_value_display = DecimalNumber(self.current_r_tracker.get_value()**2, num_decimal_places=2, font_size=28, color=YELLOW_D)
-            if self.r_sq_value_display.updaters: self.r_sq_value_display.clear_updaters()
-            self.r_sq_value_display.add_updater(lambda d: d.set_value(max(0.001, self.current_r_tracker.get_value()**2)))
+            self.r_sq_value_display = GlyphReadout(state.r**2, num_decimal_places=2, font_size=28, color=YELLOW_D)
+            state.bind("r_sq_value_display", self.r_sq_value_display, ("r",), lambda d, st: d.set_value(max(0.001, st.r**2)), group="demo")
             data_vgroup_list.append(VGroup(r_sq_label, self.r_sq_value_display).arrange(RIGHT, buff=SMALL_BUFF))
         elif "charge_product" in demo_type:
             q_prod_label = MathTex(r"(q_1q_2)_{\text{rel}} =", font_size=28, color=BLUE_D)
-            self.q_prod_display = DecimalNumber(self.charge_product_factor_tracker.get_value(), num_decimal_places=2, font_size=28, color=BLUE_D)
-            if self.q_prod_display.updaters: self.q_prod_display.clear_updaters()
-            self.q_prod_display.add_updater(lambda d: d.set_value(self.charge_product_factor_tracker.get_value()))
+            self.q_prod_display = GlyphReadout(state.charge_factor, num_decimal_places=2, font_size=28, color=BLUE_D)
+            state.bind("q_prod_display", self.q_prod_display, ("charge_factor",), lambda d, st: d.set_value(st.charge_factor), group="demo")
             data_vgroup_list.append(VGroup(q_prod_label, self.q_prod_display).arrange(RIGHT, buff=SMALL_BUFF))
 
         data_vgroup_list.append(VGroup(Fe_label_text, self.Fe_value_display).arrange(RIGHT, buff=SMALL_BUFF))
 
         self.numerical_data_group = VGroup(*data_vgroup_list).arrange(DOWN, buff=0.2, aligned_edge=LEFT)
         self.numerical_data_group.next_to(prop_text, DOWN, buff=0.2, aligned_edge=LEFT)
-        self.play(Write(self.numerical_data_group))
+        self.play(Write(self.numerical_data_group), run_time=self.beat("readouts"))
 
-        self.dynamic_Fe_vec = Arrow(self.bob.get_center(), self.bob.get_center() + RIGHT*self.current_Fe_tracker.get_value(), stroke_width=6, color=ORANGE, buff=0)
+        self.dynamic_Fe_vec = Arrow(self.bob.get_center(), self.bob.get_center() + RIGHT*state.Fe, stroke_width=6, color=ORANGE, buff=0)
         self.dynamic_Fe_label = MathTex(r"\vec{F}_e", font_size=26, color=ORANGE)
         if not (self.dynamic_Fe_vec in self.mobjects): self.add(self.dynamic_Fe_vec)
         if not (self.dynamic_Fe_label in self.mobjects): self.add(self.dynamic_Fe_label)
 
-        self.dynamic_Fe_elements_updater_obj = Mobject()
-        def dynamic_Fe_updater_func(mobj):
-            Fe_mag_visual = self.current_Fe_tracker.get_value()
-            current_bob_center = self.bob.get_center() 
-            self.dynamic_Fe_vec.put_start_and_end_on(current_bob_center, current_bob_center + RIGHT * Fe_mag_visual)
-            self.dynamic_Fe_label.next_to(self.dynamic_Fe_vec, RIGHT, buff=0.1)
-
-        if self.dynamic_Fe_elements_updater_obj.updaters: self.dynamic_Fe_elements_updater_obj.clear_updaters()
-        self.dynamic_Fe_elements_updater_obj.add_updater(dynamic_Fe_updater_func)
-        if not (self.dynamic_Fe_elements_updater_obj in self.mobjects): self.add(self.dynamic_Fe_elements_updater_obj)
+        def dynamic_Fe_updater_func(vec, st):
+            vec.put_start_and_end_on(st.bob_pos, st.bob_pos + RIGHT * st.Fe)
+            self.dynamic_Fe_label.next_to(vec, RIGHT, buff=0.1)
+        state.bind("dynamic_Fe_vec", self.dynamic_Fe_vec, ("bob", "Fe"), dynamic_Fe_updater_func, group="demo")
 
     def setup_bob_and_Fe_physics_updater(self):
-        self.bob_physics_updater_obj = Mobject() 
-
-        def physics_updater_func_local(mobj):
-            bob_center = self.bob.get_center()
-            fixed_charge_center = self.fixed_charge.get_center()
-            r_val = np.linalg.norm(bob_center - fixed_charge_center)
-            r_val = max(r_val, 0.1)
-            self.current_r_tracker.set_value(r_val) 
-
-            q1q2_f = self.charge_product_factor_tracker.get_value() 
-            Fe_calc = (self.K_COULOMB_SCALED_BASE * q1q2_f) / (r_val**2)
-            max_Fe_viz = self.force_scale * np.tan(PI * 0.48)
-            Fe_display_val = min(Fe_calc, max_Fe_viz)
-            self.current_Fe_tracker.set_value(Fe_display_val)
-
-            target_theta = np.arctan(Fe_display_val / self.force_scale) if self.force_scale != 0 else (PI/2 if Fe_display_val > 0 else 0)
-            new_bob_pos = self.pivot_point + self.pendulum_length * (DOWN * np.cos(target_theta) + RIGHT * np.sin(target_theta))
-            self.bob.move_to(new_bob_pos) 
-
-        if self.bob_physics_updater_obj.updaters: self.bob_physics_updater_obj.clear_updaters()
-        self.bob_physics_updater_obj.add_updater(physics_updater_func_local)
-        if not (self.bob_physics_updater_obj in self.mobjects): self.add(self.bob_physics_updater_obj)
+        # The whole q2 schedule is known up front, so r, F_e, theta and the bob position
+        # are solved for every frame ahead of rendering; the updater only looks rows up
+        physics = dict(
+            q2_y=self.fixed_charge_final_pos_value[1], pivot=self.pivot_point, length=self.pendulum_length,
+            force_scale=self.force_scale, k_base=self.K_COULOMB_SCALED_BASE,
+            charge_factor=self.charge_product_factor_tracker.get_value(), theta_start=self.theta_equilibrium,
+        )
+        if self.pendulum_dynamics == "dynamic":
+            # Rows follow the clock the state starts with the first tracker step (create_graph_for_distance)
+            self.distance_trajectory = DynamicPendulumTrajectory.from_schedule(
+                self.parameter_tracker.get_value(), self.distance_tracker_steps(), config.frame_rate,
+                gravity=self.gravity, damping=self.damping, **physics)
+            def physics_updater_func_local(st):
+                if st.clock is None: return
+                st.r, st.Fe, _, new_bob_pos = self.distance_trajectory.state_at_time(st.clock)
+                st.move_bob(new_bob_pos)
+        else:
+            self.distance_trajectory = PendulumTrajectory.from_schedule(
+                self.parameter_tracker.get_value(), self.distance_tracker_steps(), config.frame_rate, **physics)
+            def physics_updater_func_local(st):
+                st.r, st.Fe, _, new_bob_pos = self.distance_trajectory.state_at(self.parameter_tracker.get_value())
+                st.move_bob(new_bob_pos)
+
+        self.pendulum_state.add_driver("distance_physics", physics_updater_func_local)
 
     def create_graph_for_distance(self): 
         x_axis_label_str = r"$r$"
         r_min_practical = self.bob_radius + self.fixed_charge_radius + 0.1 
         r_max_practical = 4.0 
         x_min_graph, x_max_graph = max(0.2,r_min_practical), r_max_practical
-        max_Fe_viz_for_graph = self.force_scale * np.tan(PI*0.48) * 1.2 
-        plot_function = lambda x_plot: (self.K_COULOMB_SCALED_BASE * 1.0) / (max(0.01, x_plot**2)) 
+        max_Fe_viz_for_graph = self.demo_geometry["max_Fe"] * 1.2
 
         self.active_axes = Axes(
             x_range=[x_min_graph, x_max_graph, (x_max_graph - x_min_graph) / 5], 
@@ -374,154 +466,167 @@ class CoulombPendulum(Scene):
         
         x_label_obj = self.active_axes.get_x_axis_label(Tex(x_axis_label_str, font_size=20), edge=RIGHT, direction=RIGHT, buff=0.1)
         y_label_obj = self.active_axes.get_y_axis_label(Tex("$F_e$", font_size=20).set_color(ORANGE), edge=UP, direction=UP, buff=0.1)
-        graph_plot_obj = self.active_axes.plot(plot_function, 
-                                               x_range=[self.active_axes.x_range[0], self.active_axes.x_range[1]], 
-                                               color=ORANGE, use_smoothing=True) 
+        graph_plot_obj = plot_adaptive(self.active_axes, inverse_square,
+                                       x_range=[self.active_axes.x_range[0], self.active_axes.x_range[1]],
+                                       params=(self.K_COULOMB_SCALED_BASE,), color=ORANGE)
         self.moving_dot_on_graph = Dot(color=ORANGE, radius=0.05) 
         
-        def update_graph_dot_func_local(dot):
-            x_val = self.current_r_tracker.get_value()
-            y_val = self.current_Fe_tracker.get_value() 
+        def update_graph_dot_func_local(dot, st):
+            x_val, y_val = st.r, st.Fe
             ax = self.active_axes
             if ax.x_range[0] <= x_val <= ax.x_range[1] and ax.y_range[0] <= y_val <= ax.y_range[1]:
                 dot.move_to(ax.c2p(x_val, y_val)).set_opacity(1)
             else: 
                 dot.set_opacity(0)
         
-        if self.moving_dot_on_graph.updaters: self.moving_dot_on_graph.clear_updaters()
-        self.moving_dot_on_graph.add_updater(update_graph_dot_func_local)
+        self.pendulum_state.bind("moving_dot_on_graph", self.moving_dot_on_graph, ("r", "Fe"), update_graph_dot_func_local, group="demo")
         
-        self.play(Create(self.active_axes), Write(x_label_obj), Write(y_label_obj))
-        self.play(Create(graph_plot_obj)); self.play(Create(self.moving_dot_on_graph)); self.wait(1)
-        self.current_graph_elements = VGroup(self.active_axes, x_label_obj, y_label_obj, graph_plot_obj, self.moving_dot_on_graph)
+        self.play(Create(self.active_axes), Write(x_label_obj), Write(y_label_obj), run_time=self.beat("axes"))
+        self.play(Create(graph_plot_obj), run_time=self.beat("graph"))
+        self.play(Create(self.moving_dot_on_graph), run_time=self.beat("graph_dot")); self.hold("graph_hold")
+        fitted_curve = self.create_fitted_curve()
+        if fitted_curve: self.play(Create(fitted_curve), run_time=self.beat("fitted_curve"))
+        self.current_graph_elements = VGroup(self.active_axes, x_label_obj, y_label_obj, graph_plot_obj, self.moving_dot_on_graph,
+                                             fitted_curve)
+
+        distance_narrative = self.narrate("distance_narrative")
+        self.play(self.write_narration(distance_narrative))
+
+        self.create_field_layer()
+        if self.pendulum_dynamics == "dynamic": self.pendulum_state.start_clock(self.renderer)
+        self.play_tracker_steps(self.parameter_tracker, self.distance_tracker_steps())
+        self.play(FadeOut(distance_narrative), run_time=self.beat("narration_fade"))
+
+    def create_fitted_curve(self):
+        # The measured points and the F_e curve of the q1q2 fitted to them, dashed over the model's
+        if not self.measurements: return VGroup()
+        r, theta = np.array(self.measurements).T
+        fitted_q = fit_charge(r, theta, self.K_COULOMB_SCALED_BASE, self.force_scale)["q"][0]
+        ax = self.active_axes
+        fitted_plot = plot_adaptive(ax, inverse_square, x_range=[ax.x_range[0], ax.x_range[1]],
+                                    params=(self.K_COULOMB_SCALED_BASE * fitted_q,), color=TEAL)
+        Fe = self.force_scale * np.tan(theta)
+        shown = (ax.x_range[0] <= r) & (r <= ax.x_range[1]) & (ax.y_range[0] <= Fe) & (Fe <= ax.y_range[1])
+        points = VGroup(*(Dot(ax.c2p(x, y), radius=0.04, color=TEAL) for x, y in zip(r[shown], Fe[shown])))
+        return VGroup(DashedVMobject(fitted_plot), points)
+
+    def create_field_layer(self):
+        # Field of q1 and q2 behind everything, redrawn from cached kernels as parameter_tracker moves q2
+        self.field_layer_image, self.field_lines_group = None, None
+        if not (self.field_layer or self.field_lines): return
+        state = self.pendulum_state
+        charges = lambda st: [st.charge_factor, 1.0]
+        layer = FieldLayer([state.bob_pos, state.q2_pos], charges(state), mode=self.field_layer or "magnitude")
+        lines = trace_field_lines(layer.grid, [state.bob_pos, state.q2_pos], charges(state)) if self.field_lines else None
+
+        def update_field_func_local(mob, st):
+            positions = [st.bob_pos, st.q2_pos]
+            if not layer.needs_update(positions, charges(st)): return
+            layer.update_charges(positions, charges(st))
+            if lines is not None: lines.become(trace_field_lines(layer.grid, positions, charges(st)))
+
+        state.bind("field_layer", layer, ("bob", "q2", "charge_factor"), update_field_func_local, group="demo")
+        # The state object has to come first so the layer below the pendulum is still redrawn every frame
+        self.mobjects.remove(state); self.mobjects.insert(0, state)
+        fade_in = []
+        if self.field_layer:
+            self.field_layer_image = layer
+            self.mobjects.insert(1, layer); fade_in.append(FadeIn(layer))
+        if lines is not None:
+            self.field_lines_group = lines
+            self.mobjects.insert(2 if self.field_layer else 1, lines); fade_in.append(Create(lines))
+        self.play(*fade_in, run_time=self.beat("field_layer"))
+
+    def play_tracker_steps(self, tracker, steps):
+        for step in steps:
+            if step[0] == "move": self.play(tracker.animate.set_value(step[1]), run_time=step[2])
+            else: self.wait(step[1])
+
+    def distance_tracker_steps(self):
+        # q2 x positions driven by parameter_tracker; shared by the animation, the trajectory precompute and headless_timeline
+        return list(self.demo_geometry["distance_steps"])
 
-        initial_q2_x = self.fixed_charge_final_pos_value[0]
-        final_q2_x_close = self.bob_pos_at_theta_eq[0] - (self.bob_radius + self.fixed_charge_radius + 0.3)
-        final_q2_x_far = initial_q2_x - 1.5
-        
-        distance_narrative = Tex("Variando a dist\\^ancia $r$ entre $q_1$ e $q_2$...", font_size=24).to_edge(DOWN)
-        self.play(Write(distance_narrative))
+    def demonstrate_distance_effect(self):
+        with DemoScope(self, "distance", debug=self.debug_scopes):
+            self.setup_demo_environment("distance")
+            self.create_dynamic_visuals("distance")
+            self.create_graph_for_distance()
 
-        self.play(self.parameter_tracker.animate.set_value(final_q2_x_close), run_time=3)
-        self.wait(1)
-        self.play(self.parameter_tracker.animate.set_value(final_q2_x_far), run_time=4)
-        self.wait(1)
-        self.play(self.parameter_tracker.animate.set_value(initial_q2_x), run_time=3)
-        self.wait(1)
-        self.play(FadeOut(distance_narrative))
+            self.pendulum_state.unbind("moving_dot_on_graph")
+            self.play(FadeOut(self.current_graph_elements), run_time=self.beat("graph_fade"))
+            self.remove(self.moving_dot_on_graph)
 
-    def demonstrate_distance_effect(self):
-        self.setup_demo_environment("distance")
-        self.create_dynamic_visuals("distance")
-        self.create_graph_for_distance() 
-       
-        if hasattr(self, 'current_graph_elements'):
-            self.play(FadeOut(self.current_graph_elements))
-            if hasattr(self, 'moving_dot_on_graph') and self.moving_dot_on_graph: 
-                 self.moving_dot_on_graph.clear_updaters()
-                 if self.moving_dot_on_graph in self.mobjects: self.remove(self.moving_dot_on_graph)
-            delattr(self, 'current_graph_elements') 
-
-        self.cleanup_demo_visuals("distance")
+            self.cleanup_demo_visuals("distance")
 
     def demonstrate_charge_product_effect(self):
-        self.setup_demo_environment("charge_product") 
-        self.create_dynamic_visuals("charge_product") 
+        with DemoScope(self, "charge_product", debug=self.debug_scopes):
+            self.setup_demo_environment("charge_product")
+            self.create_dynamic_visuals("charge_product")
 
-        q_factor_text = Tex("Variando o produto das cargas $(q_1q_2)$...", font_size=24).to_edge(DOWN)
-        self.play(Write(q_factor_text))
-        self.wait(1)
+            q_factor_text = self.narrate("q_factor_text")
+            self.play(self.write_narration(q_factor_text))
+            self.hold("q_factor_hold")
 
-        self.play(
-            self.charge_product_factor_tracker.animate.set_value(2.5), 
-            run_time=3
-        )
-        self.wait(1)
-        self.play(
-            self.charge_product_factor_tracker.animate.set_value(0.2),
-            run_time=3.5
-        )
-        self.wait(1)
-        self.play(
-            self.charge_product_factor_tracker.animate.set_value(1.0), 
-            run_time=2
-        )
-        self.wait(1)
-        self.play(FadeOut(q_factor_text))
+            self.play_tracker_steps(self.charge_product_factor_tracker, self.charge_product_steps)
+            self.play(FadeOut(q_factor_text), run_time=self.beat("narration_fade"))
 
-        self.cleanup_demo_visuals("charge_product")
+            self.cleanup_demo_visuals("charge_product")
 
     def cleanup_demo_visuals(self, demo_type):
-        mobjects_to_fade = []
-        if hasattr(self, 'active_proportionality_text') and self.active_proportionality_text: mobjects_to_fade.append(self.active_proportionality_text)
-        if hasattr(self, 'numerical_data_group') and self.numerical_data_group: mobjects_to_fade.append(self.numerical_data_group)
-        
-        if hasattr(self, 'dist_line_dyn') and self.dist_line_dyn:
-             self.dist_line_dyn.clear_updaters(); mobjects_to_fade.append(self.dist_line_dyn)
-        if hasattr(self, 'dist_label_r_on_line') and self.dist_label_r_on_line:
-             self.dist_label_r_on_line.clear_updaters(); mobjects_to_fade.append(self.dist_label_r_on_line)
+        # Demo dependents and drivers stop before everything the demo scope added fades out
+        self.active_scope.release_state()
+        mobjects_to_fade = self.active_scope.added_mobjects()
+        if mobjects_to_fade: self.play(*[FadeOut(elem) for elem in mobjects_to_fade], run_time=self.beat("demo_fade"))
 
-        if hasattr(self, 'dynamic_Fe_vec') and self.dynamic_Fe_vec: mobjects_to_fade.append(self.dynamic_Fe_vec)
-        if hasattr(self, 'dynamic_Fe_label') and self.dynamic_Fe_label: mobjects_to_fade.append(self.dynamic_Fe_label)
-        
-        mobjects_to_fade = [m for m in mobjects_to_fade if m and m in self.mobjects]
-        if mobjects_to_fade: self.play(*[FadeOut(elem) for elem in mobjects_to_fade])
-        
-        if hasattr(self, 'bob_physics_updater_obj'):
-            self.bob_physics_updater_obj.clear_updaters()
-            if self.bob_physics_updater_obj in self.mobjects: self.remove(self.bob_physics_updater_obj)
-            delattr(self, 'bob_physics_updater_obj')
-
-        if hasattr(self, 'charge_product_specific_physics_updater'): 
-            self.charge_product_specific_physics_updater.clear_updaters()
-            if self.charge_product_specific_physics_updater in self.mobjects: self.remove(self.charge_product_specific_physics_updater)
-            delattr(self, 'charge_product_specific_physics_updater')
-
-        if hasattr(self, 'dynamic_Fe_elements_updater_obj'):
-            self.dynamic_Fe_elements_updater_obj.clear_updaters()
-            if self.dynamic_Fe_elements_updater_obj in self.mobjects: self.remove(self.dynamic_Fe_elements_updater_obj)
-    
-        elements_to_clear_demo_updaters = [self.fixed_charge]
-        if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1: elements_to_clear_demo_updaters.append(self.plus_sign_q1)
-        if self.plus_sign_q2: elements_to_clear_demo_updaters.append(self.plus_sign_q2)
-        
-        for mobj in elements_to_clear_demo_updaters:
-            if mobj and hasattr(mobj, 'clear_updaters'): mobj.clear_updaters()
-
-        if hasattr(self, 'plus_sign_q1') and self.plus_sign_q1 and hasattr(self, 'original_plus_q1_height'):
-            self.plus_sign_q1.set_height(self.original_plus_q1_height)
-        if self.plus_sign_q2 and hasattr(self, 'original_plus_q2_height'):
-            self.plus_sign_q2.set_height(self.original_plus_q2_height)
-        self.setup_pendulum_updaters() 
-        
-        if hasattr(self.fixed_charge_center, 'add_updater'): self.fixed_charge_center.add_updater(lambda m: m.move_to(self.fixed_charge.get_center()))
-        if hasattr(self.fixed_charge_label, 'add_updater'): self.fixed_charge_label.add_updater(lambda m: m.next_to(self.fixed_charge, DOWN, buff=0.15))
-        if hasattr(self.plus_sign_q2, 'add_updater'): self.plus_sign_q2.add_updater(lambda p: p.move_to(self.fixed_charge.get_center()))
-        
-        if hasattr(self, 'charge_product_factor_tracker'): self.charge_product_factor_tracker.set_value(1.0)
+        if self.plus_sign_q1: self.plus_sign_q1.set_height(self.original_plus_q1_height)
+        self.plus_sign_q2.set_height(self.original_plus_q2_height)
+        self.setup_pendulum_updaters()
+        self.charge_product_factor_tracker.set_value(1.0)
 
         target_q2_pos = self.fixed_charge_final_pos_value
         if np.linalg.norm(self.fixed_charge.get_center() - target_q2_pos) > 0.01:
-            self.play(self.fixed_charge.animate.move_to(target_q2_pos), run_time=0.5)
+            self.play(self.fixed_charge.animate.move_to(target_q2_pos), run_time=self.beat("return_q2"))
         
         final_bob_pos_after_demo = self.bob_pos_at_theta_eq 
         if np.linalg.norm(self.bob.get_center() - final_bob_pos_after_demo) > 0.01:
-            self.play(self.bob.animate.move_to(final_bob_pos_after_demo), run_time=1)
+            self.play(self.bob.animate.move_to(final_bob_pos_after_demo), run_time=self.beat("return_bob"))
         
-        self.wait(0.5)
+        self.hold("demo_hold")
+
+    def create_charge_system_mobjects(self, system):
+        # One VGroup per charge: [pivot, string,] sphere, sign
+        groups = []
+        positions = system.positions()
+        for i, q in enumerate(system.q):
+            position = np.append(positions[i], 0)
+            radius = self.bob_radius if system.is_pendulum[i] else self.fixed_charge_radius
+            sphere = Circle(radius=radius, fill_opacity=0.8, color=RED_E if q > 0 else BLUE_E, stroke_width=2).move_to(position)
+            sign = MathTex("+" if q > 0 else "-", font_size=20, color=WHITE).move_to(position)
+            parts = [sphere, sign]
+            if system.is_pendulum[i]:
+                pivot = np.append(system.pivots[i], 0)
+                parts = [Dot(pivot, color=GRAY, radius=0.08), Line(pivot, position, stroke_width=2, color=WHITE)] + parts
+            groups.append(VGroup(*parts))
+        return groups
+
+    def update_charge_system_mobjects(self, system, groups):
+        positions = system.positions()
+        for i, group in enumerate(groups):
+            position = np.append(positions[i], 0)
+            if system.is_pendulum[i]: group[1].put_start_and_end_on(np.append(system.pivots[i], 0), position)
+            group[-2].move_to(position); group[-1].move_to(position)
 
     def explain_coulomb_law(self):
-        coulomb_title = Tex("Lei de Coulomb", font_size=40).set_weight(BOLD).to_edge(UP, buff=0.5)
-        self.play(Transform(self.title, coulomb_title))
+        self.transform_title("coulomb_title")
 
         bob_final_pos = self.bob_pos_at_theta_eq 
         if np.linalg.norm(self.bob.get_center() - bob_final_pos) > 0.01:
-            self.play(self.bob.animate.move_to(bob_final_pos))
+            self.play(self.bob.animate.move_to(bob_final_pos), run_time=self.beat("restore_bob"))
         
         fixed_charge_pos = self.fixed_charge_final_pos_value
         if np.linalg.norm(self.fixed_charge.get_center() - fixed_charge_pos) > 0.01:
-            self.play(self.fixed_charge.animate.move_to(fixed_charge_pos))
-        self.wait(0.2) 
+            self.play(self.fixed_charge.animate.move_to(fixed_charge_pos), run_time=self.beat("restore_q2"))
+        self.hold("settle_hold")
 
         static_Fe_magnitude = self.force_scale * np.tan(self.theta_equilibrium)
         final_Fe_arrow = Arrow(self.bob.get_center(), self.bob.get_center() + RIGHT * static_Fe_magnitude, buff=0, color=ORANGE, stroke_width=6)
@@ -534,42 +639,91 @@ class CoulombPendulum(Scene):
             Create(final_Fe_arrow), Write(final_Fe_label),
             Create(final_dist_line), Write(final_dist_label),
             lag_ratio=0.5
-        ))
-        self.wait(1)
+        ), run_time=self.beat("final_vectors"))
+        self.hold("final_vectors_hold")
 
-        summary_text = Tex(r"Das observa\c{c}\~oes:", font_size=30, color=WHITE).to_corner(UL, buff=0.5).shift(DOWN * (self.title.height + 0.5))
-        self.play(Write(summary_text))
+        summary_text = self.narrate("summary_text", color=WHITE)
+        self.play(self.write_narration(summary_text))
+        # Below where the reference locale's summary ends, so the formulas sit alike in every locale
+        summary_bottom_left = summary_text.get_corner(UL) + DOWN * summary_text.reference_size[1]
         
         props = VGroup(
             MathTex(r"F_e \propto q_1 q_2", font_size=30, tex_to_color_map={"q_1 q_2": BLUE_D, "F_e": ORANGE}),
             MathTex(r"F_e \propto \frac{1}{r^2}", font_size=30, tex_to_color_map={"r^2": YELLOW_D, "F_e": ORANGE})
-        ).arrange(DOWN, buff=0.3, aligned_edge=LEFT).next_to(summary_text, DOWN, buff=0.3, aligned_edge=LEFT)
+        ).arrange(DOWN, buff=0.3, aligned_edge=LEFT).next_to(summary_bottom_left, DOWN, buff=0.3, aligned_edge=LEFT)
         
-        self.play(Write(props[0])); self.wait(1)
-        self.play(Write(props[1])); self.wait(1)
+        self.play(Write(props[0]), run_time=self.beat("prop_q")); self.hold("prop_q_hold")
+        self.play(Write(props[1]), run_time=self.beat("prop_r")); self.hold("prop_r_hold")
         
         prop_combined = MathTex(r"F_e \propto \frac{q_1 q_2}{r^2}", font_size=36, color=GOLD).next_to(props, DOWN, buff=0.4, aligned_edge=LEFT) 
-        self.play(Write(prop_combined)); self.wait(1)
+        self.play(Write(prop_combined), run_time=self.beat("prop_combined")); self.hold("prop_combined_hold")
         
         coulomb_law_final_formula = MathTex(r"F_e = k \frac{|q_1 q_2|}{r^2}", font_size=38, color=GOLD)
-        k_explanation_final = Tex(r"onde $k$ é a constante de Coulomb ($k \approx 8.99 \times 10^9 \, \text{N}\cdot\text{m}^2/\text{C}^2$)", font_size=22, color=WHITE)
+        k_explanation_final = self.narrate("k_explanation_final", color=WHITE)
         
-        final_law_group = VGroup(coulomb_law_final_formula, k_explanation_final).arrange(DOWN, buff=0.3)
-        final_law_group.to_edge(DOWN, buff=1.0)
+        # Laid out around a box of the reference locale's size, which keeps the formula in place across locales
+        k_explanation_slot = Rectangle(width=k_explanation_final.reference_size[0], height=k_explanation_final.reference_size[1])
+        VGroup(coulomb_law_final_formula, k_explanation_slot).arrange(DOWN, buff=0.3).to_edge(DOWN, buff=1.0)
+        final_law_group = VGroup(coulomb_law_final_formula, k_explanation_final)
 
         law_box = SurroundingRectangle(coulomb_law_final_formula, buff=0.2, color=GOLD, stroke_width=2)
         
         prop_combined_copy = prop_combined.copy()
         self.play(
             ReplacementTransform(prop_combined_copy, coulomb_law_final_formula.move_to(final_law_group[0])), 
-            Create(law_box)
+            Create(law_box),
+            run_time=self.beat("law")
         )
         if prop_combined in self.mobjects: self.remove(prop_combined) 
         self.add(coulomb_law_final_formula)
 
-        self.play(Write(k_explanation_final.move_to(final_law_group[1]))); self.wait(5)
-
-        self.play(FadeOut(final_Fe_arrow), FadeOut(final_Fe_label), FadeOut(final_dist_line), FadeOut(final_dist_label))
-        self.wait(1)
-        self.play(FadeOut(summary_text), FadeOut(props), FadeOut(prop_combined_copy), FadeOut(final_law_group), FadeOut(law_box))
-        self.wait(2) 
\ No newline at end of file
+        self.play(self.write_narration(k_explanation_final.move_to(k_explanation_slot))); self.hold("law_hold")
+
+        self.play(FadeOut(final_Fe_arrow), FadeOut(final_Fe_label), FadeOut(final_dist_line), FadeOut(final_dist_label),
+                  run_time=self.beat("fade_vectors"))
+        self.hold("fade_vectors_hold")
+        self.play(FadeOut(summary_text), FadeOut(props), FadeOut(prop_combined_copy), FadeOut(final_law_group), FadeOut(law_box),
+                  run_time=self.beat("fade_all"))
+        self.hold("end_hold")
+
+class TwoPendulumRepulsion(CoulombPendulum):
+    STAGES = ("show_two_pendulum_system",)
+
+    def show_two_pendulum_system(self):
+        title = self.narrate("two_pendulum_title")
+        self.play(self.write_narration(title))
+
+        system = ChargeSystem(k=0.4, cutoff=12)
+        for side in (LEFT, RIGHT):
+            system.add_pendulum(self.pivot_point + side * 0.6, self.pendulum_length, 1.0, weight=self.force_scale)
+        rest_y = self.pivot_point[1] - self.pendulum_length - 0.6
+        q3 = system.add_fixed([-6, rest_y], -1.5, name="q3")
+        system.equilibrium()
+
+        groups = self.create_charge_system_mobjects(system)
+        self.play(*[Create(group) for group in groups], run_time=self.beat("charges")); self.hold("charges_hold")
+
+        q3_x_tracker = ValueTracker(-6)
+        system_updater_obj = Mobject()
+        if self.pendulum_dynamics == "dynamic":
+            # Both pendulums swing as q3 passes; a time-based updater also keeps the waits moving
+            omegas = None
+            def system_updater_func(mobj, dt):
+                nonlocal omegas
+                system.set_fixed_position(q3, [q3_x_tracker.get_value(), rest_y])
+                if dt > 0:
+                    substeps = int(np.ceil(dt * 240))
+                    omegas = system.integrate(dt, dt / substeps, self.gravity, self.damping, omegas)[1]
+                self.update_charge_system_mobjects(system, groups)
+        else:
+            def system_updater_func(mobj):
+                system.set_fixed_position(q3, [q3_x_tracker.get_value(), rest_y])
+                system.equilibrium() # warm-started from the previous frame's angles
+                self.update_charge_system_mobjects(system, groups)
+        system_updater_obj.add_updater(system_updater_func)
+        self.mobjects.insert(0, system_updater_obj) # ahead of the groups so they are redrawn every frame
+
+        self.play(q3_x_tracker.animate.set_value(0), run_time=self.beat("q3_in")); self.hold("q3_in_hold")
+        self.play(q3_x_tracker.animate.set_value(6), run_time=self.beat("q3_out")); self.hold("q3_out_hold")
+        self.remove(system_updater_obj)
+        self.play(*[FadeOut(group) for group in groups], FadeOut(title), run_time=self.beat("fade"))
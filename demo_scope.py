@@ -0,0 +1,100 @@
+"""Scoped lifetime of the mobjects, updaters and state bindings a demo creates.
+
+``DemoScope`` snapshots the scene when it is entered: which mobjects are on
+screen, the updaters of every family member, and the drivers and dependents
+of the ``PendulumSceneState``. On exit everything added since is torn down:
+new drivers and dependents of the scope's state group are dropped, updaters
+added to pre-existing mobjects are removed and mobjects still on screen are
+removed with their updaters cleared. Inside the scope, ``added_mobjects()``
+lists what the demo put on screen, so cleanup code needs no bookkeeping.
+
+With ``debug`` on, each scope logs what it found on exit (leaked mobjects,
+updaters and bindings that its own cleanup missed), the number of family
+members on screen and the traced memory growth since it was entered. Memory
+tracing is started by the outermost debug scope and stopped when it exits,
+unless something else (the profiler's ``trace_memory``) was tracing already.
+"""
+import tracemalloc
+
+from manim import logger
+
+
+class DemoScope:
+    def __init__(self, scene, name, teardown=True, debug=False, state_group="demo"):
+        self.scene, self.name = scene, name
+        self.teardown, self.debug, self.state_group = teardown, debug, state_group
+        self.started_tracing = False
+
+    def __enter__(self):
+        scene = self.scene
+        self.mobjects_before = list(scene.mobjects)
+        # Strong references keep ids from being reused by new mobjects while the scope is open
+        self.updaters_before = {id(member): (member, list(member.get_updaters()))
+                                for mob in scene.mobjects for member in mob.get_family()}
+        state = getattr(scene, "pendulum_state", None)
+        self.drivers_before = set(state.drivers) if state else set()
+        self.dependents_before = set(state.dependents) if state else set()
+        self.members_before = len(self.updaters_before)
+        if self.debug:
+            self.started_tracing = not tracemalloc.is_tracing()
+            if self.started_tracing: tracemalloc.start()
+            self.memory_before = tracemalloc.get_traced_memory()[0]
+        self.parent, scene.active_scope = getattr(scene, "active_scope", None), self
+        return self
+
+    def added_mobjects(self):
+        before = set(map(id, self.mobjects_before))
+        return [mob for mob in self.scene.mobjects if id(mob) not in before]
+
+    def added_updaters(self):
+        added = []
+        for mob in self.scene.mobjects:
+            for member in mob.get_family():
+                entry = self.updaters_before.get(id(member))
+                if entry is None: continue
+                added.extend((member, updater) for updater in member.get_updaters() if updater not in entry[1])
+        return added
+
+    def added_bindings(self):
+        state = getattr(self.scene, "pendulum_state", None)
+        if state is None: return [], []
+        drivers = [name for name in state.drivers if name not in self.drivers_before]
+        dependents = [name for name, entry in state.dependents.items()
+                      if entry[3] == self.state_group and name not in self.dependents_before]
+        return drivers, dependents
+
+    def release_state(self):
+        """Stop the drivers and dependents added in this scope, before their mobjects fade out."""
+        state = getattr(self.scene, "pendulum_state", None)
+        if state is None: return
+        drivers, dependents = self.added_bindings()
+        for name in drivers: state.drivers.pop(name, None)
+        if not state.drivers: state.stop_clock()
+        state.unbind(*dependents)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.scene.active_scope = self.parent
+        leaked_mobjects, leaked_updaters = self.added_mobjects(), self.added_updaters()
+        leaked_drivers, leaked_dependents = self.added_bindings()
+        if self.debug: self.report(leaked_mobjects, leaked_updaters, leaked_drivers, leaked_dependents)
+        if self.started_tracing: tracemalloc.stop()
+        if not self.teardown: return False
+
+        self.release_state()
+        for member, updater in leaked_updaters: member.remove_updater(updater)
+        for mob in leaked_mobjects:
+            for member in mob.get_family(): member.clear_updaters()
+        if leaked_mobjects: self.scene.remove(*leaked_mobjects)
+        return False
+
+    def report(self, mobjects, updaters, drivers, dependents):
+        members = sum(len(mob.get_family()) for mob in self.scene.mobjects)
+        growth = (tracemalloc.get_traced_memory()[0] - self.memory_before) / 2**20
+        label = "left" if self.teardown else "added"
+        logger.info(
+            "Scope %s: %d mobjects %s (%s), %d updaters %s, drivers %s, dependents %s; "
+            "%d family members on screen (%+d), memory %+.1f MB",
+            self.name, len(mobjects), label, ", ".join(type(mob).__name__ for mob in mobjects) or "-",
+            len(updaters), label, drivers or "-", dependents or "-",
+            members, members - self.members_before, growth,
+        )
@@ -0,0 +1,96 @@
+from manim import DEFAULT_FONT_SIZE, WHITE, MathTex, VectorizedPoint, VGroup
+import numpy as np
+
+DIGITS = "0123456789"
+DIGIT_BUFF_PER_FONT_UNIT = 0.001 # same spacing DecimalNumber uses
+_ATLASES = {}
+
+
+def glyph_atlas(font_size=DEFAULT_FONT_SIZE, color=WHITE):
+    # Typeset each readout glyph once per font size and colour; readouts only copy them
+    key = (font_size, str(color))
+    if key not in _ATLASES:
+        _ATLASES[key] = {char: MathTex(char, font_size=font_size, color=color) for char in DIGITS + ".-"}
+    return _ATLASES[key]
+
+
+class GlyphReadout(VGroup):
+    """Numeric readout assembled from pre-typeset glyphs.
+
+    A drop-in for ``DecimalNumber`` in the demo readouts. Digits sit in fixed-width
+    cells, so where each character goes depends only on the sign and the number of
+    integer digits. Every (layout, slot, character) glyph is built once; after that
+    ``set_value`` only swaps references in ``submobjects``, with no LaTeX and no
+    re-layout, and does nothing at all when the formatted text is unchanged.
+    The readout follows translations of itself; scaling or recolouring it after
+    creation only affects the glyphs currently shown.
+    """
+
+    def __init__(self, number=0, num_decimal_places=2, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.glyphs = glyph_atlas(font_size, color)
+        self.buff = DIGIT_BUFF_PER_FONT_UNIT * font_size
+        self.cell_width = max(self.glyphs[d].width for d in DIGITS)
+        self.digit_height = max(self.glyphs[d].height for d in DIGITS)
+        self.anchor = VectorizedPoint() # bottom-left of the readout; moves with the group
+        self._layouts = {}
+        self._placed = {}
+        self._text = None
+        self.number = number
+        self.set_value(number)
+
+    def _advance(self, char):
+        return self.cell_width if char in DIGITS else self.glyphs[char].width
+
+    def _layout(self, text):
+        pattern = (text.startswith("-"), text.index(".") if "." in text else len(text))
+        if pattern not in self._layouts:
+            centers, x = [], 0.0
+            for char in text:
+                advance = self._advance(char)
+                centers.append(x + advance / 2)
+                x += advance + self.buff
+            self._layouts[pattern] = centers
+        return pattern, self._layouts[pattern]
+
+    def _glyph(self, pattern, slot, char, x_center):
+        anchor = self.anchor.get_center()
+        placed = self._placed.get((pattern, slot, char))
+        if placed is None:
+            glyph = self.glyphs[char].copy()
+            y_center = self.digit_height / 2 if char == "-" else glyph.height / 2
+            glyph.move_to(anchor + np.array([x_center, y_center, 0]))
+            self._placed[(pattern, slot, char)] = [glyph, anchor]
+            return glyph
+        glyph, placed_anchor = placed
+        if not np.array_equal(anchor, placed_anchor): # the readout moved since this glyph was last shown
+            glyph.shift(anchor - placed_anchor)
+            placed[1] = anchor
+        return glyph
+
+    def set_value(self, number):
+        text = f"{number:.{self.num_decimal_places}f}"
+        self.number = number
+        if text == self._text: return self
+        pattern, centers = self._layout(text)
+        self.submobjects = [self.anchor] + [
+            self._glyph(pattern, slot, char, x_center) for slot, (char, x_center) in enumerate(zip(text, centers))
+        ]
+        self._text = text
+        return self
+
+    def get_value(self):
+        return self.number
+
+    def increment_value(self, delta_t):
+        return self.set_value(self.number + delta_t)
+
+    def prebuild(self, max_integer_digits=3):
+        # Optionally build every layout up front so no copy happens during playback
+        current = self.number
+        for n_int in range(1, max_integer_digits + 1):
+            for sign in ("", "-"):
+                for digit in DIGITS:
+                    self.set_value(float(sign + digit * n_int + "." + digit * self.num_decimal_places))
+        return self.set_value(current)
@@ -0,0 +1,115 @@
+"""Field of point charges on a fixed grid, for the field layer (field_layer.py).
+
+Only NumPy is needed here, so the kernels and traced field lines can be checked
+without manim.
+"""
+import numpy as np
+
+from charge_system import DEFAULT_MIN_DISTANCE
+
+# Colour stops (position in [0, 1], RGB) for the field magnitude and the signed potential
+MAGNITUDE_STOPS = ((0.0, (0, 0, 0)), (0.35, (40, 20, 90)), (0.7, (200, 60, 40)), (1.0, (255, 220, 120)))
+POTENTIAL_STOPS = ((0.0, (40, 90, 230)), (0.5, (0, 0, 0)), (1.0, (230, 60, 40)))
+
+
+def apply_colormap(values, stops, opacity=1.0):
+    positions = [p for p, _ in stops]
+    rgba = np.empty(values.shape + (4,), dtype=np.uint8)
+    for channel in range(3):
+        rgba[..., channel] = np.interp(values, positions, [c[channel] for _, c in stops])
+    rgba[..., 3] = int(255 * opacity)
+    return rgba
+
+
+class FieldGrid:
+    """Field of point charges on a fixed grid, updated incrementally from kernel slices."""
+
+    def __init__(self, x_range, y_range, width, height, k=1.0, min_distance=DEFAULT_MIN_DISTANCE):
+        self.x_min, self.x_max = x_range
+        self.y_min, self.y_max = y_range
+        self.width, self.height, self.k = width, height, k
+        self.pixel_size = np.array([(self.x_max - self.x_min) / width, (self.y_max - self.y_min) / height])
+        # Kernels of a unit charge at offsets -(n-1) .. (n-1) pixels; row 0 is the top of the image
+        dx = np.arange(-(width - 1), width) * self.pixel_size[0]
+        dy = -np.arange(-(height - 1), height) * self.pixel_size[1]
+        DX, DY = np.meshgrid(dx, dy)
+        r = np.maximum(np.hypot(DX, DY), min_distance)
+        self.kernels = {"Ex": k * DX / r**3, "Ey": k * DY / r**3, "V": k / r}
+        self.charges = {}
+        self.totals = {name: np.zeros((height, width)) for name in self.kernels}
+
+    def pixel_of(self, position):
+        col = int(round((position[0] - self.x_min) / self.pixel_size[0] - 0.5))
+        row = int(round((self.y_max - position[1]) / self.pixel_size[1] - 0.5))
+        return row, col
+
+    def _contribution(self, name, pixel, q):
+        row, col = np.clip(pixel[0], 0, self.height - 1), np.clip(pixel[1], 0, self.width - 1)
+        top, left = self.height - 1 - row, self.width - 1 - col
+        return q * self.kernels[name][top:top + self.height, left:left + self.width]
+
+    def set_charge(self, key, position, q):
+        # Returns True when the grid changed; charges off the grid are pinned to its border
+        pixel = self.pixel_of(position)
+        previous = self.charges.get(key)
+        if previous is not None and previous[0] == pixel and previous[1] == q: return False
+        for name in self.kernels:
+            if previous is not None: self.totals[name] -= self._contribution(name, *previous)
+            self.totals[name] += self._contribution(name, pixel, q)
+        self.charges[key] = (pixel, q)
+        return True
+
+    def magnitude(self):
+        return np.hypot(self.totals["Ex"], self.totals["Ey"])
+
+    def sample_field(self, points):
+        # Bilinear field at scene points (N, 2); vectorized over points
+        cols = np.clip((points[:, 0] - self.x_min) / self.pixel_size[0] - 0.5, 0, self.width - 1.001)
+        rows = np.clip((self.y_max - points[:, 1]) / self.pixel_size[1] - 0.5, 0, self.height - 1.001)
+        c0, r0 = cols.astype(int), rows.astype(int)
+        fc, fr = cols - c0, rows - r0
+        field = []
+        for name in ("Ex", "Ey"):
+            grid = self.totals[name]
+            top = grid[r0, c0] * (1 - fc) + grid[r0, c0 + 1] * fc
+            bottom = grid[r0 + 1, c0] * (1 - fc) + grid[r0 + 1, c0 + 1] * fc
+            field.append(top * (1 - fr) + bottom * fr)
+        return np.stack(field, axis=-1)
+
+
+def trace_field_paths(grid, positions, charges, lines_per_charge=12, step=0.05, max_steps=240, seed_radius=0.3):
+    """Field lines leaving the positive charges, traced through the grid's cached field.
+
+    All seeds are advanced together (midpoint steps along the normalised field);
+    a line stops when it leaves the grid or reaches another charge. Returns one
+    ``(n, 2)`` array of points per line that moved at least two steps.
+    """
+    positions = np.asarray(positions, dtype=float)[:, :2]
+    angles = np.linspace(0, 2 * np.pi, lines_per_charge, endpoint=False)
+    seeds = [p + seed_radius * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+             for p, q in zip(positions, charges) if q > 0]
+    if not seeds: return []
+    points = np.concatenate(seeds)
+    alive = np.ones(len(points), dtype=bool)
+    paths = [points.copy()]
+
+    def direction(at):
+        field = grid.sample_field(at)
+        return field / np.maximum(np.linalg.norm(field, axis=1, keepdims=True), 1e-12)
+
+    for _ in range(max_steps):
+        midpoint = points + 0.5 * step * direction(points)
+        points = np.where(alive[:, None], points + step * direction(midpoint), points)
+        inside = (grid.x_min < points[:, 0]) & (points[:, 0] < grid.x_max) & (grid.y_min < points[:, 1]) & (points[:, 1] < grid.y_max)
+        near_charge = (np.linalg.norm(points[:, None, :] - positions[None, :, :], axis=-1) < 0.5 * seed_radius).any(axis=1)
+        alive &= inside & ~near_charge
+        paths.append(points.copy())
+        if not alive.any(): break
+
+    lines = []
+    for path in np.stack(paths, axis=1):
+        # Drop the frozen tail of lines that stopped early
+        moving = np.any(np.diff(path, axis=0) != 0, axis=1)
+        end = (np.nonzero(moving)[0].max() + 2) if moving.any() else 1
+        if end >= 3: lines.append(path[:end])
+    return lines
@@ -0,0 +1,77 @@
+"""Electric field / potential background layer built from cached kernel grids.
+
+For a unit charge the field components and the potential are tabulated once on
+a grid twice the size of the layer. A charge sitting on pixel ``(i, j)`` then
+contributes a shifted slice of those kernels, so the layer is updated by adding
+``q * (new_slice - old_slice)`` for the charges that moved, and only once one of
+them has moved farther than ``tolerance``.
+"""
+from manim import ImageMobject, VGroup, VMobject, WHITE, config
+import numpy as np
+
+from field_grid import MAGNITUDE_STOPS, POTENTIAL_STOPS, FieldGrid, apply_colormap, trace_field_paths
+
+
+class FieldLayer(ImageMobject):
+    """Image of the field magnitude or potential of a few charges, kept behind the scene.
+
+    ``update_charges`` only touches the pixels' sums when some charge moved more
+    than ``tolerance`` scene units (or changed value) since the layer was last drawn.
+    """
+
+    def __init__(self, positions, charges, mode="magnitude", resolution=192, k=1.0, tolerance=0.05,
+                 opacity=0.6, x_range=None, y_range=None, **kwargs):
+        if mode not in ("magnitude", "potential"): raise ValueError(f"Unknown field layer mode {mode!r}")
+        x_range = x_range or (-config.frame_width / 2, config.frame_width / 2)
+        y_range = y_range or (-config.frame_height / 2, config.frame_height / 2)
+        width = resolution
+        height = max(int(round(resolution * (y_range[1] - y_range[0]) / (x_range[1] - x_range[0]))), 1)
+        self.grid = FieldGrid(x_range, y_range, width, height, k=k)
+        self.mode, self.tolerance, self.layer_opacity = mode, tolerance, opacity
+        self._drawn = None
+        for key, (position, q) in enumerate(zip(positions, charges)): self.grid.set_charge(key, position, q)
+        self._scale = self._reference_scale()
+        super().__init__(self._render_pixels(), **kwargs)
+        self.stretch_to_fit_width(x_range[1] - x_range[0])
+        self.stretch_to_fit_height(y_range[1] - y_range[0])
+        self.move_to([(x_range[0] + x_range[1]) / 2, (y_range[0] + y_range[1]) / 2, 0])
+        self._drawn = [(np.asarray(p, dtype=float)[:2], q) for p, q in zip(positions, charges)]
+
+    def _reference_scale(self):
+        # Normalisation fixed at creation, so the layer brightens and dims as charges move
+        values = self.grid.magnitude() if self.mode == "magnitude" else np.abs(self.grid.totals["V"])
+        return max(np.percentile(values, 99), 1e-9)
+
+    def _render_pixels(self):
+        if self.mode == "magnitude":
+            values = np.log1p(9 * np.clip(self.grid.magnitude() / self._scale, 0, 1)) / np.log(10)
+            return apply_colormap(values, MAGNITUDE_STOPS, self.layer_opacity)
+        values = 0.5 + 0.5 * np.tanh(self.grid.totals["V"] / self._scale)
+        return apply_colormap(values, POTENTIAL_STOPS, self.layer_opacity)
+
+    def needs_update(self, positions, charges):
+        if self._drawn is None or len(positions) != len(self._drawn): return True
+        return any(
+            np.linalg.norm(np.asarray(p, dtype=float)[:2] - drawn_p) > self.tolerance or q != drawn_q
+            for p, q, (drawn_p, drawn_q) in zip(positions, charges, self._drawn)
+        )
+
+    def update_charges(self, positions, charges):
+        if not self.needs_update(positions, charges): return self
+        changed = False
+        for key, (position, q) in enumerate(zip(positions, charges)):
+            changed |= self.grid.set_charge(key, position, q)
+        if changed: self.pixel_array = self._render_pixels()
+        self._drawn = [(np.asarray(p, dtype=float)[:2], q) for p, q in zip(positions, charges)]
+        return self
+
+
+def trace_field_lines(grid, positions, charges, lines_per_charge=12, step=0.05, max_steps=240, seed_radius=0.3,
+                      color=WHITE, stroke_width=1.5, stroke_opacity=0.6):
+    """Field lines leaving the positive charges (``trace_field_paths``) as a group of polylines."""
+    lines = VGroup()
+    for path in trace_field_paths(grid, positions, charges, lines_per_charge, step, max_steps, seed_radius):
+        line = VMobject(color=color, stroke_width=stroke_width, stroke_opacity=stroke_opacity)
+        line.set_points_as_corners(np.column_stack([path, np.zeros(len(path))]))
+        lines.add(line)
+    return lines
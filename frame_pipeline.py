@@ -0,0 +1,121 @@
+"""Bounded producer/consumer pipeline between rasterization and ffmpeg.
+
+manim's ``SceneFileWriter.write_frame`` copies every frame with ``tobytes()``
+and blocks the render loop on ffmpeg's stdin. ``FramePipeline`` replaces it
+with a put into a bounded queue: the render loop keeps rasterizing while a
+worker thread views each frame as raw bytes (a ``memoryview``, no copy) and
+writes it to the ffmpeg process of the animation the frame belongs to. When
+the encoder falls behind, the queue fills and the render loop waits
+(backpressure), so memory stays bounded by ``depth`` frames. The queue is
+drained before manim closes an animation's movie pipe.
+
+Frames handed to ``write_frame`` are never modified afterwards (the Cairo
+renderer returns a fresh array per frame and reuses one static image for
+waits), so they can be queued without copying.
+"""
+import queue
+import threading
+import time
+from collections import defaultdict
+
+_STOP = object()
+
+
+class FramePipeline:
+    def __init__(self, file_writer, depth=8):
+        self.file_writer = file_writer
+        self.depth = depth
+        self.frames = queue.Queue(maxsize=depth)
+        self.stage = None
+        self.stats = defaultdict(lambda: defaultdict(float)) # stage -> frames, produce_s, blocked_s, convert_s, write_s
+        self._error = None
+        self._last_put = None
+        self._worker = None
+        self._originals = {}
+        self.profiler = None # a RenderProfiler records each write to ffmpeg as "encode" when set
+
+    def install(self):
+        writer = self.file_writer
+        self._originals = {"write_frame": writer.write_frame, "close_movie_pipe": writer.close_movie_pipe}
+        writer.write_frame = self.write_frame
+        writer.close_movie_pipe = self.close_movie_pipe
+        self._worker = threading.Thread(target=self._run, name="frame-pipeline", daemon=True)
+        self._worker.start()
+        return self
+
+    def write_frame(self, frame):
+        process = getattr(self.file_writer, "writing_process", None)
+        if process is None or process.stdin is None or process.poll() is not None:
+            return self._originals["write_frame"](frame) # image output or no movie pipe open
+        self._raise_worker_error()
+        now = time.perf_counter()
+        stats = self.stats[self.stage]
+        if self._last_put is not None: stats["produce_s"] += now - self._last_put
+        self.frames.put((frame, process.stdin, self.stage)) # blocks while the encoder is `depth` frames behind
+        self._last_put = time.perf_counter()
+        stats["blocked_s"] += self._last_put - now
+        stats["frames"] += 1
+
+    def close_movie_pipe(self):
+        self.drain()
+        self._last_put = None
+        return self._originals["close_movie_pipe"]()
+
+    def drain(self):
+        self.frames.join()
+        self._raise_worker_error()
+
+    def close(self):
+        if self._worker is None: return
+        self.frames.put(_STOP)
+        self._worker.join()
+        self._worker = None
+        for name, original in self._originals.items(): setattr(self.file_writer, name, original)
+        self._raise_worker_error()
+
+    def _raise_worker_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("frame pipeline worker failed") from error
+
+    def _run(self):
+        while True:
+            item = self.frames.get()
+            try:
+                if item is _STOP: return
+                frame, stdin, stage = item
+                if self._error is not None: continue # keep draining so the producer never deadlocks
+                stats = self.stats[stage]
+                started = time.perf_counter()
+                buffer = memoryview(frame).cast("B") if frame.flags.c_contiguous else memoryview(frame.tobytes())
+                converted = time.perf_counter()
+                stdin.write(buffer)
+                written = time.perf_counter()
+                stats["convert_s"] += converted - started
+                stats["write_s"] += written - converted
+                if self.profiler is not None: self.profiler.record("encode", written - started)
+            except Exception as error:
+                self._error = error
+            finally:
+                self.frames.task_done()
+
+    def report(self):
+        """Per-stage frame counts, seconds and frames/s of the producer and the encoder side."""
+        rows = {}
+        for stage, stats in self.stats.items():
+            frames = int(stats["frames"])
+            rate = lambda seconds: round(frames / seconds, 1) if seconds > 0 else None
+            rows[stage or "-"] = {
+                "frames": frames,
+                "produce_s": round(stats["produce_s"], 3), "blocked_s": round(stats["blocked_s"], 3),
+                "convert_s": round(stats["convert_s"], 3), "write_s": round(stats["write_s"], 3),
+                "produce_fps": rate(stats["produce_s"]), "encode_fps": rate(stats["convert_s"] + stats["write_s"]),
+            }
+        return rows
+
+    def format_report(self):
+        lines = [f"{'stage':<45} {'frames':>6} {'produce fps':>11} {'encode fps':>10} {'blocked s':>9}"]
+        for stage, row in self.report().items():
+            lines.append(f"{stage:<45} {row['frames']:>6} {row['produce_fps'] or '-':>11} "
+                         f"{row['encode_fps'] or '-':>10} {row['blocked_s']:>9}")
+        return "\n".join(lines)
@@ -0,0 +1,187 @@
+"""The values CoulombPendulum shows on screen, frame by frame, without rendering.
+
+Replays the tracker schedules of the two demos (``distance_tracker_steps`` in
+``demonstrate_distance_effect`` and ``charge_product_steps`` in
+``demonstrate_charge_product_effect``) with the frame sampling ``Scene.play``
+uses, and solves the same physics the updaters apply. No mobject, pixel or
+LaTeX is created, so a whole timeline takes milliseconds. Rows are streamed by
+a generator. ``frame`` and ``time`` are those of the rendered video: each demo
+starts after the frames of every play and wait before its schedule
+(``timeline.stage_plays``), whose narration Write times come from the metrics
+cache filled by ``python timeline.py --measure``.
+
+    python headless_timeline.py media/timeline.csv --fps 15
+    python headless_timeline.py media/timeline.npz --set pendulum_dynamics='"dynamic"'
+"""
+import argparse
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+from pendulum_physics import DynamicPendulumTrajectory, PendulumTrajectory, bob_position, calibrate_k_base, tracker_schedule
+from narration import REFERENCE_LOCALE, narration_text
+from scene_parameters import resolve_parameters
+
+COLUMNS = ("stage", "frame", "time", "q2_x", "r", "r_sq", "charge_factor", "Fe", "theta")
+DEFAULT_FRAME_RATE = 15 # low quality
+
+
+def distance_steps(initial_q2_x, bob_eq_x, bob_radius, fixed_charge_radius):
+    # q2 x positions driven by parameter_tracker in the distance demo
+    final_q2_x_close = bob_eq_x - (bob_radius + fixed_charge_radius + 0.3)
+    final_q2_x_far = initial_q2_x - 1.5
+    return [
+        ("move", final_q2_x_close, 3), ("wait", 1),
+        ("move", final_q2_x_far, 4), ("wait", 1),
+        ("move", initial_q2_x, 3), ("wait", 1),
+    ]
+
+
+def q2_rest_position(pivot, length, q2_rest_offset):
+    # fixed_charge_final_pos_value: q2 settles this far left of the bob's rest position
+    return np.array(pivot, dtype=float) + np.array([-q2_rest_offset, -length, 0.0])
+
+
+def demo_geometry(params):
+    """Positions and force constant of the demos; CoulombPendulum.setup_demo_environment uses these too."""
+    pivot = np.array(params["pivot_point"], dtype=float)
+    length, theta_eq, force_scale = params["pendulum_length"], params["theta_equilibrium"], params["force_scale"]
+    q2 = q2_rest_position(pivot, length, params["layout"]["q2_rest_offset"])
+    bob_eq = bob_position(pivot, length, theta_eq) # bob_pos_at_theta_eq
+    r_eq = np.linalg.norm(bob_eq - q2)
+    if params["pendulum_dynamics"] == "dynamic": k_base = calibrate_k_base(theta_eq, q2, pivot, length, force_scale)
+    else: k_base = force_scale * np.tan(theta_eq) * r_eq**2
+    return {
+        "pivot": pivot, "q2": q2, "bob_eq": bob_eq, "r_eq": r_eq, "k_base": k_base,
+        "max_Fe": force_scale * np.tan(np.pi * 0.48),
+        "distance_steps": params["distance_steps"] or distance_steps(q2[0], bob_eq[0], params["bob_radius"], params["fixed_charge_radius"]),
+    }
+
+
+def distance_columns(params, geometry, frame_rate):
+    physics = dict(q2_y=geometry["q2"][1], pivot=geometry["pivot"], length=params["pendulum_length"],
+                   force_scale=params["force_scale"], k_base=geometry["k_base"], theta_start=params["theta_equilibrium"])
+    if params["pendulum_dynamics"] == "dynamic":
+        trajectory = DynamicPendulumTrajectory.from_schedule(
+            geometry["q2"][0], geometry["distance_steps"], frame_rate,
+            gravity=params["gravity"], damping=params["damping"], **physics)
+    else:
+        trajectory = PendulumTrajectory.from_schedule(geometry["q2"][0], geometry["distance_steps"], frame_rate, **physics)
+    return {
+        "time": trajectory.time, "q2_x": trajectory.q2_x, "r": trajectory.r,
+        "charge_factor": np.ones(len(trajectory)), "Fe": trajectory.Fe, "theta": trajectory.theta,
+    }
+
+
+def charge_product_columns(params, geometry, frame_rate):
+    # r stays at its equilibrium value and the bob does not move; only F_e follows the factor
+    times, factors = tracker_schedule(1.0, params["charge_product_steps"], frame_rate)
+    n_frames = len(times)
+    return {
+        "time": times, "q2_x": np.full(n_frames, geometry["q2"][0]), "r": np.full(n_frames, geometry["r_eq"]),
+        "charge_factor": factors, "Fe": np.minimum(geometry["k_base"] * factors / geometry["r_eq"]**2, geometry["max_Fe"]),
+        "theta": np.full(n_frames, params["theta_equilibrium"]),
+    }
+
+
+DEMOS = {
+    "demonstrate_distance_effect": distance_columns,
+    "demonstrate_charge_product_effect": charge_product_columns,
+}
+
+
+def play_frames(seconds, frame_rate):
+    # Frames Scene.play renders for a run_time (none for a zero-length hold)
+    return len(np.arange(0, seconds, 1 / frame_rate))
+
+
+def schedule_start_frames(params, frame_rate, metrics=None):
+    """``{demo stage: video frame}`` at which each demo's tracker schedule starts."""
+    from timeline import DEMO_SCHEDULES, narration_layout, narration_metrics, stage_plays
+
+    if metrics is None:
+        texts = {narration_text(params["narration_keys"].get(slot, slot), REFERENCE_LOCALE) for slot in params["layout"]["narration"]}
+        metrics = narration_metrics(texts, measure=False)
+    layout = narration_layout(params["layout"], params["narration_keys"], params["pivot_point"], metrics=metrics)
+    starts, frame = {}, 0
+    for stage, plays in stage_plays(params, layout).items():
+        for name, seconds in plays:
+            if name == DEMO_SCHEDULES.get(stage): starts.setdefault(stage, frame)
+            frame += play_frames(seconds, frame_rate)
+    return starts
+
+
+def iter_column_blocks(overrides=None, frame_rate=DEFAULT_FRAME_RATE, stages=None, metrics=None):
+    """Yields ``(stage, columns)`` with one array per column, one block per demo the scene plays."""
+    params = resolve_parameters(overrides)
+    geometry = demo_geometry(params)
+    starts = schedule_start_frames(params, frame_rate, metrics)
+    for stage, build in DEMOS.items():
+        if stage not in starts or (stages is not None and stage not in stages): continue
+        columns = build(params, geometry, frame_rate)
+        n_frames = len(columns["time"])
+        columns["r_sq"] = columns["r"] ** 2
+        columns["frame"] = starts[stage] + np.arange(n_frames)
+        columns["time"] = columns["frame"] / frame_rate
+        columns["stage"] = np.full(n_frames, stage)
+        yield stage, {name: columns[name] for name in COLUMNS}
+
+
+def iter_frames(overrides=None, frame_rate=DEFAULT_FRAME_RATE, stages=None, metrics=None):
+    """Yields one dict per frame with the values in ``COLUMNS``."""
+    for _, columns in iter_column_blocks(overrides, frame_rate, stages, metrics):
+        values = [columns[name].tolist() for name in COLUMNS]
+        for row in zip(*values):
+            yield dict(zip(COLUMNS, row))
+
+
+def write_csv(rows, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_columns(blocks, path):
+    # Columnar .npz: one array per column over all demos
+    blocks = [columns for _, columns in blocks]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, **{name: np.concatenate([block[name] for block in blocks]) for name in COLUMNS})
+    return sum(len(block["time"]) for block in blocks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help=".csv (streamed rows) or .npz (columns)")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FRAME_RATE)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=JSON", help="scene parameter override")
+    parser.add_argument("--stages", nargs="*", choices=DEMOS, default=None)
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for item in args.set:
+        name, _, value = item.partition("=")
+        overrides[name] = json.loads(value)
+
+    try:
+        if Path(args.output).suffix == ".npz":
+            count = write_columns(iter_column_blocks(overrides, args.fps, args.stages), args.output)
+        else:
+            count = write_csv(iter_frames(overrides, args.fps, args.stages), args.output)
+    except KeyError as error:
+        parser.error(error.args[0])
+    print(f"{count} frames written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
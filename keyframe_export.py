@@ -0,0 +1,287 @@
+"""Export the CoulombPendulum timeline as compact vector keyframes for the browser player.
+
+Instead of rasterizing and encoding frames, the scene is run with the
+renderer's frame methods replaced by a recorder that reads, for every frame,
+the outline points and style of each vector family member on screen. Per member
+these become:
+
+* shapes: outlines relative to their bounding-box centre, stored once in a
+  shared table (in thousandths of a scene unit), so every repeated Tex glyph,
+  readout digit or sign is a single entry;
+* a transform track: the affine map from the shape to the frame's points, which
+  covers moves, rotations and rescaling (the bob, the string, ``+`` signs);
+* a draw track: how much of the outline is drawn, for ``Write``/``Create``,
+  whose frames are partial copies of the outline they end on;
+* a style track: fill and stroke colour/opacity and stroke width.
+
+Tracks are reduced to the keyframes a linear interpolation needs to stay within
+the tolerance, so tracker-driven motion becomes short piecewise-linear curves.
+Only frames whose points match no transform or partial of a known shape (a
+``Transform`` morph, an arrow changing length) add new shapes. Images, such as
+the field layer, are not exported.
+
+keyframe_player.html rebuilds the animation as SVG; ``--html`` writes a copy
+with the keyframes embedded, a single file an LMS can serve as is.
+
+    python keyframe_export.py media/keyframes/coulomb.json.gz --html media/keyframes/coulomb.html
+"""
+import argparse
+import gzip
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+PLAYER_PATH = Path(__file__).with_name("keyframe_player.html")
+UNIT = 1000 # shape coordinates are stored as integers in thousandths of a scene unit
+FIT_TOLERANCE = 2e-3 # scene units a transformed or partial shape may deviate from the recorded points
+TOLERANCES = {"transform": 2e-3, "style": 2 / 255, "draw": 1e-3}
+
+
+def reduce_keyframes(frames, values, tolerance):
+    """Keep the rows of ``values`` a linear interpolation over ``frames`` needs (Ramer-Douglas-Peucker)."""
+    n = len(frames)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    pending = [(0, n - 1)]
+    while pending:
+        i, j = pending.pop()
+        if j <= i + 1: continue
+        t = (frames[i + 1:j] - frames[i]) / (frames[j] - frames[i])
+        error = np.abs(values[i + 1:j] - (values[i] + t[:, None] * (values[j] - values[i]))).max(axis=1)
+        k = int(error.argmax())
+        if error[k] > tolerance:
+            keep[i + 1 + k] = True
+            pending += [(i, i + 1 + k), (i + 1 + k, j)]
+    return frames[keep], values[keep]
+
+
+def fit_affine(shape, points):
+    """``(a, b, c, d, tx, ty)`` mapping ``shape`` onto ``points``, or None if no affine map does."""
+    design = np.hstack([shape, np.ones((len(shape), 1))])
+    solution = np.linalg.lstsq(design, points, rcond=None)[0]
+    if np.abs(design @ solution - points).max() > FIT_TOLERANCE: return None
+    return np.array([solution[0, 0], solution[0, 1], solution[1, 0], solution[1, 1], solution[2, 0], solution[2, 1]])
+
+
+def partial_fraction(full, points):
+    """``b`` when ``points`` is manim's ``pointwise_become_partial(full, 0, b)``, else None."""
+    if len(full) != len(points) or len(full) < 4: return None
+    curves = len(full) // 4
+    mismatch = (np.abs(points - full).max(axis=1) > FIT_TOLERANCE).reshape(curves, 4).any(axis=1)
+    if not mismatch.any(): return 1.0
+    split = int(mismatch.argmax())
+    end = points[4 * split + 3]
+    if np.abs(points[4 * split + 3:] - end).max() > FIT_TOLERANCE: return None # the tail repeats the end point
+    if np.abs(points[4 * split] - full[4 * split]).max() > FIT_TOLERANCE: return None
+    p0, p1, p2, p3 = full[4 * split:4 * split + 4]
+    bezier = lambda u: (1 - u)**3 * p0 + 3 * (1 - u)**2 * u * p1 + 3 * (1 - u) * u**2 * p2 + u**3 * p3
+    # Nearest sample of the split curve to the end point, then narrowed down around it
+    samples = np.linspace(0, 1, 65)
+    distances = np.abs(bezier(samples[:, None]) - end).max(axis=1)
+    best = int(distances.argmin())
+    low, high = samples[max(best - 1, 0)], samples[min(best + 1, 64)]
+    for _ in range(30):
+        left, right = low + (high - low) / 3, high - (high - low) / 3
+        if np.abs(bezier(left) - end).max() < np.abs(bezier(right) - end).max(): high = right
+        else: low = left
+    u = (low + high) / 2
+    if np.abs(bezier(u) - end).max() > FIT_TOLERANCE: return None
+    return (split + u) / curves
+
+
+class ShapeTable:
+    def __init__(self):
+        self.shapes, self._index = [], {}
+
+    def add(self, points):
+        """Index of the outline of ``points`` (centred on its bounding box), its exact points and the centre."""
+        centre = (points.min(axis=0) + points.max(axis=0)) / 2
+        quantized = np.round((points - centre) * UNIT).astype(np.int32)
+        key = (len(quantized), quantized.tobytes())
+        if key not in self._index:
+            self._index[key] = len(self.shapes)
+            self.shapes.append(quantized.ravel().tolist())
+        return self._index[key], quantized / UNIT, centre
+
+
+class MemberTrack:
+    """Runs of ``(frame, count, points or None if unchanged, style)`` recorded for one family member."""
+
+    def __init__(self, member, index):
+        self.member = member # keeps id() from being reused while recording
+        self.index = index
+        self.runs = []
+        self._last_points = None
+
+    def record(self, frame, count, points, style):
+        changed = self._last_points is None or not np.array_equal(points, self._last_points)
+        if changed: self._last_points = points
+        self.runs.append((frame, count, points if changed else None, style))
+
+    def keyframes(self, table):
+        # The outline a run of partial frames ends on: the next points that are held for more than one frame
+        held_until = [None] * len(self.runs)
+        target = None
+        for i in range(len(self.runs) - 1, -1, -1):
+            frame, count, points, _ = self.runs[i]
+            if points is not None:
+                following = self.runs[i + 1] if i + 1 < len(self.runs) else None
+                if count > 1 or following is None or following[2] is None: target = points
+                held_until[i] = target
+
+        frames, shape_track, transforms, draws, styles = [], [], [], [], []
+        shape, shape_points, transform, draw = None, None, None, 1.0
+        for i, (frame, count, points, style) in enumerate(self.runs):
+            if points is not None:
+                fitted = fit_affine(shape_points, points) if shape_points is not None and len(shape_points) == len(points) else None
+                if fitted is not None:
+                    transform, draw = fitted, 1.0
+                else:
+                    full = held_until[i]
+                    fraction = partial_fraction(full, points) if full is not None and full is not points else None
+                    if fraction is not None: shape, shape_points, centre = table.add(full); draw = fraction
+                    else: shape, shape_points, centre = table.add(points); draw = 1.0
+                    transform = np.array([1.0, 0.0, 0.0, 1.0, centre[0], centre[1]])
+                if not shape_track or shape_track[-1][1] != shape: shape_track.append((frame, shape))
+            for offset in (0, count - 1) if count > 1 else (0,): # both ends of a hold, so nothing interpolates across it
+                frames.append(frame + offset); transforms.append(transform); draws.append(draw); styles.append(style)
+
+        frames = np.array(frames, dtype=float)
+        tracks = {"shape": [list(entry) for entry in shape_track]}
+        for name, values, digits in (("transform", transforms, 4), ("draw", [[d] for d in draws], 4), ("style", styles, 3)):
+            kept_frames, kept = reduce_keyframes(frames, np.array(values, dtype=float), TOLERANCES[name])
+            tracks[name] = [[int(f)] + np.round(row, digits).tolist() for f, row in zip(kept_frames, kept)]
+        return tracks
+
+
+class KeyframeRecorder:
+    """Stands in for a Cairo renderer's ``update_frame``/``get_frame``/``add_frame``; nothing is rasterized."""
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.frame = 0
+        self.tracks = {}
+        self.order = []
+        self.skipped = Counter()
+        self._scene = None
+        self._originals = {}
+
+    def install(self):
+        self._originals = {name: getattr(self.renderer, name) for name in ("update_frame", "get_frame", "add_frame")}
+        self.renderer.update_frame, self.renderer.get_frame, self.renderer.add_frame = self.update_frame, self.get_frame, self.add_frame
+        return self
+
+    def uninstall(self):
+        for name, original in self._originals.items(): setattr(self.renderer, name, original)
+        self._originals = {}
+
+    def update_frame(self, scene, *args, **kwargs):
+        self._scene = scene
+
+    def get_frame(self):
+        return None
+
+    def add_frame(self, frame, num_frames=1):
+        if self.renderer.skip_animations or self._scene is None: return
+        self.renderer.time += num_frames / self.renderer.camera.frame_rate
+        self.capture(num_frames)
+
+    def capture(self, num_frames):
+        from manim import VMobject
+
+        scene = self._scene
+        order = []
+        for member in self.renderer.camera.get_mobjects_to_display(scene.mobjects + scene.foreground_mobjects):
+            if not isinstance(member, VMobject):
+                self.skipped[type(member).__name__] += 1
+                continue
+            track = self.tracks.get(id(member))
+            if track is None: track = self.tracks[id(member)] = MemberTrack(member, len(self.tracks))
+            fill, stroke = member.get_fill_rgbas()[0], member.get_stroke_rgbas()[0]
+            style = np.concatenate([fill, stroke, [member.get_stroke_width()]])
+            track.record(self.frame, num_frames, member.points[:, :2].copy(), style)
+            order.append(track.index)
+        if not self.order or self.order[-1][1] != order: self.order.append([self.frame, order])
+        self.frame += num_frames
+
+    def keyframes(self):
+        from manim import config
+
+        table = ShapeTable()
+        members = [track.keyframes(table) for track in self.tracks.values()]
+        return {
+            "version": 1, "fps": config.frame_rate, "frames": self.frame, "unit": UNIT,
+            "width": config.pixel_width, "height": config.pixel_height,
+            "frame_width": config.frame_width, "frame_height": config.frame_height,
+            "background": str(config.background_color), "stroke_scale": 0.01, # manim's cairo line width multiple
+            "shapes": table.shapes, "members": members, "order": self.order,
+        }
+
+
+def record_scene(scene_overrides=None, quality="low_quality"):
+    from manim import tempconfig
+    from coulomb import CoulombPendulum
+
+    with tempconfig({"quality": quality, "write_to_movie": False, "save_last_frame": False,
+                     "preview": False, "show_in_file_browser": False}):
+        scene = CoulombPendulum()
+        for name, value in {"reuse_static_frames": False, "frame_pipeline_depth": 0, **(scene_overrides or {})}.items():
+            setattr(scene, name, value)
+        recorder = KeyframeRecorder(scene.renderer).install()
+        try: scene.render()
+        finally: recorder.uninstall()
+        return recorder, recorder.keyframes()
+
+
+def write_keyframes(data, output_path):
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, separators=(",", ":"))
+    if output_path.suffix == ".gz": output_path.write_bytes(gzip.compress(text.encode(), mtime=0))
+    else: output_path.write_text(text, encoding="utf-8")
+    return output_path
+
+
+def write_player(data, html_path):
+    # The player with the keyframes embedded, one file with no other requests
+    html_path = Path(html_path)
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    embedded = json.dumps(data, separators=(",", ":"))
+    html_path.write_text(PLAYER_PATH.read_text(encoding="utf-8").replace(
+        '<script id="keyframes" type="application/json"></script>',
+        f'<script id="keyframes" type="application/json">{embedded}</script>'), encoding="utf-8")
+    return html_path
+
+
+def main(argv=None):
+    from parallel_render import QUALITIES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help=".json or .json.gz")
+    parser.add_argument("--html", default=None, help="also write the player with the keyframes embedded")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l", help="sets the frame rate")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=JSON", help="scene parameter override")
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for item in args.set:
+        name, _, value = item.partition("=")
+        overrides[name] = json.loads(value)
+
+    started = time.perf_counter()
+    recorder, data = record_scene({"parameter_overrides": overrides} if overrides else {}, QUALITIES[args.quality])
+    output_path = write_keyframes(data, args.output)
+    print(f"{data['frames']} frames, {len(data['members'])} members, {len(data['shapes'])} shapes "
+          f"in {time.perf_counter() - started:.1f}s: {output_path} ({output_path.stat().st_size / 1024:.0f} KiB)")
+    if recorder.skipped: print(f"Not exported (not vector mobjects): {dict(recorder.skipped)}")
+    if args.html:
+        html_path = write_player(data, args.html)
+        print(f"Player: {html_path} ({html_path.stat().st_size / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""Render CoulombPendulum once for geometry and once per narration locale for text.
+
+The geometry layer (everything but the narration) is rendered a single time in
+the reference locale. Each locale then renders only its text layer on a
+transparent background, where static-frame reuse skips nearly every frame since
+the text rarely moves, and ffmpeg composites it over the geometry video. Layout
+and ``Write`` timings come from the reference locale, so every text layer lines
+up with the one geometry render.
+
+    python layered_render.py -q l --locales pt en es --workers 3
+"""
+import argparse
+import multiprocessing
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from narration import LOCALES, REFERENCE_LOCALE
+from parallel_render import QUALITIES, render_scene
+
+
+def render_layer_worker(layer, locale, quality, media_dir):
+    started = time.perf_counter()
+    name = "geometry" if layer == "geometry" else f"text_{locale}"
+    scene = render_scene(
+        {"render_layer": layer, "parameter_overrides": {"locale": locale}, "precompile_tex": False},
+        # A media dir per job keeps manim's partial-file cache cleanup from racing
+        {"quality": quality, "media_dir": str(Path(media_dir) / "layers" / name), "transparent": layer == "text",
+         "output_file": f"CoulombPendulum_{name}"},
+    )
+    return name, str(scene.renderer.file_writer.movie_file_path), time.perf_counter() - started
+
+
+def frame_count(video_path):
+    from stage_cache import ffprobe_executable
+
+    result = subprocess.run(
+        [ffprobe_executable(), "-v", "error", "-select_streams", "v:0", "-count_packets",
+         "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", str(video_path)],
+        check=True, capture_output=True, text=True,
+    )
+    return int(result.stdout.strip())
+
+
+def composite(geometry_path, text_path, output_path):
+    from stage_cache import ffmpeg_executable
+
+    geometry_frames, text_frames = frame_count(geometry_path), frame_count(text_path)
+    if geometry_frames != text_frames:
+        raise RuntimeError(f"{text_path} has {text_frames} frames, the geometry layer {geometry_frames}")
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [ffmpeg_executable(), "-y", "-loglevel", "error", "-i", str(geometry_path), "-i", str(text_path),
+         "-filter_complex", "[0:v][1:v]overlay=format=auto", "-map", "0:a?",
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", str(output_path)],
+        check=True,
+    )
+    return Path(output_path)
+
+
+def render_layered(quality="low_quality", media_dir="media", locales=LOCALES, workers=None):
+    import coulomb
+    from tex_cache import precompile_scene_tex
+
+    # Every locale's narration goes into the shared Tex cache once, before the jobs start
+    precompile_scene_tex(coulomb.__file__, workers=workers)
+    jobs = [("geometry", REFERENCE_LOCALE)] + [("text", locale) for locale in locales]
+    layers, timings = {}, {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(render_layer_worker, layer, locale, quality, media_dir) for layer, locale in jobs]
+        for future in futures:
+            name, path, elapsed = future.result()
+            layers[name], timings[name] = path, elapsed
+
+    outputs = {}
+    for locale in locales:
+        started = time.perf_counter()
+        output_path = Path(media_dir) / "videos" / "coulomb" / "layered" / f"CoulombPendulum_{locale}.mp4"
+        outputs[locale] = composite(layers["geometry"], layers[f"text_{locale}"], output_path)
+        timings[f"composite_{locale}"] = time.perf_counter() - started
+    return outputs, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--locales", nargs="+", choices=LOCALES, default=list(LOCALES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--media-dir", default="media")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    outputs, timings = render_layered(QUALITIES[args.quality], args.media_dir, args.locales, args.workers)
+    print(f"Layered render ({time.perf_counter() - started:.1f}s)")
+    for name, elapsed in timings.items():
+        print(f"  {name:<20} {elapsed:6.1f}s")
+    for locale, path in outputs.items():
+        print(f"  {locale}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""Per-locale narration strings of CoulombPendulum, importable without manim.
+
+Every piece of prose the scene writes on screen is looked up here by key.
+Formulas and symbol labels (``q_1``, ``\\vec{F}_e``, ...) read the same in every
+language and stay in coulomb.py. The Portuguese table is the reference locale:
+layout that depends on text size and the duration of ``Write`` animations are
+taken from it, so all locales share one timeline and one geometry layer.
+"""
+REFERENCE_LOCALE = "pt"
+
+STRINGS = {
+    "pt": {
+        "title": "Pêndulo Eletrostático e a Lei de Coulomb",
+        "pivot_label": "Pivô",
+        "intro_text": "Aproximamos uma carga fixa $q_2$ positiva...",
+        "neutral_text": "O p\\^endulo ($q_1$) est\\'a inicialmente neutro.",
+        "contact_intro_text": "Fazemos a carga $q_2$ (positiva) tocar o p\\^endulo...",
+        "electrization_text": "...ocorre eletriza\\c{c}\\~ao por contato!",
+        "both_charged_text": "Agora $q_1$ e $q_2$ s\\~ao ambas positivas.",
+        "repulsion_text_popup": "Repuls\\~ao eletrost\\'atica!",
+        "forces_title": "For\\c{c}as no P\\^endulo",
+        "forces_text": "Tr\\^es for\\c{c}as atuam no p\\^endulo:",
+        "simplify_text": "Focaremos na for\\c{c}a el\\'etrica ($F_e$)",
+        "distance_title": r"$F_e \text{ vs. Dist\^ancia } (r)$",
+        "charge_product_title": r"$F_e \text{ vs. Produto das Cargas } (q_1q_2)$",
+        "distance_narrative": "Variando a dist\\^ancia $r$ entre $q_1$ e $q_2$...",
+        "q_factor_text": "Variando o produto das cargas $(q_1q_2)$...",
+        "coulomb_title": "Lei de Coulomb",
+        "summary_text": r"Das observa\c{c}\~oes:",
+        "k_explanation_final": r"onde $k$ é a constante de Coulomb ($k \approx 8.99 \times 10^9 \, \text{N}\cdot\text{m}^2/\text{C}^2$)",
+        "two_pendulum_title": "Dois p\\^endulos e uma carga negativa",
+    },
+    "en": {
+        "title": "The Electrostatic Pendulum and Coulomb's Law",
+        "pivot_label": "Pivot",
+        "intro_text": "We bring a fixed positive charge $q_2$ closer...",
+        "neutral_text": "The pendulum ($q_1$) is initially neutral.",
+        "contact_intro_text": "The (positive) charge $q_2$ touches the pendulum...",
+        "electrization_text": "...and charges it by contact!",
+        "both_charged_text": "Now $q_1$ and $q_2$ are both positive.",
+        "repulsion_text_popup": "Electrostatic repulsion!",
+        "forces_title": "Forces on the Pendulum",
+        "forces_text": "Three forces act on the pendulum:",
+        "simplify_text": "We will focus on the electric force ($F_e$)",
+        "distance_title": r"$F_e \text{ vs. Distance } (r)$",
+        "charge_product_title": r"$F_e \text{ vs. Product of the Charges } (q_1q_2)$",
+        "distance_narrative": "Varying the distance $r$ between $q_1$ and $q_2$...",
+        "q_factor_text": "Varying the product of the charges $(q_1q_2)$...",
+        "coulomb_title": "Coulomb's Law",
+        "summary_text": r"From the observations:",
+        "k_explanation_final": r"where $k$ is Coulomb's constant ($k \approx 8.99 \times 10^9 \, \text{N}\cdot\text{m}^2/\text{C}^2$)",
+        "two_pendulum_title": "Two pendulums and a negative charge",
+    },
+    "es": {
+        "title": "El P\\'endulo Electrost\\'atico y la Ley de Coulomb",
+        "pivot_label": "Pivote",
+        "intro_text": "Acercamos una carga fija $q_2$ positiva...",
+        "neutral_text": "El p\\'endulo ($q_1$) est\\'a inicialmente neutro.",
+        "contact_intro_text": "Hacemos que la carga $q_2$ (positiva) toque el p\\'endulo...",
+        "electrization_text": "...\\textexclamdown ocurre electrizaci\\'on por contacto!",
+        "both_charged_text": "Ahora $q_1$ y $q_2$ son ambas positivas.",
+        "repulsion_text_popup": "\\textexclamdown Repulsi\\'on electrost\\'atica!",
+        "forces_title": "Fuerzas sobre el P\\'endulo",
+        "forces_text": "Tres fuerzas act\\'uan sobre el p\\'endulo:",
+        "simplify_text": "Nos centraremos en la fuerza el\\'ectrica ($F_e$)",
+        "distance_title": r"$F_e \text{ vs. Distancia } (r)$",
+        "charge_product_title": r"$F_e \text{ vs. Producto de las Cargas } (q_1q_2)$",
+        "distance_narrative": "Variando la distancia $r$ entre $q_1$ y $q_2$...",
+        "q_factor_text": "Variando el producto de las cargas $(q_1q_2)$...",
+        "coulomb_title": "Ley de Coulomb",
+        "summary_text": r"De las observaciones:",
+        "k_explanation_final": r"donde $k$ es la constante de Coulomb ($k \approx 8.99 \times 10^9 \, \text{N}\cdot\text{m}^2/\text{C}^2$)",
+        "two_pendulum_title": "Dos p\\'endulos y una carga negativa",
+    },
+}
+LOCALES = tuple(STRINGS)
+
+
+def narration_text(key, locale=REFERENCE_LOCALE):
+    if locale not in STRINGS: raise KeyError(f"Unknown locale {locale!r}; available: {LOCALES}")
+    return STRINGS[locale][key]
+
+
+def missing_keys():
+    # {locale: keys the reference locale has but it lacks}
+    reference = set(STRINGS[REFERENCE_LOCALE])
+    return {locale: sorted(reference - set(table)) for locale, table in STRINGS.items() if reference - set(table)}
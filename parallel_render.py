@@ -0,0 +1,128 @@
+"""Render the CoulombPendulum stages in a process pool.
+
+Each worker fast-forwards the scene (animations skipped) to the boundary of its
+stage, which reproduces the exact mobject state a serial render would have
+there, renders that one stage and publishes it to the shared stage cache. The
+segments are then concatenated with a stream copy, so no frame is re-encoded.
+
+    python parallel_render.py -q l --workers 8
+    python parallel_render.py -q l --check   # also renders serially and compares frames
+    python parallel_render.py -q l --profile media/profile   # one profile per stage worker
+"""
+import argparse
+import multiprocessing
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+QUALITIES = {"l": "low_quality", "m": "medium_quality", "h": "high_quality", "p": "production_quality", "k": "fourk_quality"}
+
+
+def render_scene(scene_overrides, config_overrides):
+    from manim import tempconfig
+    from coulomb import CoulombPendulum
+
+    with tempconfig({"preview": False, "show_in_file_browser": False, **config_overrides}):
+        scene = CoulombPendulum()
+        for name, value in scene_overrides.items(): setattr(scene, name, value)
+        scene.render()
+        return scene
+
+
+def render_stage_worker(stage, quality, media_dir, stage_cache_dir, profile_dir=None, profile_memory=False):
+    started = time.perf_counter()
+    profile = {"profile_dir": str(Path(profile_dir) / stage), "profile_memory": profile_memory} if profile_dir else {}
+    scene = render_scene(
+        {"render_stages": (stage,), "stage_cache_dir": stage_cache_dir, "precompile_tex": False, **profile},
+        # A media dir per worker keeps manim's partial-file cache cleanup from racing
+        {"quality": quality, "media_dir": str(Path(media_dir) / "parallel" / stage)},
+    )
+    _, key, _ = next(entry for entry in scene.stage_cache.stages if entry[0] == stage)
+    return stage, str(scene.stage_cache.cached_path(key)), time.perf_counter() - started
+
+
+def render_serial(quality, media_dir, output_file, profile_dir=None):
+    profile = {"profile_dir": str(Path(profile_dir) / "serial")} if profile_dir else {}
+    scene = render_scene({"use_stage_cache": False, **profile}, {"quality": quality, "media_dir": media_dir, "output_file": output_file})
+    return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def render_parallel(quality="low_quality", media_dir="media", output_path=None, workers=None, stages=None,
+                    profile_dir=None, profile_memory=False):
+    import coulomb
+    from coulomb import CoulombPendulum
+    from stage_cache import concat_segments
+    from tex_cache import precompile_scene_tex
+
+    # Fill the shared Tex cache once so the workers only read from it
+    precompile_scene_tex(coulomb.__file__, workers=workers)
+    stages = tuple(stages or CoulombPendulum.STAGES)
+    stage_cache_dir = str(Path(media_dir) / "stage_cache" / CoulombPendulum.__name__)
+    output_path = Path(output_path or Path(media_dir) / "videos" / "coulomb" / "parallel" / "CoulombPendulum.mp4")
+
+    timings = {}
+    segments = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(render_stage_worker, stage, quality, media_dir, stage_cache_dir, profile_dir, profile_memory)
+                   for stage in stages]
+        for future in futures:
+            stage, segment, elapsed = future.result()
+            segments[stage], timings[stage] = segment, elapsed
+
+    concat_segments([segments[stage] for stage in stages], output_path)
+    return output_path, timings
+
+
+def frame_digests(video_path):
+    from stage_cache import ffmpeg_executable
+
+    # framemd5 hashes every decoded frame, so the comparison ignores container differences
+    result = subprocess.run(
+        [ffmpeg_executable(), "-loglevel", "error", "-i", str(video_path), "-map", "0:v", "-f", "framemd5", "-"],
+        check=True, capture_output=True, text=True,
+    )
+    return [line.rsplit(",", 1)[-1].strip() for line in result.stdout.splitlines() if line and not line.startswith("#")]
+
+
+def verify_frame_parity(serial_path, parallel_path):
+    serial, parallel = frame_digests(serial_path), frame_digests(parallel_path)
+    if len(serial) != len(parallel):
+        return False, f"frame count differs: serial {len(serial)}, parallel {len(parallel)}"
+    for index, (a, b) in enumerate(zip(serial, parallel)):
+        if a != b:
+            return False, f"first mismatch at frame {index}"
+    return True, f"{len(serial)} frames identical"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("--check", action="store_true", help="render serially too and compare every frame")
+    parser.add_argument("--profile", metavar="DIR", default=None,
+                        help="write per-stage, per-updater and per-frame timings (JSON and folded stacks) to DIR")
+    parser.add_argument("--profile-memory", action="store_true", help="also trace Python allocations per stage (slower)")
+    args = parser.parse_args(argv)
+
+    quality = QUALITIES[args.quality]
+    started = time.perf_counter()
+    output_path, timings = render_parallel(quality, args.media_dir, args.output, args.workers,
+                                           profile_dir=args.profile, profile_memory=args.profile_memory)
+    print(f"Parallel render: {output_path} ({time.perf_counter() - started:.1f}s)")
+    for stage, elapsed in timings.items():
+        print(f"  {stage:<45} {elapsed:6.1f}s")
+    if args.profile: print(f"Profiles: {args.profile}/<stage>/CoulombPendulum.json and .folded")
+
+    if args.check:
+        serial_path = render_serial(quality, args.media_dir, "CoulombPendulum_serial", args.profile)
+        identical, message = verify_frame_parity(serial_path, output_path)
+        print(f"Frame parity with {serial_path}: {message}")
+        return 0 if identical else 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
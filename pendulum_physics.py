@@ -0,0 +1,244 @@
+"""Vectorized pendulum physics for CoulombPendulum.
+
+Only NumPy is needed here, so the same tables can be built without manim.
+"""
+import numpy as np
+
+from charge_system import DEFAULT_MIN_DISTANCE, clamp_distances
+
+
+def smooth(t, inflection=10.0):
+    # Vectorized manim.rate_functions.smooth (the default rate_func of .animate)
+    t = np.asarray(t, dtype=float)
+    error = 1 / (1 + np.exp(inflection / 2))
+    sigmoid = 1 / (1 + np.exp(-inflection * (t - 0.5)))
+    return np.clip((sigmoid - error) / (1 - 2 * error), 0, 1)
+
+
+def tracker_schedule(start_value, steps, frame_rate, rate_func=smooth):
+    """Per-frame values of a ValueTracker driven by ``steps``.
+
+    ``steps`` holds ``("move", target, run_time)`` entries, played as
+    ``tracker.animate.set_value(target)``, and ``("wait", duration)`` holds.
+    Frames are sampled the way ``Scene.play`` samples them. Returns ``(times, values)``.
+    """
+    dt = 1 / frame_rate
+    times, values = [], []
+    value, clock = float(start_value), 0.0
+    for step in steps:
+        if step[0] == "move":
+            _, target, run_time = step
+            t = np.arange(0, run_time, dt)
+            times.append(clock + t)
+            values.append(value + (target - value) * rate_func(t / run_time))
+            value, clock = float(target), clock + run_time
+        elif step[0] == "wait":
+            # A wait with a time-based updater renders like any play, not as a frozen frame
+            t = np.arange(0, step[1], dt)
+            times.append(clock + t)
+            values.append(np.full(len(t), value))
+            clock += step[1]
+        else:
+            raise ValueError(f"Unknown tracker step {step[0]!r}")
+    if not times: return np.zeros(1), np.full(1, value)
+    return np.concatenate(times), np.concatenate(values)
+
+
+def bob_position(pivot, length, theta):
+    theta = np.asarray(theta, dtype=float)
+    return np.stack([
+        pivot[0] + length * np.sin(theta),
+        pivot[1] - length * np.cos(theta),
+        np.zeros_like(theta),
+    ], axis=-1)
+
+
+def quasi_static_state(q2_positions, pivot, length, force_scale, k_base, charge_factor=1.0,
+                       min_distance=DEFAULT_MIN_DISTANCE, max_theta=np.pi * 0.48, theta_start=0.0, tol=1e-10, max_iterations=200):
+    """Equilibrium r, F_e, theta and bob position for every q2 position at once.
+
+    The scene's per-frame updater settles on ``theta = arctan(F_e / force_scale)``
+    with ``F_e = k_base * charge_factor / r**2`` evaluated at the bob's position;
+    this runs that same fixed-point iteration over all frames in parallel.
+    """
+    q2 = np.atleast_2d(np.asarray(q2_positions, dtype=float))
+    charge_factor = np.broadcast_to(np.asarray(charge_factor, dtype=float), q2.shape[:1])
+    max_Fe = force_scale * np.tan(max_theta)
+    theta = np.full(q2.shape[0], float(theta_start))
+    for _ in range(max_iterations):
+        bob = bob_position(pivot, length, theta)
+        r = clamp_distances(np.linalg.norm(bob[:, :2] - q2[:, :2], axis=1), min_distance)
+        Fe = np.minimum(k_base * charge_factor / r**2, max_Fe)
+        if force_scale != 0: new_theta = np.arctan(Fe / force_scale)
+        else: new_theta = np.where(Fe > 0, np.pi / 2, 0.0)
+        converged = np.max(np.abs(new_theta - theta)) < tol
+        theta = new_theta
+        if converged: break
+    bob = bob_position(pivot, length, theta)
+    r = clamp_distances(np.linalg.norm(bob[:, :2] - q2[:, :2], axis=1), min_distance)
+    Fe = np.minimum(k_base * charge_factor / r**2, max_Fe)
+    return {"r": r, "Fe": Fe, "theta": theta, "bob": bob}
+
+
+class PendulumTrajectory:
+    """Per-frame table of the pendulum state along a q2 schedule.
+
+    Built once in a single vectorized pass; updaters look rows up by the
+    tracker value that drives q2 instead of redoing the physics every frame.
+    """
+
+    columns = ("time", "q2_x", "r", "Fe", "theta", "bob_x", "bob_y")
+
+    def __init__(self, times, q2_x, q2_y, pivot, length, force_scale, k_base, charge_factor=1.0, **physics):
+        self.time = np.asarray(times, dtype=float)
+        self.q2_x = np.asarray(q2_x, dtype=float)
+        self.q2_y = float(q2_y)
+        self._physics = dict(pivot=pivot, length=length, force_scale=force_scale, k_base=k_base,
+                             charge_factor=charge_factor, **physics)
+        q2 = np.column_stack([self.q2_x, np.full_like(self.q2_x, self.q2_y)])
+        state = quasi_static_state(q2, **self._physics)
+        self.r, self.Fe, self.theta, self.bob = state["r"], state["Fe"], state["theta"], state["bob"]
+        self._order = np.argsort(self.q2_x, kind="stable")
+        self._sorted_q2_x = self.q2_x[self._order]
+
+    @classmethod
+    def from_schedule(cls, start_value, steps, frame_rate, q2_y, **physics):
+        times, values = tracker_schedule(start_value, steps, frame_rate)
+        return cls(times, values, q2_y, **physics)
+
+    def __len__(self):
+        return len(self.time)
+
+    def index_of(self, q2_x, tol=1e-9):
+        position = np.searchsorted(self._sorted_q2_x, q2_x)
+        candidates = [p for p in (position - 1, position) if 0 <= p < len(self._sorted_q2_x)]
+        best = min(candidates, key=lambda p: abs(self._sorted_q2_x[p] - q2_x))
+        return self._order[best] if abs(self._sorted_q2_x[best] - q2_x) <= tol else None
+
+    def state_at(self, q2_x):
+        # Returns (r, Fe, theta, bob); off-schedule values (e.g. a skipped play) are solved directly
+        index = self.index_of(q2_x)
+        if index is not None:
+            return self.r[index], self.Fe[index], self.theta[index], self.bob[index]
+        state = quasi_static_state([[q2_x, self.q2_y]], **self._physics)
+        return state["r"][0], state["Fe"][0], state["theta"][0], state["bob"][0]
+
+    def as_columns(self):
+        return {
+            "time": self.time, "q2_x": self.q2_x, "r": self.r, "Fe": self.Fe, "theta": self.theta,
+            "bob_x": self.bob[:, 0], "bob_y": self.bob[:, 1],
+        }
+
+
+def coulomb_force_on_bob(bob, q2, k_base, charge_factor=1.0, min_distance=DEFAULT_MIN_DISTANCE, max_force=np.inf):
+    # Force on the bob along q2 -> bob, magnitude k_base * charge_factor / r**2 (clamped)
+    offset = bob[..., :2] - q2[..., :2]
+    r = clamp_distances(np.linalg.norm(offset, axis=-1), min_distance)
+    magnitude = np.minimum(k_base * charge_factor / r**2, max_force)
+    return magnitude[..., None] * offset / r[..., None], r, magnitude
+
+
+def calibrate_k_base(theta_equilibrium, q2_position, pivot, length, force_scale, min_distance=DEFAULT_MIN_DISTANCE):
+    """k_base for which the full (radial) Coulomb force holds the bob at ``theta_equilibrium``.
+
+    Balances torques about the pivot: the tangential part of the Coulomb force
+    cancels the tangential part of the weight, ``force_scale * sin(theta)``.
+    """
+    bob = bob_position(pivot, length, theta_equilibrium)
+    offset = bob[:2] - np.asarray(q2_position, dtype=float)[:2]
+    r = clamp_distances(np.linalg.norm(offset), min_distance)
+    tangent = np.array([np.cos(theta_equilibrium), np.sin(theta_equilibrium)])
+    along_tangent = np.dot(offset / r, tangent)
+    return force_scale * np.sin(theta_equilibrium) / along_tangent * r**2
+
+
+def integrate_pendulum(q2_positions, frame_rate, pivot, length, force_scale, k_base, charge_factor=1.0,
+                       gravity=9.8, damping=0.0, theta_start=0.0, omega_start=0.0, substeps=8,
+                       min_distance=DEFAULT_MIN_DISTANCE, max_theta=np.pi * 0.48):
+    """Integrate the driven pendulum over a whole q2 schedule ahead of rendering.
+
+    The bob has weight ``force_scale`` (the scale the scene draws forces at), so its
+    mass is ``force_scale / gravity``. The equation of motion about the pivot is
+
+        m L theta'' = -m g sin(theta) + F_e . t_hat - m L damping theta'
+
+    with ``F_e`` the Coulomb force from q2 and ``t_hat`` the direction of increasing
+    theta; the string tension is the constraint force and is reported per frame.
+    Steps are fixed (``substeps`` per frame) with semi-implicit (symplectic) Euler,
+    and q2 is interpolated linearly between frames. ``theta_start`` may be an array
+    to integrate several pendulums against the same schedule in one pass.
+    """
+    q2 = np.asarray(q2_positions, dtype=float)[:, :2]
+    n_frames = len(q2)
+    theta = np.atleast_1d(np.asarray(theta_start, dtype=float)).copy()
+    omega = np.broadcast_to(np.asarray(omega_start, dtype=float), theta.shape).copy()
+    mass = force_scale / gravity
+    max_force = force_scale * np.tan(max_theta)
+    h = 1 / (frame_rate * substeps)
+
+    def accelerations(theta, omega, q2_now):
+        bob = bob_position(pivot, length, theta)
+        force, r, magnitude = coulomb_force_on_bob(bob, q2_now, k_base, charge_factor, min_distance, max_force)
+        tangential = force[:, 0] * np.cos(theta) + force[:, 1] * np.sin(theta)
+        alpha = -gravity * np.sin(theta) / length + tangential / (mass * length) - damping * omega
+        # Tension balances the radial weight, the radial Coulomb part and the centripetal term
+        radial = -force[:, 0] * np.sin(theta) + force[:, 1] * np.cos(theta)
+        tension = mass * gravity * np.cos(theta) - radial + mass * length * omega**2
+        return alpha, bob, r, magnitude, tension
+
+    shape = (n_frames,) + theta.shape
+    out = {name: np.empty(shape) for name in ("theta", "omega", "r", "Fe", "tension")}
+    out["bob"] = np.empty(shape + (3,))
+    for frame in range(n_frames):
+        _, bob, r, magnitude, tension = accelerations(theta, omega, np.broadcast_to(q2[frame], theta.shape + (2,)))
+        out["theta"][frame], out["omega"][frame], out["r"][frame] = theta, omega, r
+        out["Fe"][frame], out["tension"][frame], out["bob"][frame] = magnitude, tension, bob
+        q2_next = q2[min(frame + 1, n_frames - 1)]
+        for step in range(substeps):
+            q2_now = q2[frame] + (q2_next - q2[frame]) * (step / substeps)
+            alpha = accelerations(theta, omega, np.broadcast_to(q2_now, theta.shape + (2,)))[0]
+            omega = omega + alpha * h
+            theta = theta + omega * h
+            # The bob stops at the limit instead of pressing against it with its full velocity
+            clipped = np.abs(theta) > max_theta
+            theta, omega = np.clip(theta, -max_theta, max_theta), np.where(clipped, 0.0, omega)
+    if np.ndim(theta_start) == 0:
+        out = {name: values[:, 0] for name, values in out.items()}
+    return out
+
+
+class DynamicPendulumTrajectory:
+    """Per-frame table of the integrated (swinging) pendulum along a q2 schedule.
+
+    Rows are indexed by time since the schedule started rather than by q2, since
+    the state depends on the whole history. ``settle_time`` keeps integrating with
+    q2 at rest after the last step so the swing can die down.
+    """
+
+    def __init__(self, times, q2_x, q2_y, frame_rate, **physics):
+        self.frame_rate = frame_rate
+        self.time = np.asarray(times, dtype=float)
+        self.q2_x = np.asarray(q2_x, dtype=float)
+        q2 = np.column_stack([self.q2_x, np.full_like(self.q2_x, q2_y)])
+        state = integrate_pendulum(q2, frame_rate, **physics)
+        self.theta, self.omega, self.r, self.Fe = state["theta"], state["omega"], state["r"], state["Fe"]
+        self.tension, self.bob = state["tension"], state["bob"]
+
+    @classmethod
+    def from_schedule(cls, start_value, steps, frame_rate, q2_y, settle_time=3.0, **physics):
+        steps = list(steps) + ([("wait", settle_time)] if settle_time > 0 else [])
+        times, values = tracker_schedule(start_value, steps, frame_rate)
+        return cls(times, values, q2_y, frame_rate, **physics)
+
+    def __len__(self):
+        return len(self.time)
+
+    def state_at_time(self, t):
+        index = int(np.clip(round(t * self.frame_rate), 0, len(self.time) - 1))
+        return self.r[index], self.Fe[index], self.theta[index], self.bob[index]
+
+    def as_columns(self):
+        return {
+            "time": self.time, "q2_x": self.q2_x, "r": self.r, "Fe": self.Fe, "theta": self.theta,
+            "omega": self.omega, "tension": self.tension, "bob_x": self.bob[:, 0], "bob_y": self.bob[:, 1],
+        }
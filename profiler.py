@@ -0,0 +1,229 @@
+"""Per-stage, per-updater and per-frame timing of a scene render.
+
+A ``RenderProfiler`` attached to a scene times nested spans (construct stages,
+scene helpers such as ``setup_demo_environment``, LaTeX compilation, every
+mobject updater, with the ``PendulumSceneState`` drivers and bound dependents
+nested inside the state's own, rasterization and encoding)
+and every rendered frame. With a ``FramePipeline`` the render loop only queues
+frames (``enqueue``) and ``encode`` is the pipeline thread's writes to ffmpeg,
+recorded as a top-level span of their own. ``write`` saves a JSON summary and a folded-stacks
+file (``stage;helper;updater self_microseconds``) for flamegraph.pl/speedscope.
+
+Nothing is wrapped unless profiling is requested, either with the scene's
+``profile_dir`` attribute or the ``COULOMB_PROFILE`` environment variable:
+
+    COULOMB_PROFILE=media/profile manim -ql coulomb.py CoulombPendulum
+"""
+import contextlib
+import inspect
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+# Scene helpers timed as spans inside their stage
+PROFILED_METHODS = (
+    "setup_scene_parameters", "setup_pendulum_updaters", "setup_demo_environment", "create_dynamic_visuals",
+    "setup_bob_and_Fe_physics_updater", "create_graph_for_distance", "create_field_layer", "cleanup_demo_visuals",
+)
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def mobject_updater_name(mobject, updater):
+    # "Type:function", with the defining method kept for closures: always_redraw's lambda is
+    # told apart by the mobject type it redraws, a field layer updater by its method
+    name = getattr(updater, "__qualname__", type(updater).__name__).replace(".<locals>", "")
+    return f"{type(mobject).__name__}:{name}"
+
+
+def profile_dir_for(scene):
+    return getattr(scene, "profile_dir", None) or os.environ.get("COULOMB_PROFILE") or None
+
+
+class RenderProfiler:
+    def __init__(self, trace_memory=False):
+        self.stack = []
+        self.totals = defaultdict(float) # span path -> inclusive seconds
+        self.counts = defaultdict(int)
+        self.maxima = defaultdict(float)
+        self.frame_times = []
+        self.stage_memory = {}
+        self.trace_memory = trace_memory
+        self._frame_started = None
+        self._restore = []
+        self._takes_dt = {}
+
+    @contextlib.contextmanager
+    def span(self, name):
+        self.stack.append(name)
+        path = tuple(self.stack)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.totals[path] += elapsed
+            self.counts[path] += 1
+            self.maxima[path] = max(self.maxima[path], elapsed)
+            self.stack.pop()
+
+    def call(self, name, func, *args, **kwargs):
+        with self.span(name):
+            return func(*args, **kwargs)
+
+    def wrap(self, name, func):
+        def profiled(*args, **kwargs):
+            with self.span(name):
+                return func(*args, **kwargs)
+        profiled.__wrapped__ = func
+        return profiled
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self.trace_memory: tracemalloc.reset_peak()
+        peak_before = peak_rss_mb()
+        with self.span(f"stage:{name}"):
+            yield
+        # ru_maxrss only gives the process-wide peak so far; the stage raised it by the difference
+        peak = peak_rss_mb()
+        self.stage_memory[name] = {"process_peak_rss_mb": round(peak, 1), "peak_rss_growth_mb": round(peak - peak_before, 1)}
+        if self.trace_memory: self.stage_memory[name]["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+
+    def record(self, name, elapsed):
+        # A top-level span timed elsewhere, e.g. on another thread, where the span stack does not apply
+        path = (name,)
+        self.totals[path] += elapsed
+        self.counts[path] += 1
+        self.maxima[path] = max(self.maxima[path], elapsed)
+
+    def attach(self, scene):
+        """Wrap the scene's helpers, LaTeX compilation and its renderer's per-frame calls."""
+        import manim.mobject.text.tex_mobject as tex_mobject
+
+        if self.trace_memory and not tracemalloc.is_tracing(): tracemalloc.start()
+        for name in PROFILED_METHODS:
+            if hasattr(scene, name): setattr(scene, name, self.wrap(name, getattr(scene, name)))
+        self._restore.append((tex_mobject, "tex_to_svg_file", tex_mobject.tex_to_svg_file))
+        tex_mobject.tex_to_svg_file = self.wrap("latex", tex_mobject.tex_to_svg_file)
+
+        self._wrap_mobject_updaters()
+
+        renderer = scene.renderer
+        update_to_time = scene.update_to_time
+        def frame_update_to_time(t):
+            self._frame_started = time.perf_counter()
+            with self.span("updaters"):
+                return update_to_time(t)
+        scene.update_to_time = frame_update_to_time
+
+        render = renderer.render
+        def frame_render(*args, **kwargs):
+            started = self._frame_started or time.perf_counter()
+            result = render(*args, **kwargs)
+            self.frame_times.append(time.perf_counter() - started)
+            self._frame_started = None
+            return result
+        renderer.render = frame_render
+        renderer.update_frame = self.wrap("rasterize", renderer.update_frame)
+        pipeline = getattr(scene, "frame_pipeline", None)
+        if pipeline is None:
+            renderer.file_writer.write_frame = self.wrap("encode", renderer.file_writer.write_frame)
+        else:
+            # write_frame is the bounded-queue put; the pipeline's worker does the encoding
+            renderer.file_writer.write_frame = self.wrap("enqueue", renderer.file_writer.write_frame)
+            pipeline.profiler = self
+        return self
+
+    def _wrap_mobject_updaters(self):
+        # Mobject.update, reimplemented with a span per updater of every family member, so updaters
+        # added straight to mobjects (field layer, readouts, always_redraw) are timed one by one
+        from manim import Mobject
+
+        profiler, takes_dt = self, self._takes_dt
+        def profiled_update(mobject, dt=0, recursive=True):
+            if mobject.updating_suspended: return mobject
+            for updater in mobject.updaters:
+                if updater not in takes_dt: takes_dt[updater] = "dt" in inspect.signature(updater).parameters
+                with profiler.span(f"updater:{mobject_updater_name(mobject, updater)}"):
+                    if takes_dt[updater]: updater(mobject, dt)
+                    else: updater(mobject)
+            if recursive:
+                for submobject in mobject.submobjects: submobject.update(dt, recursive)
+            return mobject
+        self._restore.append((Mobject, "update", Mobject.update))
+        Mobject.update = profiled_update
+
+    def detach(self):
+        # Module-level patches would otherwise outlive the scene (sweeps render many in one process)
+        for owner, name, original in self._restore: setattr(owner, name, original)
+        self._restore.clear()
+        if self.trace_memory and tracemalloc.is_tracing(): tracemalloc.stop()
+
+    def self_times(self):
+        # Exclusive time per path: inclusive time minus that of its direct children
+        exclusive = dict(self.totals)
+        for path, total in self.totals.items():
+            if len(path) > 1 and path[:-1] in exclusive: exclusive[path[:-1]] -= total
+        return exclusive
+
+    def summary(self):
+        frames = np.array(self.frame_times) * 1e3
+        spans = {
+            ";".join(path): {"count": self.counts[path], "total_s": round(total, 6), "max_s": round(self.maxima[path], 6)}
+            for path, total in sorted(self.totals.items(), key=lambda item: -item[1])
+        }
+        return {
+            "spans": spans,
+            "frames": {
+                "count": len(frames),
+                **({"mean_ms": round(frames.mean(), 3), "p50_ms": round(np.percentile(frames, 50), 3),
+                    "p95_ms": round(np.percentile(frames, 95), 3), "max_ms": round(frames.max(), 3)} if len(frames) else {}),
+            },
+            "stages": self.stage_memory,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+
+    def folded(self):
+        return "".join(
+            f"{';'.join(path)} {int(round(seconds * 1e6))}\n"
+            for path, seconds in sorted(self.self_times().items()) if seconds > 0
+        )
+
+    def write(self, output_dir, name):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        json_path, folded_path = output_dir / f"{name}.json", output_dir / f"{name}.folded"
+        json_path.write_text(json.dumps(self.summary(), indent=2))
+        folded_path.write_text(self.folded())
+        return json_path, folded_path
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: spans are a shared no-op context."""
+    _null = contextlib.nullcontext()
+
+    def span(self, name):
+        return self._null
+
+    def stage(self, name):
+        return self._null
+
+    def call(self, name, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def __bool__(self):
+        return False
+
+
+NULL_PROFILER = NullProfiler()
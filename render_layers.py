@@ -0,0 +1,52 @@
+"""Split a render into a geometry layer and a narration text layer.
+
+Mobjects the scene creates through ``CoulombPendulum.narrate`` carry a
+``narration`` flag. ``RenderLayer`` wraps the camera's
+``get_mobjects_to_display`` (which both the static image and every moving
+frame go through): the ``"geometry"`` layer drops the family members of flagged
+mobjects, the ``"text"`` layer keeps only them. Rendered with a transparent
+background, text layers of every locale can be composited over one geometry
+render (layered_render.py), since the narration locale changes neither the
+timeline nor the position of anything outside the text layer.
+"""
+LAYERS = (None, "geometry", "text")
+
+
+def narration_ids(mobjects):
+    ids = set()
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            if getattr(member, "narration", False): ids.update(map(id, member.get_family()))
+    return ids
+
+
+def layer_members(mobjects, layer):
+    """Family members of ``mobjects`` that belong to ``layer``, in drawing order."""
+    members = [member for mobject in mobjects for member in mobject.get_family()]
+    if layer is None: return members
+    text = narration_ids(mobjects)
+    return [member for member in members if (id(member) in text) == (layer == "text")]
+
+
+class RenderLayer:
+    def __init__(self, camera, layer):
+        if layer not in LAYERS: raise ValueError(f"render_layer must be one of {LAYERS}, got {layer!r}")
+        self.camera, self.layer = camera, layer
+        self._original = None
+
+    def install(self):
+        self._original = self.camera.get_mobjects_to_display
+        self.camera.get_mobjects_to_display = self.get_mobjects_to_display
+        return self
+
+    def uninstall(self):
+        if self._original is not None: self.camera.get_mobjects_to_display = self._original
+        self._original = None
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        displayed = self._original(mobjects, include_submobjects, excluded_mobjects)
+        text = narration_ids(mobjects)
+        return [member for member in displayed if (id(member) in text) == (self.layer == "text")]
+
+    def members(self, mobjects):
+        return layer_members(mobjects, self.layer)
@@ -0,0 +1,183 @@
+"""Default CoulombPendulum parameters, importable without manim."""
+import math
+
+from narration import LOCALES, REFERENCE_LOCALE, STRINGS
+
+# Where each narration slot goes and at what size. Placements are resolved ahead of
+# rendering from the reference locale's text size (timeline.narration_layout):
+# "edge"/"corner" with "buff" and "shift" mirror to_edge/to_corner(...).shift(...),
+# "next_to" a slot or the "pivot" with "direction" and "buff" mirrors next_to,
+# "move_to" shares a slot's centre, and "below" moves down by a slot's height plus "gap".
+# A slot without a placement stays where the stage puts it.
+NARRATION_LAYOUT = {
+    "title": {"font_size": 36, "place": {"edge": "UP"}}, # written at the centre, then moved here
+    "pivot_label": {"font_size": 24, "place": {"next_to": "pivot", "direction": "UP", "buff": 0.1}},
+    "intro_text": {"font_size": 30, "place": {"edge": "DOWN", "shift": (0, 0.5)}},
+    "neutral_text": {"font_size": 30, "place": {"edge": "DOWN", "shift": (0, 0.5)}},
+    "contact_intro_text": {"font_size": 30, "place": {"move_to": "neutral_text"}},
+    "electrization_text": {"font_size": 30, "place": {"move_to": "neutral_text"}},
+    "both_charged_text": {"font_size": 30, "place": {"move_to": "neutral_text"}},
+    "repulsion_text_popup": {"font_size": 24, "place": {"next_to": "both_charged_text", "direction": "UP", "buff": 0.2}},
+    "forces_title": {"font_size": 40, "place": {"edge": "UP", "buff": 0.5}},
+    "forces_text": {"font_size": 30, "place": {"edge": "DOWN", "shift": (0, 0.5)}},
+    "simplify_text": {"font_size": 30, "place": {"move_to": "forces_text"}},
+    "distance_title": {"font_size": 40, "place": {"edge": "UP", "buff": 0.5}},
+    "distance_narrative": {"font_size": 24, "place": {"edge": "DOWN"}},
+    "charge_product_title": {"font_size": 40, "place": {"edge": "UP", "buff": 0.5}},
+    "q_factor_text": {"font_size": 24, "place": {"edge": "DOWN"}},
+    "coulomb_title": {"font_size": 40, "place": {"edge": "UP", "buff": 0.5}},
+    "summary_text": {"font_size": 30, "place": {"corner": "UL", "buff": 0.5, "below": "coulomb_title", "gap": 0.5}},
+    "k_explanation_final": {"font_size": 22, "place": None}, # in the slot under the final formula
+    "two_pendulum_title": {"font_size": 36, "place": {"edge": "UP"}},
+}
+PLACEMENT_KEYS = {"edge", "corner", "buff", "shift", "next_to", "direction", "move_to", "below", "gap"}
+
+DEFAULT_LAYOUT = {
+    "q2_start_offset": 3.5, # q2 enters this far left of the bob's rest position
+    "q2_rest_offset": 1.8, # and settles this far left of it (fixed_charge_final_pos_value)
+    "pivot_radius": 0.08,
+    "narration": NARRATION_LAYOUT,
+}
+
+# Duration in seconds of every play and wait of each stage, in order. None is the
+# Write time of the narration slot of the same name; "_hold" waits may be 0 (skipped).
+# The demos' tracker moves come from their schedules instead.
+DEFAULT_BEATS = {
+    "show_title": {"title": None, "title_hold": 1, "title_to_top": 1},
+    "setup_pendulum": {"pivot": 1, "pendulum": 1, "bob_label": 1, "pendulum_hold": 1},
+    "introduce_fixed_charge": {"intro_text": None, "q2_appear": 1, "q2_approach": 1, "intro_fade": 1, "q2_hold": 0.5},
+    "show_repulsion_effect": {
+        "neutral_text": None, "neutral_hold": 1.5, "contact_intro": 1, "contact_intro_hold": 1,
+        "contact": 1, "contact_hold": 0.5, "electrization": 1, "bob_charge": 1, "plus_q1": 1, "plus_q1_hold": 0.5,
+        "q2_return": 1, "q2_return_hold": 0.5, "both_charged": 1, "repulsion_text_popup": None,
+        "deflect": 2, "deflect_hold": 1, "narration_fade": 1, "repulsion_hold": 0.5,
+    },
+    "show_complete_force_diagram_then_simplify": {
+        "title": 1, "forces_text": None, "Fg": 1, "Fg_hold": 0.5, "Fe": 1, "Fe_hold": 0.5, "T": 1, "T_hold": 1.5,
+        "simplify": 1, "fade_Fg_T": 1, "simplify_hold": 0.5, "fade_Fe": 1,
+    },
+    "demonstrate_distance_effect": {
+        "title": 1, "prop_text": 1, "readouts": 2, "axes": 1, "graph": 1, "graph_dot": 1, "graph_hold": 1,
+        "fitted_curve": 1, "distance_narrative": None, "field_layer": 1, "narration_fade": 1, "graph_fade": 1,
+        "demo_fade": 1, "return_q2": 0.5, "return_bob": 1, "demo_hold": 0.5,
+    },
+    "demonstrate_charge_product_effect": {
+        "title": 1, "prop_text": 1, "readouts": 2, "q_factor_text": None, "q_factor_hold": 1, "narration_fade": 1,
+        "demo_fade": 1, "return_q2": 0.5, "return_bob": 1, "demo_hold": 0.5,
+    },
+    "explain_coulomb_law": {
+        "title": 1, "restore_bob": 1, "restore_q2": 1, "settle_hold": 0.2, "final_vectors": 2.5, "final_vectors_hold": 1,
+        "summary_text": None, "prop_q": 1, "prop_q_hold": 1, "prop_r": 1, "prop_r_hold": 1,
+        "prop_combined": 1, "prop_combined_hold": 1, "law": 1, "k_explanation_final": None, "law_hold": 5,
+        "fade_vectors": 1, "fade_vectors_hold": 1, "fade_all": 1, "end_hold": 2,
+    },
+    "show_two_pendulum_system": {
+        "two_pendulum_title": None, "charges": 1, "charges_hold": 1, "q3_in": 4, "q3_in_hold": 1,
+        "q3_out": 4, "q3_out_hold": 1, "fade": 1,
+    },
+}
+
+DEFAULT_PARAMETERS = {
+    "pivot_point": (0.0, 2.5, 0.0),
+    "pendulum_length": 2.5,
+    "bob_radius": 0.2,
+    "fixed_charge_radius": 0.25,
+    "force_scale": 1.2,
+    "theta_equilibrium": math.pi / 6,
+    # charge_product_factor_tracker schedule of demonstrate_charge_product_effect
+    "charge_product_steps": (
+        ("move", 2.5, 3), ("wait", 1),
+        ("move", 0.2, 3.5), ("wait", 1),
+        ("move", 1.0, 2), ("wait", 1),
+    ),
+    # q2 x positions of demonstrate_distance_effect; None derives them from the geometry (headless_timeline.distance_steps)
+    "distance_steps": None,
+    # "quasi_static" snaps theta to arctan(F_e / force_scale); "dynamic" integrates the swing
+    "pendulum_dynamics": "quasi_static",
+    "gravity": 9.8,
+    "damping": 0.8,
+    # Background of the distance demo: None, "magnitude" (|E|) or "potential" (V); field_lines traces E from q1 and q2
+    "field_layer": None,
+    "field_lines": False,
+    # Language of the narration text (narration.py); layout and Write timings follow the reference locale
+    "locale": REFERENCE_LOCALE,
+    # Measured (r, theta) pairs in scene units and radians: fitted for q1q2 (charge_fit.py) and drawn on the F_e graph
+    "measurements": None,
+    # Declarative timeline (timeline.py): the stages to run, in order (None runs STAGES), overrides of
+    # DEFAULT_LAYOUT and DEFAULT_BEATS, and the narration key each slot shows
+    "stages": None,
+    "layout": {},
+    "beats": {},
+    "narration_keys": {},
+}
+PENDULUM_DYNAMICS = ("quasi_static", "dynamic")
+FIELD_LAYERS = (None, "magnitude", "potential")
+
+
+def _tracker_steps(name, steps):
+    steps = tuple(tuple(step) for step in steps)
+    for step in steps:
+        if step[0] not in ("move", "wait"): raise ValueError(f"Unknown tracker step {step!r}")
+        if (step[2] if step[0] == "move" else step[1]) <= 0: raise ValueError(f"{name}: step {step!r} must last > 0 s")
+    return steps
+
+
+def _merge_layout(overrides):
+    unknown = set(overrides) - set(DEFAULT_LAYOUT)
+    if unknown: raise KeyError(f"Unknown layout entries: {sorted(unknown)}")
+    layout = {**DEFAULT_LAYOUT, **overrides}
+    narration = dict(NARRATION_LAYOUT)
+    for slot, entry in overrides.get("narration", {}).items():
+        if slot not in NARRATION_LAYOUT: raise KeyError(f"Unknown narration slot {slot!r}")
+        narration[slot] = {**NARRATION_LAYOUT[slot], **entry}
+        place = narration[slot]["place"]
+        if place is not None and set(place) - PLACEMENT_KEYS:
+            raise KeyError(f"{slot}: unknown placement entries {sorted(set(place) - PLACEMENT_KEYS)}")
+        if narration[slot]["font_size"] <= 0: raise ValueError(f"{slot}: font_size must be > 0")
+    layout["narration"] = narration
+    return layout
+
+
+def _merge_beats(overrides):
+    beats = {stage: dict(defaults) for stage, defaults in DEFAULT_BEATS.items()}
+    for stage, entries in overrides.items():
+        if stage not in DEFAULT_BEATS: raise KeyError(f"Unknown stage {stage!r} in beats")
+        for name, seconds in entries.items():
+            if name not in DEFAULT_BEATS[stage]: raise KeyError(f"Unknown beat {name!r} of {stage}")
+            if seconds is None and DEFAULT_BEATS[stage][name] is not None:
+                raise ValueError(f"{stage}.{name}: only narration beats default to their Write time")
+            if seconds is not None and not (seconds >= 0 if name.endswith("_hold") else seconds > 0):
+                raise ValueError(f"{stage}.{name} must be {'>= 0' if name.endswith('_hold') else '> 0'} s, got {seconds!r}")
+            beats[stage][name] = seconds
+    return beats
+
+
+def resolve_parameters(overrides=None):
+    overrides = dict(overrides or {})
+    unknown = set(overrides) - set(DEFAULT_PARAMETERS)
+    if unknown: raise KeyError(f"Unknown scene parameters: {sorted(unknown)}")
+    params = {**DEFAULT_PARAMETERS, **overrides}
+    params["charge_product_steps"] = _tracker_steps("charge_product_steps", params["charge_product_steps"])
+    if params["distance_steps"] is not None:
+        params["distance_steps"] = _tracker_steps("distance_steps", params["distance_steps"])
+    if params["pendulum_dynamics"] not in PENDULUM_DYNAMICS:
+        raise ValueError(f"pendulum_dynamics must be one of {PENDULUM_DYNAMICS}, got {params['pendulum_dynamics']!r}")
+    if params["field_layer"] not in FIELD_LAYERS:
+        raise ValueError(f"field_layer must be one of {FIELD_LAYERS}, got {params['field_layer']!r}")
+    if params["locale"] not in LOCALES:
+        raise ValueError(f"locale must be one of {LOCALES}, got {params['locale']!r}")
+    if params["measurements"] is not None:
+        params["measurements"] = tuple((float(r), float(theta)) for r, theta in params["measurements"])
+        if not params["measurements"] or any(r <= 0 for r, _ in params["measurements"]):
+            raise ValueError("measurements must be a non-empty sequence of (r, theta) pairs with r > 0")
+    if params["stages"] is not None:
+        params["stages"] = tuple(params["stages"])
+        unknown = [stage for stage in params["stages"] if stage not in DEFAULT_BEATS]
+        if unknown: raise KeyError(f"Unknown stages: {unknown}")
+        if len(set(params["stages"])) != len(params["stages"]): raise ValueError("stages repeat a stage")
+    params["layout"] = _merge_layout(params["layout"])
+    params["beats"] = _merge_beats(params["beats"])
+    for slot, key in params["narration_keys"].items():
+        if slot not in NARRATION_LAYOUT: raise KeyError(f"Unknown narration slot {slot!r}")
+        if key not in STRINGS[REFERENCE_LOCALE]: raise KeyError(f"Unknown narration key {key!r} for {slot}")
+    return params
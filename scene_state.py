@@ -0,0 +1,110 @@
+from manim import Mobject
+import numpy as np
+
+
+class PendulumSceneState(Mobject):
+    """Per-frame state of the pendulum scene, updated in a single pass.
+
+    Its one updater reads the bob and q2 positions once, runs the registered
+    drivers (which may move q2 or the bob and set ``r`` and ``Fe``), then
+    re-applies each bound dependent only when one of the inputs it declared
+    changed since the last time it was applied.
+    """
+
+    INPUTS = ("bob", "q2", "r", "Fe", "charge_factor")
+
+    def __init__(self, bob, fixed_charge, **kwargs):
+        super().__init__(**kwargs)
+        self.bob, self.fixed_charge = bob, fixed_charge
+        self.charge_factor_tracker = None
+        self.bob_pos = bob.get_center()
+        self.q2_pos = fixed_charge.get_center()
+        self.r, self.Fe, self.charge_factor = None, None, 1.0
+        self.clock = None # seconds of rendered frames since start_clock(); only advanced once started
+        self._renderer, self._clock_origin = None, 0.0
+        self.drivers = {}
+        self.dependents = {}
+        self._applied_inputs = {}
+        self.profiler = None # a RenderProfiler times each driver and dependent when set
+        self.add_updater(self._frame_updater)
+
+    def _frame_updater(self, mobject):
+        self.refresh()
+
+    def _timed_frame_updater(self, mobject, dt):
+        if self.clock is not None:
+            # Summing dt would lose a frame per play (each play's first update has dt = 0), so the
+            # clock follows the renderer's time, which advances per emitted frame and by the whole
+            # duration of a skipped or cached play
+            self.clock = self._renderer.time - self._clock_origin
+        self.refresh()
+
+    def start_clock(self, renderer):
+        # A time-based updater makes waits render every frame, which a swinging bob needs
+        self.clock, self._renderer = 0.0, renderer
+        self._clock_origin = renderer.time
+        self.remove_updater(self._frame_updater)
+        if self._timed_frame_updater not in self.get_updaters(): self.add_updater(self._timed_frame_updater)
+
+    def stop_clock(self):
+        self.clock, self._renderer = None, None
+        self.remove_updater(self._timed_frame_updater)
+        if self._frame_updater not in self.get_updaters(): self.add_updater(self._frame_updater)
+
+    def move_bob(self, position):
+        self.bob.move_to(position)
+        self.bob_pos = self.bob.get_center()
+
+    def move_q2(self, position):
+        self.fixed_charge.move_to(position)
+        self.q2_pos = self.fixed_charge.get_center()
+
+    def add_driver(self, name, func):
+        self.drivers[name] = func
+
+    def clear_drivers(self):
+        self.drivers.clear()
+        self.stop_clock()
+
+    def bind(self, name, mobject, inputs, apply, group="pendulum"):
+        unknown = set(inputs) - set(self.INPUTS)
+        if unknown: raise ValueError(f"Unknown state inputs {sorted(unknown)} for {name!r}")
+        self.dependents[name] = (mobject, tuple(inputs), apply, group)
+        self._applied_inputs.pop(name, None) # (re)bound dependents are applied on the next pass
+
+    def unbind(self, *names):
+        for name in names:
+            self.dependents.pop(name, None)
+            self._applied_inputs.pop(name, None)
+
+    def clear_group(self, group):
+        self.unbind(*[name for name, entry in self.dependents.items() if entry[3] == group])
+
+    def input_values(self):
+        return {
+            "bob": tuple(np.round(self.bob_pos, 9)), "q2": tuple(np.round(self.q2_pos, 9)),
+            "r": self.r, "Fe": self.Fe, "charge_factor": self.charge_factor,
+        }
+
+    def refresh(self):
+        self.bob_pos = self.bob.get_center()
+        self.q2_pos = self.fixed_charge.get_center()
+        if self.charge_factor_tracker is not None: self.charge_factor = self.charge_factor_tracker.get_value()
+        for name, driver in list(self.drivers.items()):
+            if self.profiler is None: driver(self)
+            else: self.profiler.call(_updater_name(name, driver), driver, self)
+
+        values = self.input_values()
+        for name, (mobject, inputs, apply, _) in list(self.dependents.items()):
+            key = tuple(values[i] for i in inputs)
+            if self._applied_inputs.get(name) != key:
+                if self.profiler is None: apply(mobject, self)
+                else: self.profiler.call(_updater_name(name, apply), apply, mobject, self)
+                self._applied_inputs[name] = key
+        return self
+
+
+def _updater_name(name, func):
+    # Named updater functions keep their own name; lambdas are reported by their binding
+    func_name = getattr(func, "__name__", "<lambda>")
+    return name if func_name == "<lambda>" else func_name
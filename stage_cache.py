@@ -0,0 +1,150 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import config, __version__ as manim_version
+
+from narration import STRINGS as NARRATION_STRINGS
+from stage_dependencies import project_digest, stage_dependencies
+
+
+def _feed_array(h, array):
+    array = np.asarray(array, dtype=float)
+    h.update(str(array.shape).encode())
+    h.update(np.round(array, 6).tobytes())
+
+
+def hash_scene_state(scene, h=None):
+    # Geometry and style of everything on screen; rounded so that a skipped stage
+    # (one final update) and a rendered one (per-frame updates) hash identically.
+    h = h or hashlib.sha256()
+    for mob in scene.mobjects:
+        for member in mob.get_family():
+            h.update(type(member).__name__.encode())
+            _feed_array(h, member.points)
+            for getter in ("get_fill_rgbas", "get_stroke_rgbas"):
+                if hasattr(member, getter): _feed_array(h, getattr(member, getter)())
+            h.update(repr((getattr(member, "stroke_width", None), getattr(member, "z_index", 0))).encode())
+    return h
+
+
+def hash_parameters(params, h=None):
+    h = h or hashlib.sha256()
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, np.ndarray): value = np.round(value, 6).tolist()
+        h.update(f"{name}={value!r};".encode())
+    return h
+
+
+class StageCache:
+    """Content-addressed cache of rendered construct stages.
+
+    A stage's key covers the render settings, the scene parameters the stage
+    depends on, the source of the stage method and every method it calls (and so
+    every Tex/MathTex string in them), the project modules the scene imports, the
+    narration table and the mobject state the stage starts from. Stages whose key already has a video are run with
+    animations skipped and their cached segment is spliced into the final movie.
+    """
+
+    def __init__(self, scene, cache_dir=None):
+        self.scene = scene
+        self.cache_dir = Path(cache_dir or Path(config.media_dir) / "stage_cache" / type(scene).__name__)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.extension = config.movie_file_extension
+        self.stages = []
+        scene_class = type(scene)
+        source = inspect.getsourcefile(scene_class)
+        self.dependencies = stage_dependencies(source, scene_class.__name__, scene_class.STAGES)
+        self.modules_digest = project_digest(source)
+
+    def render_settings(self):
+        return {
+            "manim": manim_version, "pixel_width": config.pixel_width, "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate, "background_color": str(config.background_color),
+            "extension": self.extension, "transparent": config.transparent,
+            "render_layer": getattr(self.scene, "render_layer", None),
+        }
+
+    def stage_key(self, stage):
+        h = hashlib.sha256()
+        h.update(json.dumps(self.render_settings(), sort_keys=True).encode())
+        dependencies = self.dependencies[stage]
+        parameters = self.scene.scene_parameters()
+        used = {name: parameters[name] for name in dependencies["parameters"]}
+        # A stage plays only its own beats (scene_parameters.DEFAULT_BEATS)
+        if "beats" in used: used["beats"] = parameters["beats"][stage]
+        hash_parameters(used, h)
+        h.update(dependencies["source"].encode())
+        h.update(self.modules_digest.encode())
+        # Stage methods look their text up by key; the reference locale also decides layout and timing
+        h.update(json.dumps(NARRATION_STRINGS, sort_keys=True).encode())
+        hash_scene_state(self.scene, h)
+        return f"{stage}-{h.hexdigest()[:20]}"
+
+    def cached_path(self, key):
+        return self.cache_dir / f"{key}{self.extension}"
+
+    def begin(self, stage):
+        key = self.stage_key(stage)
+        cached = self.cached_path(key).exists()
+        self.stages.append((stage, key, cached))
+        return cached
+
+    def store_rendered_sections(self):
+        file_writer = self.scene.renderer.file_writer
+        rendered = {s.name: Path(file_writer.sections_output_dir) / s.video for s in file_writer.sections if s.video}
+        for stage, key, cached in self.stages:
+            if not cached and stage in rendered and rendered[stage].exists():
+                # Parallel workers may store the same key concurrently; publish atomically
+                target = self.cached_path(key)
+                partial = target.with_name(f"{target.stem}.{os.getpid()}.partial{self.extension}")
+                shutil.copyfile(rendered[stage], partial)
+                os.replace(partial, target)
+
+    def splice(self, output_path=None):
+        self.store_rendered_sections()
+        segments = [self.cached_path(key) for _, key, _ in self.stages]
+        missing = [str(p) for p in segments if not p.exists()]
+        if missing: raise FileNotFoundError(f"Missing stage segments: {missing}")
+        output_path = Path(output_path or self.scene.renderer.file_writer.movie_file_path)
+        concat_segments(segments, output_path)
+        return output_path
+
+    def summary(self):
+        return [{"stage": stage, "key": key, "cached": cached} for stage, key, cached in self.stages]
+
+
+def ffmpeg_executable():
+    # The binary manim encodes with, so every ffmpeg step of the pipeline uses the same build
+    return str(config.ffmpeg_executable)
+
+
+def ffprobe_executable():
+    # ffprobe ships next to ffmpeg; a bare "ffmpeg" resolves "ffprobe" through PATH the same way
+    ffmpeg = Path(ffmpeg_executable())
+    return str(ffmpeg.with_name(ffmpeg.name.replace("ffmpeg", "ffprobe")))
+
+
+def concat_segments(segments, output_path):
+    # Stream copy: segments share codec settings, so no re-encode is needed
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for segment in segments:
+            listing.write(f"file '{Path(segment).resolve().as_posix()}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg_executable(), "-y", "-loglevel", "error",
+             "-f", "concat", "-safe", "0", "-i", listing.name, "-c", "copy", str(output_path)],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink(missing_ok=True)
+    return output_path
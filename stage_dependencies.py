@@ -0,0 +1,172 @@
+"""Which scene parameters and methods each construct stage depends on, from the source.
+
+A stage depends on the parameters it reads through ``self`` (directly or in any
+``self.method()`` it calls) and, transitively, on the parameters behind every
+attribute it reads that an earlier method derived from them
+(``self.bob_pos_at_theta_eq`` carries ``theta_equilibrium``, for instance).
+The analysis is static and errs on the side of more dependencies; effects that
+only travel through the mobjects on screen are left to the stage cache, which
+hashes the state each stage starts from. Module-level code in the project
+modules the scene imports is not analysed per stage: project_digest covers it
+as a whole.
+
+    python stage_dependencies.py coulomb.py CoulombPendulum
+"""
+import argparse
+import ast
+import hashlib
+from pathlib import Path
+
+from scene_parameters import DEFAULT_PARAMETERS
+
+
+class _MethodReads(ast.NodeVisitor):
+    """``self`` attributes a method reads, stores and calls, nested functions and lambdas included.
+
+    ``loads`` are the reads through ``self.name`` itself, which fail if nothing set the attribute.
+    """
+
+    def __init__(self):
+        self.reads, self.writes, self.calls, self.loads = set(), set(), set(), set()
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == "self":
+            if isinstance(node.ctx, ast.Store): self.writes.add(node.attr)
+            else: self.reads.add(node.attr); self.loads.add(node.attr)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "self":
+            self.calls.add(func.attr)
+        # getattr(self, "name", ...) and hasattr(self, "name") read the attribute too
+        if (isinstance(func, ast.Name) and func.id in ("getattr", "hasattr") and len(node.args) >= 2
+                and isinstance(node.args[0], ast.Name) and node.args[0].id == "self"
+                and isinstance(node.args[1], ast.Constant) and isinstance(node.args[1].value, str)):
+            self.reads.add(node.args[1].value)
+        self.generic_visit(node)
+
+
+def _classes(source):
+    return {node.name: node for node in ast.parse(source).body if isinstance(node, ast.ClassDef)}
+
+
+def class_stages(source_path, class_name):
+    """The ``STAGES`` tuple of a class, or of the nearest base in the same file that sets it."""
+    classes = _classes(Path(source_path).read_text(encoding="utf-8"))
+    pending = [class_name]
+    while pending:
+        node = classes.get(pending.pop(0))
+        if node is None: continue
+        for item in node.body:
+            if isinstance(item, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "STAGES" for t in item.targets):
+                return tuple(ast.literal_eval(item.value))
+        pending.extend(base.id for base in node.bases if isinstance(base, ast.Name))
+    raise KeyError(f"{class_name} has no STAGES in {source_path}")
+
+
+def class_methods(source_path, class_name):
+    """``{name: (reads, writes, calls, source, loads)}`` of a class and its bases defined in the same file."""
+    source = Path(source_path).read_text(encoding="utf-8")
+    classes = _classes(source)
+    if class_name not in classes: raise KeyError(f"{class_name} is not defined in {source_path}")
+
+    def collect(name):
+        node = classes[name]
+        methods = {}
+        for base in node.bases: # bases first, so overrides win
+            if isinstance(base, ast.Name) and base.id in classes: methods.update(collect(base.id))
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                visitor = _MethodReads()
+                visitor.visit(item)
+                methods[item.name] = (visitor.reads, visitor.writes, visitor.calls, ast.get_source_segment(source, item),
+                                      visitor.loads)
+        return methods
+    return collect(class_name)
+
+
+def reachable_methods(methods, name):
+    seen, pending = set(), [name]
+    while pending:
+        current = pending.pop()
+        if current in seen or current not in methods: continue
+        seen.add(current)
+        pending.extend(methods[current][2])
+    return seen
+
+
+def project_modules(source_path):
+    """Project modules (files next to ``source_path``) it imports, directly or through each other, dependencies first."""
+    root = Path(source_path).parent
+    order, seen = [], set()
+
+    def visit(path):
+        if path in seen: return
+        seen.add(path)
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))): # imports inside functions count too
+            if isinstance(node, ast.Import): names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level: names = [node.module]
+            else: continue
+            for name in names:
+                candidate = root / f"{name.split('.')[0]}.py"
+                if candidate.exists(): visit(candidate)
+        order.append(path)
+
+    source_path = Path(source_path)
+    visit(source_path)
+    return [path for path in order if path != source_path]
+
+
+def project_digest(source_path):
+    """Digest of every project module the scene imports; an edit to any of them may change any stage."""
+    h = hashlib.sha256()
+    for path in project_modules(source_path):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def stage_dependencies(source_path, class_name, stages=None, parameters=tuple(DEFAULT_PARAMETERS)):
+    """``{stage: {"parameters": [...], "methods": [...], "source": str}}``."""
+    methods = class_methods(source_path, class_name)
+    stages = stages or class_stages(source_path, class_name)
+    parameters = set(parameters)
+    reads = {name: set().union(*(methods[m][0] for m in reachable_methods(methods, name))) for name in methods}
+
+    # Parameters behind each derived attribute, iterated to a fixpoint across methods
+    derived = {}
+    changed = True
+    while changed:
+        changed = False
+        for name, (_, writes, *_) in methods.items():
+            behind = reads[name] & parameters
+            for attribute in reads[name] - parameters: behind |= derived.get(attribute, set())
+            for attribute in writes - parameters:
+                if not behind <= derived.setdefault(attribute, set()):
+                    derived[attribute] |= behind
+                    changed = True
+
+    result = {}
+    for stage in stages:
+        used = reads[stage] & parameters
+        for attribute in reads[stage] - parameters: used |= derived.get(attribute, set())
+        called = sorted(reachable_methods(methods, stage))
+        result[stage] = {"parameters": sorted(used), "methods": called,
+                         "source": "\n".join(methods[name][3] for name in called)}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=str(Path(__file__).with_name("coulomb.py")))
+    parser.add_argument("class_name", nargs="?", default="CoulombPendulum")
+    args = parser.parse_args(argv)
+
+    for stage, entry in stage_dependencies(args.source, args.class_name).items():
+        print(f"{stage}\n  parameters: {', '.join(entry['parameters']) or '-'}\n  methods:    {', '.join(entry['methods'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""Reuse the previous frame when nothing on screen changed.
+
+Holds such as ``self.wait(5)`` still render every frame whenever a
+time-based updater is active (the swinging pendulum's clock, for instance),
+and updaters often run without moving anything. Before each frame the whole
+mobject tree is snapshotted (points, colours, stroke widths, z-order and
+image pixels of every family member, in drawing order); when the snapshot
+matches the last rasterized frame, that frame's buffer is handed to the file
+writer again instead of rasterizing a new one. Identical frames also cost
+ffmpeg next to nothing to encode.
+
+When only one render layer is drawn (render_layers.py), ``members`` restricts
+the snapshot to that layer, so a text layer reuses frames while the geometry
+it does not draw keeps moving.
+"""
+
+# Per-member arrays that decide what a mobject looks like
+STYLE_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array")
+STYLE_SCALARS = ("stroke_width", "background_stroke_width", "z_index", "sheen_factor")
+
+
+def family_members(mobjects):
+    return [member for mobject in mobjects for member in mobject.get_family()]
+
+
+def scene_snapshot(mobjects, members=family_members):
+    # The raw bytes themselves rather than a hash: joining and comparing them is a
+    # memcpy and a memcmp, several times cheaper than hashing every frame
+    buffers, scalars = [], []
+    for member in members(mobjects):
+        scalars.append(type(member).__name__)
+        for name in STYLE_ARRAYS:
+            value = getattr(member, name, None)
+            if value is None: continue
+            scalars.append(value.shape)
+            buffers.append(value.data if value.flags.c_contiguous else value.tobytes())
+        scalars.extend(getattr(member, name, None) for name in STYLE_SCALARS)
+    return repr(scalars), b"".join(buffers)
+
+
+class StaticFrameReuse:
+    """Wraps a Cairo renderer's per-frame ``render`` with the snapshot check."""
+
+    def __init__(self, renderer, members=family_members):
+        self.renderer = renderer
+        self.members = members
+        self.frames_rendered = 0
+        self.frames_reused = 0
+        self._last_snapshot = None
+        self._last_frame = None
+        self._original_render = None
+
+    def install(self):
+        self._original_render = self.renderer.render
+        self.renderer.render = self.render
+        return self
+
+    def uninstall(self):
+        if self._original_render is not None: self.renderer.render = self._original_render
+        self._original_render = None
+
+    def invalidate(self):
+        self._last_snapshot = self._last_frame = None
+
+    def render(self, scene, time, moving_mobjects):
+        snapshot = scene_snapshot(scene.mobjects + scene.foreground_mobjects, self.members)
+        if snapshot == self._last_snapshot:
+            self.frames_reused += 1
+            self.renderer.add_frame(self._last_frame)
+            return
+        self.renderer.update_frame(scene, moving_mobjects)
+        frame = self.renderer.get_frame()
+        self.renderer.add_frame(frame)
+        self._last_snapshot, self._last_frame = snapshot, frame
+        self.frames_rendered += 1
+
+    def summary(self):
+        total = self.frames_rendered + self.frames_reused
+        share = 100 * self.frames_reused / total if total else 0.0
+        return f"{self.frames_reused} of {total} frames reused ({share:.0f}%)"
@@ -0,0 +1,131 @@
+"""Render many CoulombPendulum variants in a process pool.
+
+The sweep file is JSON with either an explicit list of variants or a grid that
+is expanded into every combination; ``base`` applies to all variants:
+
+    {
+        "base": {"pendulum_length": 2.5},
+        "grid": {"theta_equilibrium": [0.4, 0.5236], "force_scale": [1.0, 1.2]},
+        "quality": ["l", "h"]
+    }
+
+    {"variants": [{"name": "short", "pendulum_length": 2.0, "quality": "m"}]}
+
+Variants share the Tex cache (warmed once before the pool starts) and the stage
+cache, so re-running a sweep only renders the stages whose inputs changed.
+A manifest with each variant's output path, duration and render time is written
+next to the videos.
+
+    python sweep.py sweep.json --workers 8
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from parallel_render import QUALITIES, render_scene
+from scene_parameters import resolve_parameters
+
+
+def expand_variants(spec):
+    base = dict(spec.get("base", {}))
+    variants = [dict(v) for v in spec.get("variants", [])]
+    grid = spec.get("grid", {})
+    if grid:
+        names = sorted(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            variants.append(dict(zip(names, values)))
+    if not variants: variants = [{}]
+
+    qualities = spec.get("quality", ["l"])
+    if isinstance(qualities, str): qualities = [qualities]
+    expanded = []
+    for variant in variants:
+        for quality in ([variant.pop("quality")] if "quality" in variant else qualities):
+            params = {**base, **variant}
+            name = params.pop("name", None) or "_".join(f"{k}-{v}" for k, v in sorted(params.items()) if k in grid) or "default"
+            resolve_parameters(params) # validate before any worker starts
+            expanded.append({"name": f"{name}_{quality}", "quality": quality, "parameters": params})
+    names = [variant["name"] for variant in expanded]
+    repeated = sorted({name for name in names if names.count(name) > 1})
+    if repeated: raise ValueError(f"Variant names must be unique (they name the output and media dir): {repeated}")
+    return expanded
+
+
+def probe_duration(video_path):
+    from stage_cache import ffprobe_executable
+
+    result = subprocess.run(
+        [ffprobe_executable(), "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(video_path)],
+        capture_output=True, text=True,
+    )
+    try: return float(result.stdout.strip())
+    except ValueError: return None
+
+
+def render_variant(variant, media_dir, stage_cache_dir):
+    started = time.perf_counter()
+    scene = render_scene(
+        {"parameter_overrides": variant["parameters"], "stage_cache_dir": stage_cache_dir, "precompile_tex": False},
+        # A media dir per variant keeps manim's partial movie files and their cleanup from racing across workers
+        {"quality": QUALITIES[variant["quality"]], "media_dir": str(Path(media_dir) / "sweep" / variant["name"]),
+         "output_file": f"CoulombPendulum_{variant['name']}"},
+    )
+    output_path = Path(scene.renderer.file_writer.movie_file_path)
+    return {
+        **variant,
+        "output": str(output_path),
+        "duration": probe_duration(output_path),
+        "render_time": round(time.perf_counter() - started, 3),
+        "cached_stages": [s["stage"] for s in scene.stage_cache.summary() if s["cached"]] if scene.stage_cache else [],
+    }
+
+
+def run_sweep(spec, media_dir="media", workers=None, manifest_path=None):
+    import coulomb
+    from tex_cache import precompile_scene_tex
+
+    variants = expand_variants(spec)
+    precompile_scene_tex(coulomb.__file__, workers=workers)
+    stage_cache_dir = str(Path(media_dir) / "stage_cache" / coulomb.CoulombPendulum.__name__)
+
+    results = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(render_variant, variant, media_dir, stage_cache_dir) for variant in variants]
+        for future in futures:
+            results.append(future.result())
+
+    manifest = {"total_time": round(time.perf_counter() - started, 3), "variants": results}
+    manifest_path = Path(manifest_path or Path(media_dir) / "sweep_manifest.json")
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest_path, manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("spec", help="JSON sweep file")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--manifest", default=None)
+    parser.add_argument("--dry-run", action="store_true", help="only list the expanded variants")
+    args = parser.parse_args(argv)
+
+    spec = json.loads(Path(args.spec).read_text(encoding="utf-8"))
+    if args.dry_run:
+        for variant in expand_variants(spec): print(json.dumps(variant))
+        return 0
+    manifest_path, manifest = run_sweep(spec, args.media_dir, args.workers, args.manifest)
+    for result in manifest["variants"]:
+        print(f"{result['name']:<40} {result['render_time']:7.1f}s  {result['output']}")
+    print(f"Manifest: {manifest_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
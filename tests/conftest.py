@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The modules live at the repository root, next to coulomb.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from charge_fit import GRAVITY, K_COULOMB, fit_charge, monte_carlo, simulate_angles
+
+MASS, LENGTH, Q = 0.002, 0.4, 4e-15
+WEIGHT = MASS * GRAVITY
+R = np.linspace(0.03, 0.12, 10)
+
+
+def angles(r_kind="separation", q=Q, mass=MASS, length=LENGTH):
+    return simulate_angles(R, K_COULOMB * q / (mass * GRAVITY), length, r_kind)
+
+
+def test_rest_angles_balance_the_forces():
+    theta = angles("rest")
+    distance = np.hypot(R + LENGTH * np.sin(theta), LENGTH * (1 - np.cos(theta)))
+    np.testing.assert_allclose(np.tan(theta), K_COULOMB * Q / distance**2 / WEIGHT, rtol=1e-12)
+
+
+@pytest.mark.parametrize("r_kind", ["separation", "rest"])
+def test_noise_free_q(r_kind):
+    best = fit_charge(R, angles(r_kind), K_COULOMB, WEIGHT, LENGTH, r_kind=r_kind)
+    np.testing.assert_allclose(best["q"], Q, rtol=1e-8)
+    assert best["rms_theta"][0] < 1e-10
+
+
+def test_noise_free_mass():
+    best = fit_charge(R, angles("rest"), K_COULOMB, length=LENGTH, fit=("mass",), r_kind="rest", q=Q)
+    np.testing.assert_allclose(best["mass"], MASS, rtol=1e-8)
+
+
+def test_noise_free_q_and_length():
+    # Started 50% off, the length comes back along with q1q2
+    best = fit_charge(R, angles("rest"), K_COULOMB, WEIGHT, LENGTH * 1.5, fit=("q", "length"), r_kind="rest")
+    np.testing.assert_allclose(best["length"], LENGTH, rtol=1e-6)
+    np.testing.assert_allclose(best["q"], Q, rtol=1e-6)
+
+
+def test_groups_are_fitted_independently():
+    charges = np.array([1e-15, 4e-15, 9e-15])
+    theta = np.concatenate([angles(q=q) for q in charges])
+    group = np.repeat(np.arange(3), len(R))
+    best = fit_charge(np.tile(R, 3), theta, K_COULOMB, WEIGHT, group=group)
+    np.testing.assert_allclose(best["q"], charges, rtol=1e-8)
+    np.testing.assert_array_equal(best["n"], len(R))
+
+
+@pytest.mark.parametrize("fit, kwargs, message", [
+    (("q", "mass"), {"weight": WEIGHT, "q": Q}, "q1q2 / m"),
+    (("mass",), {}, "q1q2 is needed"),
+    (("q",), {}, "weight is needed"),
+    (("q", "length"), {"weight": WEIGHT}, "r_kind"),
+])
+def test_underdetermined_fits_are_rejected(fit, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        fit_charge(R, angles(), K_COULOMB, fit=fit, **kwargs)
+
+
+def test_monte_carlo_coverage():
+    # Many noisy datasets of the same pendulum: the 95% interval of each should hold the true q1q2 ~95% of the time
+    rng = np.random.default_rng(1)
+    datasets, sigma = 200, np.radians(0.5)
+    theta = np.tile(angles(), datasets) + rng.normal(0.0, sigma, datasets * len(R))
+    group = np.repeat(np.arange(datasets), len(R))
+    summary = monte_carlo(np.tile(R, datasets), theta, K_COULOMB, WEIGHT, group=group,
+                          sigma_theta=sigma, experiments=400, seed=2)["q"]
+    covered = np.mean((summary["low"] <= Q) & (Q <= summary["high"]))
+    assert 0.88 <= covered <= 0.99
+    # and the spread matches the scatter of the estimates themselves
+    np.testing.assert_allclose(np.median(summary["std"]), summary["estimate"].std(), rtol=0.2)
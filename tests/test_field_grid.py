@@ -0,0 +1,89 @@
+import numpy as np
+
+from field_grid import MAGNITUDE_STOPS, FieldGrid, apply_colormap, trace_field_paths
+
+X_RANGE, Y_RANGE = (-4.0, 4.0), (-3.0, 3.0)
+
+
+def grid_with(positions, charges, width=80, height=60):
+    grid = FieldGrid(X_RANGE, Y_RANGE, width, height, min_distance=1e-6)
+    for key, (position, q) in enumerate(zip(positions, charges)): grid.set_charge(key, position, q)
+    return grid
+
+
+def pixel_centres(grid):
+    x = grid.x_min + (np.arange(grid.width) + 0.5) * grid.pixel_size[0]
+    y = grid.y_max - (np.arange(grid.height) + 0.5) * grid.pixel_size[1]
+    return np.meshgrid(x, y)
+
+
+def direct_sum(grid, positions, charges, X, Y):
+    # Coulomb sum with each charge snapped to its pixel's centre, like the kernel slices
+    Ex, Ey, V = np.zeros_like(X), np.zeros_like(X), np.zeros_like(X)
+    for position, q in zip(positions, charges):
+        row, col = grid.pixel_of(position)
+        cx, cy = grid.x_min + (col + 0.5) * grid.pixel_size[0], grid.y_max - (row + 0.5) * grid.pixel_size[1]
+        dx, dy = X - cx, Y - cy
+        r = np.maximum(np.hypot(dx, dy), 1e-6)
+        Ex, Ey, V = Ex + q * dx / r**3, Ey + q * dy / r**3, V + q / r
+    return Ex, Ey, V
+
+
+def test_kernel_slices_match_the_direct_sum():
+    positions, charges = [(-1.0, 0.5), (2.0, -1.0)], [1.0, -0.5]
+    grid = grid_with(positions, charges)
+    Ex, Ey, V = direct_sum(grid, positions, charges, *pixel_centres(grid))
+    np.testing.assert_allclose(grid.totals["Ex"], Ex, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(grid.totals["Ey"], Ey, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(grid.totals["V"], V, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(grid.magnitude(), np.hypot(Ex, Ey), rtol=1e-9, atol=1e-9)
+
+
+def test_moving_a_charge_equals_rebuilding():
+    grid = grid_with([(-1.0, 0.5), (2.0, -1.0)], [1.0, -0.5])
+    assert grid.set_charge(1, (0.5, 1.5), 2.0)
+    assert not grid.set_charge(1, (0.5, 1.5), 2.0)
+    rebuilt = grid_with([(-1.0, 0.5), (0.5, 1.5)], [1.0, 2.0])
+    for name in ("Ex", "Ey", "V"):
+        np.testing.assert_allclose(grid.totals[name], rebuilt.totals[name], rtol=1e-9, atol=1e-9)
+
+
+def test_sample_field_interpolates_the_grid():
+    centre = np.array([0.05, 0.05]) # a pixel centre, so the charge is not snapped
+    grid = grid_with([centre], [1.0])
+    X, Y = pixel_centres(grid)
+    # At pixel centres the samples are the grid values themselves
+    field = grid.sample_field(np.column_stack([X[10, 5:20], Y[10, 5:20]]))
+    np.testing.assert_allclose(field[:, 0], grid.totals["Ex"][10, 5:20])
+    np.testing.assert_allclose(field[:, 1], grid.totals["Ey"][10, 5:20])
+    # Far from the charge they follow Coulomb's law to within the interpolation error
+    point = np.array([[2.63, 1.87]])
+    offset = point[0] - centre
+    np.testing.assert_allclose(grid.sample_field(point)[0], offset / np.linalg.norm(offset)**3, rtol=0.02)
+
+
+def test_apply_colormap():
+    rgba = apply_colormap(np.array([[0.0, 0.35, 1.0]]), MAGNITUDE_STOPS, opacity=0.5)
+    assert rgba.shape == (1, 3, 4) and rgba.dtype == np.uint8
+    np.testing.assert_array_equal(rgba[0, :, :3], [c for _, c in (MAGNITUDE_STOPS[0], MAGNITUDE_STOPS[1], MAGNITUDE_STOPS[3])])
+    np.testing.assert_array_equal(rgba[..., 3], 127)
+
+
+def test_field_lines_run_from_the_positive_charge():
+    positions, charges = [(-2.05, 0.05), (1.95, 0.05)], [1.0, -1.0] # on pixel centres
+    paths = trace_field_paths(grid_with(positions, charges), positions, charges, lines_per_charge=8)
+    assert len(paths) == 8
+    for path in paths:
+        np.testing.assert_allclose(np.linalg.norm(path[0] - positions[0]), 0.3)
+        # Every line ends at the negative charge or at the border of the grid
+        end = path[-1]
+        at_charge = np.linalg.norm(end - positions[1]) < 0.3
+        at_border = not (X_RANGE[0] + 0.1 < end[0] < X_RANGE[1] - 0.1 and Y_RANGE[0] + 0.1 < end[1] < Y_RANGE[1] - 0.1)
+        assert at_charge or at_border
+    # The line seeded along the axis goes straight to the other charge
+    np.testing.assert_allclose(paths[0][:, 1], 0.05, atol=1e-9)
+    assert np.linalg.norm(paths[0][-1] - positions[1]) < 0.15
+
+
+def test_no_positive_charge_no_lines():
+    assert trace_field_paths(grid_with([(0.0, 0.0)], [-1.0]), [(0.0, 0.0)], [-1.0]) == []
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from headless_timeline import iter_column_blocks
+from narration import LOCALES, STRINGS, narration_text
+from scene_parameters import resolve_parameters
+from timeline import DEMO_SCHEDULES, narration_layout, stage_durations, stage_plays
+
+FPS = 30 # every default beat is a whole number of frames
+# Stand-in text sizes; only the glyph count (and so the Write time) matters here
+METRICS = {narration_text(key, locale): [2.0, 0.5, 10 + len(key) % 10] for locale in LOCALES for key in STRINGS[locale]}
+
+
+def plays_and_durations(overrides):
+    params = resolve_parameters(overrides)
+    layout = narration_layout(params["layout"], params["narration_keys"], params["pivot_point"], metrics=METRICS)
+    return stage_plays(params, layout), stage_durations(params, layout)
+
+
+@pytest.mark.parametrize("overrides", [None, {"pendulum_dynamics": "dynamic"}])
+def test_rows_follow_the_scene_clock(overrides):
+    plays, durations = plays_and_durations(overrides)
+    stages = list(durations)
+    blocks = dict(iter_column_blocks(overrides, FPS, metrics=METRICS))
+    assert set(blocks) == set(DEMO_SCHEDULES)
+    for stage, columns in blocks.items():
+        np.testing.assert_array_equal(np.diff(columns["frame"]), 1)
+        np.testing.assert_allclose(columns["time"], columns["frame"] / FPS)
+        # The schedule starts after every earlier stage and the stage's own beats before it
+        names = [name for name, _ in plays[stage]]
+        first_step = names.index(DEMO_SCHEDULES[stage])
+        start = sum(durations[s] for s in stages[:stages.index(stage)]) + sum(seconds for _, seconds in plays[stage][:first_step])
+        np.testing.assert_allclose(columns["time"][0], start, atol=1e-9)
+        if overrides is None:
+            schedule = sum(seconds for name, seconds in plays[stage] if name == DEMO_SCHEDULES[stage])
+            np.testing.assert_allclose(columns["time"][-1] + 1 / FPS, start + schedule, atol=1e-9)
+
+
+def test_stages_left_out_of_the_scene_have_no_rows():
+    overrides = {"stages": ["show_title", "setup_pendulum", "introduce_fixed_charge", "show_repulsion_effect",
+                            "demonstrate_charge_product_effect"]}
+    blocks = dict(iter_column_blocks(overrides, FPS, metrics=METRICS))
+    assert list(blocks) == ["demonstrate_charge_product_effect"]
+    _, durations = plays_and_durations(overrides)
+    assert blocks["demonstrate_charge_product_effect"]["time"][0] > sum(list(durations.values())[:4])
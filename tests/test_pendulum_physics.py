@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from pendulum_physics import (
+    DynamicPendulumTrajectory, calibrate_k_base, integrate_pendulum, smooth, tracker_schedule,
+)
+
+FPS = 30
+
+
+def test_frames_are_sampled_like_play():
+    steps = [("move", 2.0, 1.0), ("wait", 0.5), ("move", -1.0, 0.7)]
+    times, values = tracker_schedule(0.0, steps, FPS)
+    # Scene.play renders np.arange(0, run_time, 1 / fps) per animation, waits included
+    expected = sum(len(np.arange(0, step[-1], 1 / FPS)) for step in steps)
+    assert len(times) == len(values) == expected
+    assert np.all(np.diff(times) > 0)
+
+
+def test_moves_reach_their_targets_and_waits_hold():
+    times, values = tracker_schedule(1.0, [("move", 3.0, 1.0), ("wait", 1.0), ("move", 0.0, 1.0)], FPS)
+    assert values[0] == 1.0
+    waiting = (times >= 1.0) & (times < 2.0)
+    np.testing.assert_array_equal(values[waiting], 3.0)
+    # The last rendered frame of a move sits one frame short of its end
+    np.testing.assert_allclose(values[-1], 3.0 * (1 - smooth((1.0 - 1 / FPS) / 1.0)))
+
+
+def test_empty_and_unknown_steps():
+    times, values = tracker_schedule(2.5, [], FPS)
+    np.testing.assert_array_equal(values, [2.5])
+    with pytest.raises(ValueError):
+        tracker_schedule(0.0, [("jump", 1.0)], FPS)
+
+
+PIVOT, LENGTH, FORCE_SCALE = np.array([0.0, 2.0, 0.0]), 3.0, 1.0
+
+
+def still_q2(seconds, x=-1.5, y=-1.0):
+    return np.tile([x, y], (int(seconds * FPS), 1))
+
+
+def test_settles_at_the_calibrated_angle():
+    theta_equilibrium = 0.4
+    k_base = calibrate_k_base(theta_equilibrium, [-1.5, -1.0], PIVOT, LENGTH, FORCE_SCALE)
+    state = integrate_pendulum(still_q2(20), FPS, PIVOT, LENGTH, FORCE_SCALE, k_base, damping=1.5)
+    np.testing.assert_allclose(state["theta"][-1], theta_equilibrium, atol=1e-6)
+    assert abs(state["omega"][-1]) < 1e-6
+
+
+def test_free_swing_period():
+    # Without charge, a small swing keeps its amplitude and has period 2 pi sqrt(L / g)
+    state = integrate_pendulum(still_q2(10), FPS, PIVOT, LENGTH, FORCE_SCALE, 0.0, theta_start=0.05, substeps=32)
+    theta = state["theta"]
+    np.testing.assert_allclose(np.abs(theta).max(), 0.05, rtol=1e-3)
+    crossings = np.nonzero((theta[:-1] > 0) & (theta[1:] <= 0))[0]
+    np.testing.assert_allclose(np.diff(crossings).mean() / FPS, 2 * np.pi * np.sqrt(LENGTH / 9.8), rtol=0.02)
+
+
+def test_clipped_bob_stops():
+    max_theta = 0.3
+    state = integrate_pendulum(still_q2(2), FPS, PIVOT, LENGTH, FORCE_SCALE, 50.0, max_theta=max_theta)
+    at_limit = np.isclose(state["theta"], max_theta)
+    assert at_limit.any() and np.all(state["theta"] <= max_theta)
+    np.testing.assert_array_equal(state["omega"][at_limit], 0.0)
+
+
+def test_several_pendulums_in_one_pass():
+    starts = np.array([0.0, 0.2, -0.1])
+    together = integrate_pendulum(still_q2(2), FPS, PIVOT, LENGTH, FORCE_SCALE, 0.5, theta_start=starts)
+    for i, start in enumerate(starts):
+        alone = integrate_pendulum(still_q2(2), FPS, PIVOT, LENGTH, FORCE_SCALE, 0.5, theta_start=start)
+        np.testing.assert_allclose(together["theta"][:, i], alone["theta"], rtol=1e-12, atol=1e-15)
+
+
+def test_dynamic_trajectory_is_indexed_by_frame():
+    steps = [("move", -1.0, 1.0), ("wait", 0.5)]
+    trajectory = DynamicPendulumTrajectory.from_schedule(
+        -3.0, steps, FPS, -1.0, settle_time=1.0, pivot=PIVOT, length=LENGTH, force_scale=FORCE_SCALE, k_base=0.5)
+    assert len(trajectory) == len(tracker_schedule(-3.0, steps + [("wait", 1.0)], FPS)[0])
+    r, Fe, theta, bob = trajectory.state_at_time(12 / FPS)
+    assert theta == trajectory.theta[12] and r == trajectory.r[12]
+    assert trajectory.state_at_time(1e6)[2] == trajectory.theta[-1]
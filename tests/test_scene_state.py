@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from manim import Dot
+
+from scene_state import PendulumSceneState
+
+FPS = 30
+
+
+class PlayingRenderer:
+    """Advances ``time`` the way CairoRenderer.play does and runs the updaters like play_internal."""
+
+    def __init__(self, state):
+        self.state, self.time, self.skip_animations = state, 0.0, False
+
+    def play(self, duration, skip=False):
+        self.skip_animations = skip
+        if skip:
+            # Skipped and cached plays add their whole duration, then update once with it
+            self.time += duration
+            self.state.update(duration)
+            return
+        dt = 1 / FPS
+        for t in np.arange(0, duration, dt):
+            self.state.update(0 if t == 0 else dt)
+            self.time += dt
+
+
+def test_clock_follows_rendered_and_skipped_plays():
+    state = PendulumSceneState(Dot(), Dot([2, 0, 0]))
+    renderer = PlayingRenderer(state)
+    renderer.play(0.5)
+    state.start_clock(renderer)
+    plays = [(1.0, False), (0.7, True), (2.0, False), (1.5, True)]
+    for duration, skip in plays: renderer.play(duration, skip)
+    assert state.clock == pytest.approx(sum(duration for duration, _ in plays), abs=1 / FPS)
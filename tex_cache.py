@@ -0,0 +1,171 @@
+"""Shared on-disk LaTeX cache and a parallel pre-compilation pass.
+
+manim names every compiled Tex/MathTex file by a hash of the full LaTeX source,
+so pointing ``config.tex_dir`` at one machine-wide directory already gives a
+content-addressed cache. This module fills it ahead of rendering: the Tex and
+MathTex strings a scene will create are collected from its source, together
+with every locale of the narration table (narration.py), and compiled
+concurrently in a process pool, each job in a private directory whose SVG is
+then published atomically, so concurrent render jobs never see partial files.
+
+    python tex_cache.py coulomb.py --workers 8
+"""
+import argparse
+import ast
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+TEX_ENVIRONMENTS = {"Tex": "center", "MathTex": "align*"}
+ARG_SEPARATORS = {"Tex": "", "MathTex": " "}
+# Characters DecimalNumber (readouts and axis labels) typesets one by one
+NUMBER_GLYPHS = tuple("0123456789.-")
+
+
+def shared_tex_dir():
+    return Path(os.environ.get("COULOMB_TEX_CACHE", Path.home() / ".cache" / "coulomb_pendulum" / "tex"))
+
+
+def use_shared_tex_cache(tex_dir=None):
+    from manim import config
+
+    tex_dir = Path(tex_dir or shared_tex_dir())
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    config.tex_dir = str(tex_dir)
+    return tex_dir
+
+
+def _break_up_tex_strings(tex_strings, substrings_to_isolate):
+    # Mirrors MathTex._break_up_tex_strings, which decides the string that gets compiled:
+    # {{...}} groups are split out (and lose their braces) first, then the isolated substrings.
+    # Returns the pieces and whether the braces switched the argument separator to ""
+    pieces = sum((re.split("{{(.*?)}}", str(tex_string)) for tex_string in tex_strings), [])
+    braces_split = len(pieces) > len(tex_strings)
+    pattern = "|".join(f"({re.escape(ss)})" for ss in substrings_to_isolate)
+    if pattern: pieces = sum((re.split(pattern, piece) for piece in pieces), [])
+    return [p for p in pieces if p], braces_split
+
+
+def compiled_expression(kind, tex_strings, substrings_to_isolate=()):
+    pieces, braces_split = _break_up_tex_strings(tex_strings, substrings_to_isolate)
+    expression = ("" if braces_split else ARG_SEPARATORS[kind]).join(pieces).strip()
+    return expression or "\\quad"
+
+
+class _TexCallCollector(ast.NodeVisitor):
+    def __init__(self):
+        self.entries = set()
+        self._assigned = [{}]
+
+    def visit_FunctionDef(self, node):
+        assigned = {}
+        for sub in ast.walk(node):
+            if isinstance(sub, ast.Assign) and isinstance(sub.value, ast.Constant) and isinstance(sub.value.value, str):
+                for target in sub.targets:
+                    if isinstance(target, ast.Name): assigned.setdefault(target.id, set()).add(sub.value.value)
+        self._assigned.append(assigned)
+        self.generic_visit(node)
+        self._assigned.pop()
+
+    def _string_options(self, node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str): return {node.value}
+        if isinstance(node, ast.Name): return self._assigned[-1].get(node.id, set())
+        return set()
+
+    def visit_Call(self, node):
+        kind = node.func.id if isinstance(node.func, ast.Name) else None
+        if kind in TEX_ENVIRONMENTS and node.args:
+            environment, isolate = TEX_ENVIRONMENTS[kind], []
+            for keyword in node.keywords:
+                if keyword.arg == "tex_environment" and isinstance(keyword.value, ast.Constant): environment = keyword.value.value
+                if keyword.arg == "tex_to_color_map" and isinstance(keyword.value, ast.Dict):
+                    isolate += [k.value for k in keyword.value.keys if isinstance(k, ast.Constant)]
+            # Only single-argument calls whose string is known statically are collected
+            if len(node.args) == 1:
+                for option in self._string_options(node.args[0]):
+                    self.entries.add((compiled_expression(kind, [option], isolate), environment))
+        self.generic_visit(node)
+
+
+def narration_entries(locales=None):
+    from narration import LOCALES, STRINGS
+
+    return {(compiled_expression("Tex", [text]), TEX_ENVIRONMENTS["Tex"])
+            for locale in (locales or LOCALES) for text in STRINGS[locale].values()}
+
+
+def collect_tex_strings(*source_paths, include_number_glyphs=True, include_narration=True):
+    collector = _TexCallCollector()
+    for path in source_paths:
+        collector.visit(ast.parse(Path(path).read_text(encoding="utf-8")))
+    entries = set(collector.entries)
+    if include_number_glyphs: entries.update((glyph, "align*") for glyph in NUMBER_GLYPHS)
+    if include_narration: entries.update(narration_entries())
+    return sorted(entries)
+
+
+def _cached_svg(entry, tex_dir):
+    # The SVG manim looks for: named by a hash of the full LaTeX source (tex_file_writing.generate_tex_file)
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash
+
+    expression, environment = entry
+    return Path(tex_dir) / f"{tex_hash(config.tex_template.get_texcode_for_expression_in_env(expression, environment))}.svg"
+
+
+def _compile_entry(entry, tex_dir):
+    from manim import tempconfig
+    from manim.utils.tex_file_writing import tex_to_svg_file
+
+    expression, environment = entry
+    target = _cached_svg(entry, tex_dir)
+    if target.exists(): return expression, False
+    with tempfile.TemporaryDirectory(dir=tex_dir, prefix=".job-") as job_dir:
+        with tempconfig({"tex_dir": job_dir}):
+            svg_file = tex_to_svg_file(expression, environment=environment)
+        os.replace(svg_file, target)
+    return expression, True
+
+
+def precompile(entries, tex_dir=None, workers=None):
+    """Compile ``(expression, environment)`` entries missing from the cache; returns the compiled count."""
+    tex_dir = Path(tex_dir or shared_tex_dir())
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    # Checked here first, so a warm cache costs a few hashes and no process pool
+    entries = [entry for entry in entries if not _cached_svg(entry, tex_dir).exists()]
+    if workers == 1 or len(entries) < 2:
+        return sum(_compile_entry(entry, tex_dir)[1] for entry in entries)
+    # Spawned, not forked: CoulombPendulum.setup calls this with its frame pipeline's thread running
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return sum(compiled for _, compiled in pool.map(_compile_entry, entries, [tex_dir] * len(entries)))
+
+
+def precompile_scene_tex(*source_paths, tex_dir=None, workers=None):
+    return precompile(collect_tex_strings(*source_paths), tex_dir, workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-compile the Tex/MathTex strings of a scene into the shared cache")
+    parser.add_argument("sources", nargs="*", default=[str(Path(__file__).with_name("coulomb.py"))])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tex-dir", default=None)
+    parser.add_argument("--list", action="store_true", help="only print the collected strings")
+    args = parser.parse_args(argv)
+
+    entries = collect_tex_strings(*args.sources)
+    if args.list:
+        for expression, environment in entries: print(f"[{environment}] {expression}")
+        return 0
+    started = time.perf_counter()
+    compiled = precompile(entries, args.tex_dir, args.workers)
+    print(f"{compiled} of {len(entries)} strings compiled into {args.tex_dir or shared_tex_dir()} "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,325 @@
+"""Declarative CoulombPendulum timelines: compiled into scene parameters, checked and timed without rendering.
+
+A timeline is a JSON file:
+
+    {
+      "stages": ["show_title", "setup_pendulum", "introduce_fixed_charge", "show_repulsion_effect",
+                 "show_complete_force_diagram_then_simplify", "demonstrate_charge_product_effect",
+                 "explain_coulomb_law"],
+      "parameters": {"force_scale": 1.4, "locale": "en"},
+      "layout": {"q2_rest_offset": 2.2, "narration": {"intro_text": {"font_size": 26}}},
+      "beats": {"show_title": {"title_hold": 2}, "explain_coulomb_law": {"law_hold": 3}},
+      "narration": {"summary_text": "coulomb_title"},
+      "schedules": {"charge_product": [["move", 3, 2], ["wait", 1]], "distance": null}
+    }
+
+Every section is optional and compiles to a scene parameter (``stages``,
+``layout``, ``beats``, ``narration_keys``, ``distance_steps`` and
+``charge_product_steps``; see scene_parameters.py), so a compiled timeline
+renders, caches and watches like any other parameter override. The static
+layout is resolved here, not in the scene: narration placements come from the
+size of the reference locale's text, measured once with manim into a shared
+metrics cache, after which checking a timeline is plain arithmetic:
+
+* the parameters resolve;
+* every stage runs after the stages that set the attributes it reads (from the source);
+* every narration placement, in the timeline's locale, fits the frame;
+* the duration of each stage is the sum of its beats and tracker schedules.
+
+    python timeline.py variants/*.json              # check and time every variant
+    python timeline.py short.json --render -q l     # render one
+    python timeline.py --measure                    # fill the metrics cache (needs manim)
+
+Beats that only run when something is out of place (the demos returning q2 and
+the bob, explain_coulomb_law restoring them) count when the schedules leave it
+out of place, assuming a dynamic pendulum has settled by the end of its demo.
+"""
+import argparse
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from headless_timeline import demo_geometry
+from narration import LOCALES, REFERENCE_LOCALE, STRINGS, narration_text
+from scene_parameters import DEFAULT_PARAMETERS, resolve_parameters
+from stage_dependencies import class_methods, class_stages, reachable_methods
+
+SCENE_SOURCE = Path(__file__).with_name("coulomb.py")
+FRAME = (8.0 * 16 / 9, 8.0) # manim's default frame_width, frame_height
+METRICS_FONT_SIZE = 48 # Tex's default; sizes scale linearly with font_size
+DIRECTIONS = {"UP": (0, 1), "DOWN": (0, -1), "LEFT": (-1, 0), "RIGHT": (1, 0),
+              "UL": (-1, 1), "UR": (1, 1), "DL": (-1, -1), "DR": (1, -1)}
+EDGE_BUFF, NEXT_TO_BUFF = 0.5, 0.25 # MED_LARGE_BUFF for to_edge/to_corner, manim's next_to default
+SECTIONS = {"stages": "stages", "layout": "layout", "beats": "beats", "narration": "narration_keys"}
+SCHEDULES = {"distance": "distance_steps", "charge_product": "charge_product_steps"}
+DEMO_SCHEDULES = {"demonstrate_distance_effect": "distance_steps", "demonstrate_charge_product_effect": "charge_product_steps"}
+# The beat after which each demo plays its tracker schedule
+SCHEDULE_AFTER = {"demonstrate_distance_effect": "field_layer", "demonstrate_charge_product_effect": "q_factor_hold"}
+
+
+def shared_metrics_path():
+    return Path(os.environ.get("COULOMB_LAYOUT_CACHE",
+                               Path.home() / ".cache" / "coulomb_pendulum" / "narration_metrics.json"))
+
+
+def write_time(glyphs):
+    return 1 if glyphs < 15 else 2 # Write's default run_time
+
+
+def measure_texts(texts):
+    """``{text: [width, height, glyphs]}`` of Tex(text) at METRICS_FONT_SIZE, typeset through the shared Tex cache."""
+    from manim import Tex
+    from tex_cache import use_shared_tex_cache
+
+    use_shared_tex_cache()
+    measured = {}
+    for text in texts:
+        tex = Tex(text, font_size=METRICS_FONT_SIZE)
+        measured[text] = [tex.width, tex.height, len(tex.family_members_with_points())]
+    return measured
+
+
+def narration_metrics(texts, path=None, measure=True):
+    """Cached metrics of ``texts``; missing ones are measured (and stored) when ``measure`` is set."""
+    path = Path(path or shared_metrics_path())
+    metrics = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    missing = sorted(set(texts) - set(metrics))
+    if missing:
+        if not measure: raise KeyError(f"{len(missing)} narration texts are not measured yet; run python timeline.py --measure")
+        metrics.update(measure_texts(missing))
+        # Render workers may add entries concurrently; publish atomically
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        partial.write_text(json.dumps(metrics, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(partial, path)
+    return metrics
+
+
+def slot_size(metrics, text, font_size):
+    width, height, _ = metrics[text]
+    return width * font_size / METRICS_FONT_SIZE, height * font_size / METRICS_FONT_SIZE
+
+
+def narration_layout(layout, narration_keys, pivot_point, frame=FRAME, metrics=None):
+    """``{slot: {"key", "font_size", "size", "center", "write_time"}}`` from the reference locale's text sizes.
+
+    ``center`` is None for slots the stage places itself.
+    """
+    slots = layout["narration"]
+    keys = {slot: narration_keys.get(slot, slot) for slot in slots}
+    texts = {slot: narration_text(keys[slot], REFERENCE_LOCALE) for slot in slots}
+    if metrics is None: metrics = narration_metrics(texts.values())
+    half = np.array(frame, dtype=float) / 2
+    pivot_size = 2 * layout["pivot_radius"]
+    anchors = {"pivot": (np.array(pivot_point[:2], dtype=float), np.array([pivot_size, pivot_size]))}
+    resolved = {}
+
+    def box(name, visiting):
+        if name in anchors: return anchors[name]
+        entry = resolve(name, visiting)
+        if entry["center"] is None: raise ValueError(f"{visiting[-1]} is placed relative to {name}, which has no placement")
+        return np.array(entry["center"]), np.array(entry["size"])
+
+    def resolve(slot, visiting=()):
+        if slot in resolved: return resolved[slot]
+        if slot in visiting: raise ValueError(f"Narration placements form a cycle: {' -> '.join(visiting + (slot,))}")
+        if slot not in slots: raise KeyError(f"Unknown placement target {slot!r}")
+        visiting += (slot,)
+        entry, place = slots[slot], slots[slot]["place"]
+        size = np.array(slot_size(metrics, texts[slot], entry["font_size"]))
+        center = None
+        if place is not None:
+            center = np.zeros(2)
+            if "edge" in place or "corner" in place: # to_edge / to_corner
+                direction = np.array(DIRECTIONS[place.get("edge") or place["corner"]])
+                aligned = direction != 0
+                center[aligned] = (direction * (half - place.get("buff", EDGE_BUFF) - size / 2))[aligned]
+            if "move_to" in place:
+                center = box(place["move_to"], visiting)[0].copy()
+            if "next_to" in place:
+                target_center, target_size = box(place["next_to"], visiting)
+                direction = np.array(DIRECTIONS[place.get("direction", "RIGHT")])
+                center = target_center + direction * (target_size / 2 + place.get("buff", NEXT_TO_BUFF) + size / 2)
+            if "below" in place:
+                center[1] -= box(place["below"], visiting)[1][1] + place.get("gap", 0)
+            center += np.array(place.get("shift", (0, 0)), dtype=float)
+        resolved[slot] = {"key": keys[slot], "font_size": entry["font_size"], "size": tuple(size.tolist()),
+                          "center": None if center is None else tuple(center.tolist()),
+                          "write_time": write_time(metrics[texts[slot]][2])}
+        return resolved[slot]
+
+    for slot in slots: resolve(slot)
+    return resolved
+
+
+@lru_cache(maxsize=None)
+def _class_analysis(source, class_name, mtime):
+    methods = class_methods(source, class_name)
+    union = lambda name, index: set().union(*(methods[m][index] for m in reachable_methods(methods, name)))
+    stages = class_stages(source, class_name)
+    writes = {stage: union(stage, 1) for stage in stages}
+    loads = {stage: union(stage, 4) for stage in stages}
+    preset = union("setup", 1) | union("setup_scene_parameters", 1) | set(DEFAULT_PARAMETERS)
+    return stages, writes, loads, preset
+
+
+def scene_stages(source=SCENE_SOURCE, class_name="CoulombPendulum"):
+    return _class_analysis(str(source), class_name, Path(source).stat().st_mtime_ns)[0]
+
+
+def stage_order_problems(stages, source=SCENE_SOURCE, class_name="CoulombPendulum"):
+    """Stages that read ``self`` attributes no earlier stage of ``stages`` has set (static, from the source)."""
+    source = str(source)
+    class_stage_names, writes, loads, preset = _class_analysis(source, class_name, Path(source).stat().st_mtime_ns)
+    writers = {}
+    for stage in class_stage_names:
+        for attribute in writes[stage]: writers.setdefault(attribute, []).append(stage)
+    problems, available = [], set()
+    for stage in stages:
+        if stage not in class_stage_names:
+            problems.append(f"{stage} is not a stage of {class_name}")
+            continue
+        for attribute in sorted((loads[stage] - writes[stage] - preset - available) & set(writers)):
+            problems.append(f"{stage} reads self.{attribute}, set by {' or '.join(writers[attribute])}, which does not run before it")
+        available |= writes[stage]
+    return problems
+
+
+def compile_timeline(timeline):
+    """Scene parameter overrides of a timeline dict (not yet resolved)."""
+    unknown = set(timeline) - set(SECTIONS) - {"parameters", "schedules"}
+    if unknown: raise KeyError(f"Unknown timeline sections: {sorted(unknown)}")
+    overrides = dict(timeline.get("parameters", {}))
+    for section, parameter in SECTIONS.items():
+        if section in timeline: overrides[parameter] = timeline[section]
+    schedules = timeline.get("schedules", {})
+    unknown = set(schedules) - set(SCHEDULES)
+    if unknown: raise KeyError(f"Unknown schedules: {sorted(unknown)}")
+    for name, steps in schedules.items(): overrides[SCHEDULES[name]] = steps
+    return overrides
+
+
+def load_timeline(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def skipped_beats(params, geometry):
+    # Beats of moves that only run when q2 or the bob is away from where the stage wants it
+    q2_x = geometry["q2"][0]
+    moved = [step[1] for step in geometry["distance_steps"] if step[0] == "move"]
+    returns = {"return_q2", "return_bob"}
+    distance = set() if moved and abs(moved[-1] - q2_x) > 0.01 else set(returns)
+    if not params["measurements"]: distance.add("fitted_curve")
+    if not (params["field_layer"] or params["field_lines"]): distance.add("field_layer")
+    return {"demonstrate_distance_effect": distance, "demonstrate_charge_product_effect": returns,
+            "explain_coulomb_law": {"restore_bob", "restore_q2"}} # the demos' cleanup already put both back
+
+
+def stage_plays(params, layout):
+    """``{stage: [(beat, seconds), ...]}``: every play and wait of each stage, in the order the scene runs them.
+
+    A demo's tracker steps are listed under the name of its schedule parameter.
+    """
+    geometry = demo_geometry(params)
+    schedules = {"distance_steps": geometry["distance_steps"], "charge_product_steps": params["charge_product_steps"]}
+    skipped = skipped_beats(params, geometry)
+    plays = {}
+    for stage in params["stages"] or scene_stages():
+        plays[stage] = []
+        for name, value in params["beats"][stage].items():
+            if name not in skipped.get(stage, ()):
+                plays[stage].append((name, layout[name]["write_time"] if value is None else value))
+            if name == SCHEDULE_AFTER.get(stage):
+                schedule = DEMO_SCHEDULES[stage]
+                plays[stage] += [(schedule, step[2] if step[0] == "move" else step[1]) for step in schedules[schedule]]
+    return plays
+
+
+def stage_durations(params, layout):
+    """``{stage: seconds}`` of resolved parameters and their narration layout."""
+    return {stage: sum(seconds for _, seconds in plays) for stage, plays in stage_plays(params, layout).items()}
+
+
+def frame_problems(layout, locale, metrics, frame=FRAME):
+    """Placed narration slots whose text, in ``locale``, reaches past the frame."""
+    problems = []
+    half = np.array(frame) / 2
+    for slot, entry in layout.items():
+        if entry["center"] is None: continue
+        size = np.array(slot_size(metrics, narration_text(entry["key"], locale), entry["font_size"]))
+        overflow = np.max(np.abs(entry["center"]) + size / 2 - half)
+        if overflow > 1e-6: problems.append(f"{slot} ({entry['key']}, {locale}) reaches {overflow:.2f} past the frame")
+    return problems
+
+
+def check_timeline(timeline, metrics=None, frame=FRAME):
+    """``{"overrides", "durations", "duration", "problems"}``; only the metrics cache is read, nothing is rendered."""
+    report = {"overrides": None, "durations": {}, "duration": 0.0, "problems": []}
+    try:
+        overrides = compile_timeline(timeline)
+        params = resolve_parameters(overrides)
+        if metrics is None:
+            metrics = narration_metrics({narration_text(key, locale) for locale in LOCALES for key in STRINGS[locale]},
+                                        measure=False)
+        layout = narration_layout(params["layout"], params["narration_keys"], params["pivot_point"], frame, metrics)
+    except (KeyError, ValueError, TypeError, IndexError) as error:
+        report["problems"].append(f"{type(error).__name__}: {error}")
+        return report
+    report["overrides"] = overrides
+    if params["stages"] is not None: report["problems"] += stage_order_problems(params["stages"])
+    report["problems"] += frame_problems(layout, params["locale"], metrics, frame)
+    report["durations"] = stage_durations(params, layout)
+    report["duration"] = sum(report["durations"].values())
+    return report
+
+
+def render_timeline(timeline, quality="low_quality", media_dir="media", output_file=None):
+    from parallel_render import render_scene
+
+    return render_scene({"parameter_overrides": compile_timeline(timeline)},
+                        {"quality": quality, "media_dir": media_dir, "output_file": output_file or "CoulombPendulum"})
+
+
+def main(argv=None):
+    from parallel_render import QUALITIES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("timelines", nargs="*", help="timeline JSON files")
+    parser.add_argument("--measure", action="store_true", help="measure every narration text into the metrics cache (needs manim)")
+    parser.add_argument("--render", action="store_true", help="render each valid timeline")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--stages", action="store_true", help="print the duration of every stage")
+    args = parser.parse_args(argv)
+
+    all_texts = {narration_text(key, locale) for locale in LOCALES for key in STRINGS[locale]}
+    if args.measure:
+        print(f"{len(narration_metrics(all_texts))} narration texts measured in {shared_metrics_path()}")
+    try:
+        metrics = narration_metrics(all_texts, measure=False) if args.timelines else None
+    except KeyError as error:
+        parser.error(error.args[0])
+
+    started, failed = time.perf_counter(), 0
+    for path in args.timelines:
+        report = check_timeline(load_timeline(path), metrics)
+        status = "invalid" if report["problems"] else f"{report['duration']:.1f} s"
+        print(f"{path}: {status}")
+        for problem in report["problems"]: print(f"  {problem}")
+        if args.stages:
+            for stage, seconds in report["durations"].items(): print(f"  {stage:<45} {seconds:6.1f} s")
+        failed += bool(report["problems"])
+        if args.render and not report["problems"]:
+            scene = render_timeline(load_timeline(path), QUALITIES[args.quality], args.media_dir, f"CoulombPendulum_{Path(path).stem}")
+            print(f"  rendered {scene.renderer.file_writer.movie_file_path}")
+    if args.timelines:
+        print(f"{len(args.timelines)} timelines, {failed} invalid, checked in {(time.perf_counter() - started) * 1e3:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
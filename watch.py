@@ -0,0 +1,141 @@
+"""Re-render CoulombPendulum at preview quality whenever its source or a parameter file changes.
+
+The parameter file is a JSON object of scene parameter overrides:
+
+    {"force_scale": 1.4, "charge_product_steps": [["move", 2.5, 3], ["wait", 1], ["move", 0.2, 3.5]]}
+
+On every change the edited parameters and methods are mapped to the stages
+that depend on them (stage_dependencies.py) and the scene is rendered with the
+stage cache on: those stages, and any later stage whose starting state moved,
+are rendered again while every other stage is fast-forwarded and its cached
+segment spliced in. Besides coulomb.py, every project module it imports
+(pendulum_physics.py, fast_readout.py, ...) is watched; an edit to one of them
+reloads it and the modules after it and re-renders every stage. The watcher
+stays in one process, so manim, the parsed Tex SVGs and the curve cache are
+reused between iterations; the shared Tex cache is only refilled when the
+source changes.
+
+    python watch.py --params tuning.json
+"""
+import argparse
+import importlib
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import parallel_render
+import scene_parameters
+import stage_dependencies
+from parallel_render import QUALITIES
+
+SCENE_SOURCE = Path(__file__).with_name("coulomb.py")
+
+
+def load_parameters(path):
+    if path is None or not Path(path).exists(): return {}
+    overrides = json.loads(Path(path).read_text(encoding="utf-8"))
+    scene_parameters.resolve_parameters(overrides) # validate before rendering
+    return overrides
+
+
+def affected_stages(previous, current):
+    """Stages whose parameters, methods or modules differ between two ``(parameters, dependencies, digest)`` snapshots."""
+    (old_params, old_deps, old_digest), (new_params, new_deps, new_digest) = previous, current
+    resolve_parameters = scene_parameters.resolve_parameters
+    resolved_old, resolved_new = resolve_parameters(old_params), resolve_parameters(new_params)
+    # Through JSON, so a list read from the file equals the default tuple it overrides
+    edited = {name for name in resolved_new if json.dumps(resolved_old[name]) != json.dumps(resolved_new[name])}
+    affected = {}
+    for stage, entry in new_deps.items():
+        reasons = sorted(edited & set(entry["parameters"]))
+        # A stage plays only its own beats, so other stages' timing edits leave it alone
+        if "beats" in reasons and json.dumps(resolved_old["beats"][stage]) == json.dumps(resolved_new["beats"][stage]):
+            reasons.remove("beats")
+        if stage not in old_deps or old_deps[stage]["source"] != entry["source"]: reasons.append("source")
+        if old_digest != new_digest: reasons.append("modules")
+        if reasons: affected[stage] = reasons
+    return edited, affected
+
+
+class Watcher:
+    def __init__(self, params_path=None, quality="low_quality", media_dir="media", interval=0.5):
+        self.params_path = Path(params_path) if params_path else None
+        self.quality, self.media_dir, self.interval = quality, media_dir, interval
+        self.mtimes = {}
+        self.snapshot = None
+
+    @property
+    def paths(self):
+        # Re-read every time, so a module the scene starts importing is watched from then on
+        modules = stage_dependencies.project_modules(SCENE_SOURCE)
+        return [SCENE_SOURCE] + modules + ([self.params_path] if self.params_path else [])
+
+    def reload_modules(self, changed):
+        # Dependencies first, so every module reloaded after an edited one binds its new names
+        modules = stage_dependencies.project_modules(SCENE_SOURCE) + [SCENE_SOURCE]
+        edited = [index for index, path in enumerate(modules) if path in changed]
+        if not edited: return
+        for path in modules[min(edited):]:
+            if path.stem in sys.modules: importlib.reload(sys.modules[path.stem])
+
+    def changed_paths(self):
+        changed = []
+        for path in self.paths:
+            mtime = path.stat().st_mtime_ns if path.exists() else None
+            if self.mtimes.get(path, "unseen") != mtime: changed.append(path)
+            self.mtimes[path] = mtime
+        return changed
+
+    def iterate(self, changed):
+        import coulomb
+        from tex_cache import precompile_scene_tex
+
+        source_changed = set(changed) - {self.params_path}
+        if self.snapshot is not None: self.reload_modules(source_changed)
+        if self.snapshot is None or source_changed:
+            precompile_scene_tex(coulomb.__file__)
+        snapshot = (load_parameters(self.params_path),
+                    stage_dependencies.stage_dependencies(SCENE_SOURCE, "CoulombPendulum", coulomb.CoulombPendulum.STAGES),
+                    stage_dependencies.project_digest(SCENE_SOURCE))
+        if self.snapshot is not None:
+            edited, affected = affected_stages(self.snapshot, snapshot)
+            print(f"Edited: {', '.join(sorted(edited)) or 'source only'}")
+            for stage, reasons in affected.items(): print(f"  {stage:<45} {', '.join(reasons)}")
+        self.snapshot = snapshot
+
+        started = time.perf_counter()
+        scene = parallel_render.render_scene(
+            {"parameter_overrides": snapshot[0], "precompile_tex": False},
+            {"quality": self.quality, "media_dir": self.media_dir, "output_file": "CoulombPendulum_watch"},
+        )
+        rendered = [entry["stage"] for entry in scene.stage_cache.summary() if not entry["cached"]]
+        print(f"Rendered {', '.join(rendered) or 'nothing (all stages cached)'} in {time.perf_counter() - started:.1f}s: "
+              f"{scene.renderer.file_writer.movie_file_path}")
+
+    def run(self):
+        print(f"Watching {', '.join(map(str, self.paths))} (Ctrl+C to stop)")
+        while True:
+            changed = self.changed_paths()
+            if changed:
+                try: self.iterate(changed)
+                except Exception: traceback.print_exc() # keep watching; the next save retries
+            time.sleep(self.interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--params", default=None, help="JSON file of scene parameter overrides")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between checks")
+    args = parser.parse_args(argv)
+
+    watcher = Watcher(args.params, QUALITIES[args.quality], args.media_dir, args.interval)
+    try: watcher.run()
+    except KeyboardInterrupt: return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())